@@ -57,6 +57,7 @@ import requests
 from datetime import datetime
 from typing import Tuple, List, Optional
 from config import COOKIE
+from Scrapers.care_com.USA.blob_store import BlobStore
 # Append parent directory to sys.path so that modules in utils can be imported
 sys.path.append('..')
 from Scrapers.care_com.USA.childcare_helpers_attribute_combo import (
@@ -335,7 +336,8 @@ query SearchProvidersChildCare($input: SearchProvidersChildCareInput!) {
         sub_type: str = "babysitting",
         search_page_size: int = 10,
         min_pay_range: int = 10,
-        max_pay_range: int = 50
+        max_pay_range: int = 50,
+        blob_store_root: Optional[str] = None
     ):
         """
         :param country_name: e.g., "USA"
@@ -345,6 +347,8 @@ query SearchProvidersChildCare($input: SearchProvidersChildCareInput!) {
         :param search_page_size: number of caregivers per page
         :param min_pay_range: global min boundary for pay range
         :param max_pay_range: global max boundary for pay range
+        :param blob_store_root: if set (e.g. "raw_data/_blobs"), pages go to the content-addressed
+                                BlobStore instead of page_<n>.json files (unchanged pages cost no new bytes)
         """
         self.country_name = country_name
         self.postal_code = postal_code
@@ -358,6 +362,7 @@ query SearchProvidersChildCare($input: SearchProvidersChildCareInput!) {
         self.session.headers.update(self.HEADERS)
         # Unique run ID for the entire scrape
         self.run_id = str(uuid.uuid4())
+        self.blob_store = BlobStore(blob_store_root, run_id=self.run_id) if blob_store_root else None
 
         # Directory structure:
         #   raw_data/<country_name>/<postal_code>/search_of_<care_type>/<sub_type>/
@@ -621,8 +626,11 @@ query SearchProvidersChildCare($input: SearchProvidersChildCareInput!) {
 
                 # Save page data
                 page_file = os.path.join(range_dir, f"page_{page_count}.json")
-                with open(page_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                if self.blob_store:
+                    self.blob_store.put(os.path.relpath(page_file, "raw_data"), data)
+                else:
+                    with open(page_file, "w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False, indent=2)
 
                 self.logger.info(
                     f"  - Page {page_count} => {num_edges} caregivers, saved to {page_file}"
@@ -777,6 +785,8 @@ query SearchProvidersChildCare($input: SearchProvidersChildCareInput!) {
                 scrape_status="success"
             )
             self.logger.info("All pay range segments processed. Scraping complete!")
+            if self.blob_store:
+                self.logger.info(f"Blob store: {self.blob_store.summary()}")
 
         except Exception as e:
             self.logger.error(f"Unexpected error in run(): {e}")
@@ -57,6 +57,7 @@ import requests
 from datetime import datetime
 from typing import Tuple, List, Optional
 from config import COOKIE
+from Scrapers.care_com.USA.blob_store import BlobStore
 
 # If you store the cookie in config.py, import it:
 # from config import COOKIE
@@ -311,7 +312,8 @@ query SearchProvidersHousekeeping($input: SearchProvidersHousekeepingInput!) {
         sub_type: str = "recurring",
         search_page_size: int = 10,
         min_pay_range: int = 0,
-        max_pay_range: int = 100
+        max_pay_range: int = 100,
+        blob_store_root: Optional[str] = None
     ):
         """
         :param country_name: e.g., "USA"
@@ -321,6 +323,8 @@ query SearchProvidersHousekeeping($input: SearchProvidersHousekeepingInput!) {
         :param search_page_size: number of caregivers per page
         :param min_pay_range: global min boundary for pay range
         :param max_pay_range: global max boundary for pay range
+        :param blob_store_root: if set (e.g. "raw_data/_blobs"), pages go to the content-addressed
+                                BlobStore instead of page_<n>.json files (unchanged pages cost no new bytes)
         """
         self.country_name = country_name
         self.postal_code = postal_code
@@ -332,6 +336,7 @@ query SearchProvidersHousekeeping($input: SearchProvidersHousekeepingInput!) {
 
         # Unique run ID for the entire scrape
         self.run_id = str(uuid.uuid4())
+        self.blob_store = BlobStore(blob_store_root, run_id=self.run_id) if blob_store_root else None
 
         # Directory structure:
         #   raw_data/<country_name>/<postal_code>/search_of_<care_type>/<sub_type>/
@@ -593,8 +598,11 @@ query SearchProvidersHousekeeping($input: SearchProvidersHousekeepingInput!) {
 
                 # Save page data
                 page_file = os.path.join(range_dir, f"page_{page_count}.json")
-                with open(page_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                if self.blob_store:
+                    self.blob_store.put(os.path.relpath(page_file, "raw_data"), data)
+                else:
+                    with open(page_file, "w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False, indent=2)
 
                 self.logger.info(
                     f"  - Page {page_count} => {num_edges} caregivers, saved to {page_file}"
@@ -718,6 +726,8 @@ query SearchProvidersHousekeeping($input: SearchProvidersHousekeepingInput!) {
                 scrape_status="success"
             )
             self.logger.info("All pay range segments processed. Scraping complete!")
+            if self.blob_store:
+                self.logger.info(f"Blob store: {self.blob_store.summary()}")
 
         except Exception as e:
             self.logger.error(f"Unexpected error in run(): {e}")
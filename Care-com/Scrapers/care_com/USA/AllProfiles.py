@@ -20,6 +20,11 @@ DATAOPS FEATURES:
   - Logging to console for traceability
   - Random sleeps to avoid rate-limiting
   - Metadata creation for each profile or sub-directory if desired
+  - Optional content-addressed storage (blob_store_root): profiles are stored once per distinct
+    content under 'raw_data/_blobs' and referenced from a per-run manifest (see blob_store.py);
+    the metadata goes into the manifest line instead of metadata_<profileID>.json.
+  - Optional sharded lake (lake_root): profiles are appended to gzip JSONL shards under
+    '<lake_root>/care_com/<zip>/profiles/run=<run_id>/' with an ID index (see common/raw_lake.py).
 
 DISCLAIMER:
   - For educational purposes; always respect Care.com’s Terms of Service.
@@ -27,6 +32,7 @@ DISCLAIMER:
 """
 
 import os
+import sys
 import json
 import time
 import random
@@ -37,6 +43,10 @@ from typing import List, Dict, Any, Optional
 
 # Replace or import your session cookie from config.py if needed
 from config import COOKIE
+from Scrapers.care_com.USA.blob_store import BlobStore
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")))
+from common.raw_lake import LakeWriter
 
 # ------------------------------------------
 # 1) HEADERS & GRAPHQL QUERIES
@@ -662,15 +672,27 @@ query GetCaregiver($getCaregiverId: ID!, $serviceId: ServiceType, $shouldInclude
 # 2) HELPER FUNCTIONS
 # ------------------------------------------
 
-def load_search_results(root_dir: str) -> List[Dict[str, Any]]:
+def load_search_results(root_dir: str, blob_store: Optional[BlobStore] = None) -> List[Dict[str, Any]]:
     """
     Recursively load all "search page" results from your existing directory structure,
     parse JSON files, and return them as a list of Python dicts.
 
     :param root_dir: The top-level directory where your initial search results are stored.
+    :param blob_store: Optional BlobStore; the latest search pages it references under root_dir
+                       are loaded too.
     :return: A list of parsed JSON objects from the search results.
     """
     results = []
+    if blob_store is not None:
+        # Keys are paths relative to raw_data, so only the blobs under root_dir are loaded
+        prefix = os.path.relpath(root_dir, "raw_data")
+        prefix = "" if prefix == os.curdir else prefix + os.sep
+        for key, entry in blob_store.iter_latest(prefix):
+            if os.path.basename(key).startswith("page"):
+                try:
+                    results.append(blob_store.get(entry["sha256"]))
+                except Exception as e:
+                    print(f"[WARNING] Could not load blob {entry['sha256']} for {key}: {e}")
     for dirpath, _, filenames in os.walk(root_dir):
         for filename in filenames:
             if filename.endswith(".json") and filename.startswith("page"): 
@@ -757,12 +779,18 @@ class CaregiverProfileScraper:
         postal_code: str,
         search_root: str = "raw_data",
         default_care_type: str = "childcare",
-        default_sub_type: str = "babysitting"
+        default_sub_type: str = "babysitting",
+        blob_store_root: Optional[str] = None,
+        lake_root: Optional[str] = None
     ):
         """
         :param search_root: Path to your previously scraped search results.
         :param default_care_type: Fallback type if you don't parse from the search data.
         :param default_sub_type: Fallback sub-type if not specified or unknown.
+        :param blob_store_root: If set (e.g. "raw_data/_blobs"), profiles are written to the
+                                content-addressed blob store instead of one JSON file each.
+        :param lake_root: If set (e.g. "raw_data/_lake"), profiles are appended to compressed
+                          shards of the raw-data lake instead (takes precedence over blob_store_root).
         """
         self.postal_code = postal_code
         self.search_root = search_root
@@ -773,6 +801,8 @@ class CaregiverProfileScraper:
 
         # Each run gets a unique ID for logging / metadata
         self.run_id = str(uuid.uuid4())
+        self.blob_store = BlobStore(blob_store_root, run_id=self.run_id) if blob_store_root else None
+        self.lake_root = lake_root
 
     def fetch_caregiver_profile(
         self,
@@ -828,7 +858,7 @@ class CaregiverProfileScraper:
         print(f"[INFO] Starting caretaker profile scraping run_id={self.run_id}")
 
         # Step 1: Load all search results
-        search_files_data = load_search_results(self.search_root)
+        search_files_data = load_search_results(self.search_root, self.blob_store)
         print(f"[INFO] Found {len(search_files_data)} search JSON files under '{self.search_root}'.")
 
         # Step 2: Extract caretaker IDs from each file
@@ -845,6 +875,12 @@ class CaregiverProfileScraper:
         print(f"[INFO] Extracted {len(all_caregiver_ids)} unique caregiver IDs after removing deduplication.")
 
 
+        lake = (
+            LakeWriter(self.lake_root, "care_com", self.postal_code, "profiles", run_id=self.run_id)
+            if self.lake_root
+            else None
+        )
+
         # Step 3: For each caretaker ID, fetch full profile
         for caretaker_id in all_caregiver_ids:
             # You might parse the care_type/sub_type from the search data or from the caretaker node.
@@ -872,7 +908,30 @@ class CaregiverProfileScraper:
             # Step 3.2: Build the final path
             file_path = build_profile_path(self.postal_code, caretaker_id, care_type, sub_type)
 
-            # Step 3.3: Save the JSON
+            meta = {
+                "run_id": self.run_id,
+                "caretaker_id": caretaker_id,
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "scrape_status": "success",
+                "notes": "Full caretaker profile retrieval",
+            }
+
+            # Step 3.3: Save the JSON (lake: appended to a shard; blob store: once per distinct content)
+            if lake:
+                try:
+                    lake.write(caretaker_id, profile_data, meta=meta)
+                except Exception as e:
+                    print(f"[ERROR] Could not append profile {caretaker_id} to the lake: {e}")
+                continue
+
+            if self.blob_store:
+                try:
+                    sha = self.blob_store.put(os.path.relpath(file_path, "raw_data"), profile_data, meta=meta)
+                    print(f"[INFO] Stored caregiver '{caretaker_id}' as blob {sha[:12]}")
+                except Exception as e:
+                    print(f"[ERROR] Could not store profile {caretaker_id} in blob store: {e}")
+                continue
+
             try:
                 with open(file_path, "w", encoding="utf-8") as f:
                     json.dump(profile_data, f, ensure_ascii=False, indent=2)
@@ -881,16 +940,14 @@ class CaregiverProfileScraper:
                 print(f"[ERROR] Could not save profile {caretaker_id} to {file_path}: {e}")
 
             # Step 3.4: Optional - Save minimal metadata
-            meta = {
-                "run_id": self.run_id,
-                "caretaker_id": caretaker_id,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "scrape_status": "success",
-                "notes": "Full caretaker profile retrieval",
-            }
             save_metadata(file_path, meta)
 
+        if lake:
+            lake.close()
+            print(f"[INFO] Lake: {lake.summary()}")
         print("[INFO] Finished scraping all caregiver profiles.")
+        if self.blob_store:
+            print(f"[INFO] Blob store: {self.blob_store.summary()}")
 
 # ------------------------------------------
 # 4) EXAMPLE USAGE
@@ -1,19 +1,47 @@
 """
 ReviewScraper with Pagination:
 Fetch caregiver reviews for multiple care types, handling multiple pages
-via nextPageToken. Stores each page in a separate file:
+via nextPageToken. All pages of all care types are merged, deduplicated by review id,
+and stored as ONE compact document per caregiver:
+
+  raw_data/USA/<postal_code>/reviews/caregivers/<caretakerID>.json
 
-  raw_data/USA/<postal_code>/reviews/<careType>/<caretakerID>_<careType>_<pageNumber>.json
-  
 PROCESS:
-  1) Scan 'raw_data/USA/<postal_code>/all_profiles/' to collect caretaker IDs.
-  2) For each caretaker ID, do 3 requests:
+  1) Scan 'raw_data/USA/<postal_code>/all_profiles/' (and the blob store or raw-data lake, if the
+     profiles were written there) to collect caretaker IDs.
+  2) For each caretaker ID, fetch the first page of 3 care types in ONE aliased request:
        - careType = "CHILD_CARE"
        - careType = "SENIOR_CARE"
        - careType = "HOUSEKEEPING"
-  3) Save JSON to 'raw_data/USA/<postal_code>/reviews/<careType>/<caretakerID>_<careType>_<pageNumber>.json'
+     then keep paginating (one request per page) only the care types that returned a nextPageToken.
+  3) Merge every page into 'raw_data/USA/<postal_code>/reviews/caregivers/<caretakerID>.json'.
   4) Create a single log file in 'raw_data/USA/<postal_code>/reviews/scrape_reviews.log'.
-  5) A metadata file is also created for each page, named: 'metadata_<caretakerID>_<careType>_<pageNumber>.json'
+  5) Page provenance (care type, page number, run_id, fetch time) is kept per review inside the
+     document, and the fetch status per care type replaces the old per-page metadata files.
+  6) A watermark per (caretakerID, careType) is kept in
+     'raw_data/USA/<postal_code>/reviews/review_watermarks.json'. On a refresh run, pagination stops
+     as soon as an already-stored review is reached and only the new reviews are merged into
+     that caretaker's existing document.
+
+DOCUMENT FORMAT ("caregiver_reviews", version 1):
+  {
+    "format": "caregiver_reviews", "version": 1,
+    "caregiver_id": "...", "postal_code": "...", "updated_at": "...Z",
+    "reviews": [<review objects as returned by reviewsByReviewee, newest first>],
+    "provenance": {"<review_id>": [{"care_type", "page", "run_id", "fetched_at"}, ...]},
+    "fetch_status": {"<careType>": {"run_id", "status", "error_message", "pages", "timestamp"}}
+  }
+
+INCREMENTAL SYNC:
+  - reviewsByReviewee returns the newest reviews first, so the first stored review we meet
+    (same id as the watermark, or an older createTime) means everything after it is already on disk.
+  - Caregivers without a watermark (first run) are fetched in full, exactly like before.
+  - Pass incremental=False to force a full refetch and rebuild the watermarks.
+
+LEGACY LAYOUT:
+  - Older runs wrote 'reviews/<careType>/<caretakerID>_<careType>_<pageNumber>.json' plus a
+    'metadata_...' file per page. ReviewScraper.consolidate_legacy_pages() folds them into the
+    per-caregiver documents (and optionally deletes them).
 
 DISCLAIMER:
   - For demonstration. Always respect Care.com’s Terms of Service.
@@ -28,8 +56,13 @@ import random
 import logging
 import uuid
 import requests
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple
+
+from Scrapers.care_com.USA.blob_store import BlobStore
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")))
+from common.raw_lake import LakeIndex
 
 # ------------------------------------------------------------------------------
 # 1) HEADERS & GRAPHQL QUERY
@@ -69,15 +102,15 @@ HEADERS = {
 
 GRAPHQL_URL = "https://www.care.com/api/graphql"
 
-REVIEWS_QUERY = """
-query ReviewsByReviewee($revieweeId: ID!, $revieweeType: ReviewInfoEntityType!, $careType: ReviewInfoCareType, $pageSize: Int, $pageToken: String) {
-  reviewsByReviewee(
-    revieweeId: $revieweeId
-    revieweeType: $revieweeType
-    careType: $careType
-    pageSize: $pageSize
-    pageToken: $pageToken
-  ) {
+CAREGIVER_REVIEWS_DIRNAME = "caregivers"
+CAREGIVER_REVIEWS_FORMAT = "caregiver_reviews"
+WATERMARK_FILENAME = "review_watermarks.json"
+WATERMARK_FLUSH_EVERY = 50  # caregivers between two watermark saves
+
+CARE_TYPES = ["CHILD_CARE", "SENIOR_CARE", "HOUSEKEEPING"]
+
+# Selection set shared by the single care-type query and the aliased multi care-type query
+REVIEWS_SELECTION = """
     ... on ReviewsByRevieweePayload {
       __typename
       nextPageToken
@@ -137,7 +170,17 @@ query ReviewsByReviewee($revieweeId: ID!, $revieweeType: ReviewInfoEntityType!,
       __typename
     }
     __typename
-  }
+"""
+
+REVIEWS_QUERY = """
+query ReviewsByReviewee($revieweeId: ID!, $revieweeType: ReviewInfoEntityType!, $careType: ReviewInfoCareType, $pageSize: Int, $pageToken: String) {
+  reviewsByReviewee(
+    revieweeId: $revieweeId
+    revieweeType: $revieweeType
+    careType: $careType
+    pageSize: $pageSize
+    pageToken: $pageToken
+  ) {""" + REVIEWS_SELECTION + """  }
 }
 """
 
@@ -175,43 +218,198 @@ def setup_logger(log_dir: str) -> logging.Logger:
 
     return logger
 
-def build_review_path(postal_code: str, care_type: str, caregiver_id: str, page_number: int) -> str:
+def review_alias(care_type: str) -> str:
+    """
+    GraphQL alias used for one care type in the multi care-type query, e.g. 'reviews_CHILD_CARE'.
+    """
+    return f"reviews_{care_type}"
+
+def build_multi_reviews_query(care_types: List[str]) -> str:
+    """
+    Build one GraphQL document that aliases reviewsByReviewee once per care type,
+    so the first page of every care type comes back in a single request.
+    Pagination (pageToken) is left to REVIEWS_QUERY.
     """
-    e.g. raw_data/USA/<postal_code>/reviews/<careType>/<caregiverID>_<careType>_<pageNumber>.json
+    fields = []
+    for care_type in care_types:
+        fields.append(
+            f"""
+  {review_alias(care_type)}: reviewsByReviewee(
+    revieweeId: $revieweeId
+    revieweeType: $revieweeType
+    careType: {care_type}
+    pageSize: $pageSize
+  ) {{""" + REVIEWS_SELECTION + "  }"
+        )
+    return (
+        "\nquery ReviewsByRevieweeAllCareTypes($revieweeId: ID!, $revieweeType: ReviewInfoEntityType!, $pageSize: Int) {"
+        + "".join(fields)
+        + "\n}\n"
+    )
+
+MULTI_REVIEWS_QUERY = build_multi_reviews_query(CARE_TYPES)
+
+def build_caregiver_reviews_path(postal_code: str, caregiver_id: str) -> str:
     """
-    base_dir = os.path.join("raw_data", "USA", postal_code, "reviews", care_type)
+    e.g. raw_data/USA/<postal_code>/reviews/caregivers/<caregiverID>.json
+    """
+    base_dir = os.path.join("raw_data", "USA", postal_code, "reviews", CAREGIVER_REVIEWS_DIRNAME)
     os.makedirs(base_dir, exist_ok=True)
-    filename = f"{caregiver_id}_{care_type}_{page_number}.json"
-    return os.path.join(base_dir, filename)
+    return os.path.join(base_dir, f"{caregiver_id}.json")
 
 def save_json(file_path: str, data: Dict[str, Any]) -> None:
     """
-    Save data as JSON to 'file_path'. Overwrites if file exists.
+    Save data as compact JSON to 'file_path' (atomically: temp file, then replace).
     """
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, file_path)
 
-def save_metadata(directory: str, caregiver_id: str, care_type: str, page_number: int, run_id: str, status: str, error: Optional[str] = None) -> None:
+def new_caregiver_document(caregiver_id: str, postal_code: str) -> Dict[str, Any]:
     """
-    Save a minimal metadata file named 'metadata_<caregiverID>_<careType>_<pageNumber>.json' in 'directory'.
+    Empty per-caregiver review document (see DOCUMENT FORMAT above).
     """
-    meta_name = f"metadata_{caregiver_id}_{care_type}_{page_number}.json"
-    meta_path = os.path.join(directory, meta_name)
-    meta = {
-        "run_id": run_id,
+    return {
+        "format": CAREGIVER_REVIEWS_FORMAT,
+        "version": 1,
         "caregiver_id": caregiver_id,
-        "care_type": care_type,
-        "page_number": page_number,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "scrape_status": status,
-        "error_message": error,
-        "notes": "Review scraping with pagination"
+        "postal_code": postal_code,
+        "updated_at": None,
+        "reviews": [],
+        "provenance": {},
+        "fetch_status": {}
     }
+
+def load_caregiver_document(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load an existing per-caregiver review document, or None if missing/unreadable.
+    """
+    if not os.path.isfile(file_path):
+        return None
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"[WARNING] Could not read review document {file_path}: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("format") != CAREGIVER_REVIEWS_FORMAT:
+        return None
+    return data
+
+def merge_reviews_into_document(
+    document: Dict[str, Any],
+    care_type: str,
+    pages: List[Tuple[int, List[Dict[str, Any]]]],
+    run_id: str
+) -> int:
+    """
+    Merge fetched pages into a caregiver document, deduplicating by review id.
+    The latest copy of a review wins (it may have been edited). Each review keeps one
+    provenance entry per care type it was seen under.
+    :return: Number of review ids that were not in the document before.
+    """
+    by_id = {r.get("id"): r for r in document["reviews"] if isinstance(r, dict) and r.get("id")}
+    provenance = document["provenance"]
+    fetched_at = datetime.utcnow().isoformat() + "Z"
+    added = 0
+    for page_number, reviews in pages:
+        for review in reviews:
+            if not isinstance(review, dict) or not review.get("id"):
+                continue
+            review_id = review["id"]
+            if review_id not in by_id:
+                added += 1
+            by_id[review_id] = review
+            entries = [e for e in provenance.get(review_id, []) if e.get("care_type") != care_type]
+            entries.append({"care_type": care_type, "page": page_number, "run_id": run_id, "fetched_at": fetched_at})
+            provenance[review_id] = entries
+
+    # Newest first, reviews without a parsable createTime last
+    document["reviews"] = sorted(
+        by_id.values(),
+        key=lambda r: parse_review_time(r.get("createTime")) or datetime.min.replace(tzinfo=timezone.utc),
+        reverse=True
+    )
+    return added
+
+def build_watermark_path(postal_code: str) -> str:
+    """
+    e.g. raw_data/USA/<postal_code>/reviews/review_watermarks.json
+    """
+    return os.path.join("raw_data", "USA", postal_code, "reviews", WATERMARK_FILENAME)
+
+def watermark_key(caregiver_id: str, care_type: str) -> str:
+    """
+    Key of one (caregiver, care type) entry in the watermark file.
+    """
+    return f"{caregiver_id}|{care_type}"
+
+def load_watermarks(file_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the watermark file, or return an empty dict if it does not exist or is unreadable.
+    """
+    if not os.path.isfile(file_path):
+        return {}
     try:
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
     except Exception as e:
-        print(f"[ERROR] Could not save metadata to {meta_path}: {e}")
+        print(f"[WARNING] Could not read watermarks {file_path}: {e}")
+        return {}
+
+def save_watermarks(file_path: str, watermarks: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Save the watermark file atomically (write to a temp file, then replace).
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(watermarks, f, ensure_ascii=False)
+    os.replace(tmp_path, file_path)
+
+def parse_review_time(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a review createTime such as '2024-03-01T10:15:00.000Z'. Returns None if missing or invalid.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+def newest_review(reviews: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Return the review with the latest createTime (the first one if none can be parsed).
+    """
+    reviews = [r for r in reviews if isinstance(r, dict)]
+    if not reviews:
+        return None
+    dated = [r for r in reviews if parse_review_time(r.get("createTime"))]
+    if not dated:
+        return reviews[0]
+    return max(dated, key=lambda r: parse_review_time(r.get("createTime")))
+
+def split_new_reviews(reviews: List[Dict[str, Any]], watermark: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Walk a page of reviews (newest first) and keep those newer than the watermark.
+    :return: (new_reviews, reached_watermark). reached_watermark=True means the rest is already stored.
+    """
+    newest_id = watermark.get("newest_review_id")
+    newest_time = parse_review_time(watermark.get("newest_create_time"))
+    fresh = []
+    for review in reviews:
+        if not isinstance(review, dict):
+            continue
+        if newest_id and review.get("id") == newest_id:
+            return fresh, True
+        created = parse_review_time(review.get("createTime"))
+        if newest_time and created and created < newest_time:
+            return fresh, True
+        fresh.append(review)
+    return fresh, False
 
 # ------------------------------------------------------------------------------
 # 3) REVIEW SCRAPER CLASS (WITH PAGINATION)
@@ -221,16 +419,32 @@ class ReviewScraper:
     1) Finds caregiver IDs in 'raw_data/USA/<postal_code>/all_profiles/'
     2) For each caregiver, queries 3 care types: "CHILD_CARE", "SENIOR_CARE", "HOUSEKEEPING"
        and fetches multiple pages if nextPageToken is set.
-    3) Stores each page as:
-         raw_data/USA/<postal_code>/reviews/<careType>/<caregiverID>_<careType>_<pageNumber>.json
+    3) Merges all pages into one document per caregiver:
+         raw_data/USA/<postal_code>/reviews/caregivers/<caregiverID>.json
     4) Logs in 'raw_data/USA/<postal_code>/reviews/scrape_reviews.log'
+    5) Keeps a watermark per (caregiver, careType) so refresh runs only fetch new reviews.
     """
 
-    def __init__(self, postal_code: str):
+    def __init__(
+        self,
+        postal_code: str,
+        incremental: bool = True,
+        blob_store_root: Optional[str] = None,
+        lake_root: Optional[str] = None
+    ):
         """
         :param postal_code: The ZIP/postal code to target (under 'raw_data/USA/<postal_code>/all_profiles/').
+        :param incremental: If True, stop paginating at the first already-stored review (per watermark).
+                            If False, refetch every page and rebuild the watermarks.
+        :param blob_store_root: The blob store AllProfiles wrote the profiles to, if any
+                                (e.g. "raw_data/_blobs"); its caregivers are scraped too.
+        :param lake_root: The raw-data lake AllProfiles appended the profiles to, if any
+                          (e.g. "raw_data/_lake"); its caregivers are scraped too.
         """
         self.postal_code = postal_code
+        self.incremental = incremental
+        self.blob_store_root = blob_store_root
+        self.lake_root = lake_root
         self.run_id = str(uuid.uuid4())
         self.session = requests.Session()
         self.session.headers.update(HEADERS)
@@ -239,9 +453,15 @@ class ReviewScraper:
         reviews_dir = os.path.join("raw_data", "USA", self.postal_code, "reviews")
         self.logger = setup_logger(reviews_dir)
 
+        # Watermarks: {"<caregiverID>|<careType>": {newest_review_id, newest_create_time, review_count, ...}}
+        self.watermark_path = build_watermark_path(self.postal_code)
+        self.watermarks = load_watermarks(self.watermark_path)
+        self.logger.info(f"Loaded {len(self.watermarks)} review watermarks from {self.watermark_path}")
+
     def load_caregiver_ids(self) -> List[str]:
         """
-        Scan 'raw_data/USA/<postal_code>/all_profiles/' for caregiver profile JSON files.
+        Scan 'raw_data/USA/<postal_code>/all_profiles/' for caregiver profile JSON files, plus
+        the profiles of this postal code referenced by the blob store manifests or in the lake.
         Return a list of caregiver IDs.
         """
         base_dir = os.path.join("raw_data", "USA", self.postal_code, "all_profiles")
@@ -252,8 +472,20 @@ class ReviewScraper:
                 if filename.endswith(".json") and not filename.startswith("metadata_"):
                     cid = filename.replace(".json", "")
                     caregiver_ids.append(cid)
-        
-        self.logger.info(f"Found {len(caregiver_ids)} caregiver JSON files before deduplication.")
+
+        if self.blob_store_root and os.path.isdir(self.blob_store_root):
+            # Keys are the paths AllProfiles would have written: USA/<zip>/all_profiles/<id>.json
+            blob_store = BlobStore(self.blob_store_root, run_id=self.run_id)
+            for key, _ in blob_store.iter_latest(f"USA/{self.postal_code}/all_profiles/"):
+                filename = key.rsplit("/", 1)[-1]
+                if filename.endswith(".json") and not filename.startswith("metadata_"):
+                    caregiver_ids.append(filename[: -len(".json")])
+
+        if self.lake_root:
+            # Only the ID indexes of the runs are read, not the records
+            caregiver_ids.extend(LakeIndex(self.lake_root, "care_com", self.postal_code, "profiles").ids())
+
+        self.logger.info(f"Found {len(caregiver_ids)} caregiver profiles before deduplication.")
         caregiver_ids = list(set(caregiver_ids))
         self.logger.info(f"Found {len(caregiver_ids)} unique caregiver IDs after deduplication.")
 
@@ -303,110 +535,275 @@ class ReviewScraper:
             self.logger.error(f"[ERROR] fetch_reviews_page caregiver={caregiver_id}, care_type={care_type}, pageToken={page_token}: {e}")
             return None
 
+    def fetch_first_pages(
+        self,
+        caregiver_id: str,
+        care_types: List[str] = CARE_TYPES,
+        page_size: int = 10
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch the first page of reviews for every care type in ONE request (aliased query).
+        Each aliased result is re-wrapped as {"data": {"reviewsByReviewee": ...}}, i.e. the same
+        shape fetch_reviews_page returns, so it can be saved and paginated like any other page.
+        :return: {care_type: page data or None}. None means "fetch it with REVIEWS_QUERY instead".
+        """
+        query = MULTI_REVIEWS_QUERY if care_types == CARE_TYPES else build_multi_reviews_query(care_types)
+        payload = {
+            "query": query,
+            "variables": {
+                "revieweeId": caregiver_id,
+                "revieweeType": "PROVIDER",
+                "pageSize": page_size
+            }
+        }
+        pages = {care_type: None for care_type in care_types}
+        try:
+            resp = self.session.post(GRAPHQL_URL, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+
+            # Sleep randomly to avoid detection or rate-limiting
+            time.sleep(round(random.uniform(0.3, 0.65), 4))
+        except Exception as e:
+            self.logger.error(f"[ERROR] fetch_first_pages caregiver={caregiver_id}: {e}")
+            return pages
+
+        if "errors" in data:
+            # Partial errors: keep the aliases that did resolve, the others fall back to REVIEWS_QUERY
+            self.logger.warning(f"GraphQL errors in multi care-type query for caregiver={caregiver_id}: {data['errors']}")
+        results = data.get("data") or {}
+        for care_type in care_types:
+            result = results.get(review_alias(care_type))
+            if isinstance(result, dict):
+                pages[care_type] = {"data": {"reviewsByReviewee": result}}
+        return pages
+
     def fetch_all_pages_of_reviews(
         self,
         caregiver_id: str,
         care_type: str,
-        page_size: int = 10
-    ):
+        page_size: int = 10,
+        first_page: Optional[Dict[str, Any]] = None,
+        watermark: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
-        Continuously fetch all pages of reviews for a caregiver & care_type,
-        storing each page separately until no nextPageToken remains.
+        Continuously fetch all pages of reviews for a caregiver & care_type
+        until no nextPageToken remains. Nothing is written here; the caller merges the
+        pages into the caregiver document.
+
+        :param first_page: Page 1 if it was already fetched (see fetch_first_pages).
+        :param watermark: If given, stop at the first already-stored review and keep only the new ones.
+        :return: {"pages": [(page_number, [reviews])], "status": "success"|"error"|"failure", "error_message": str|None}
         """
         page_number = 1
         next_page_token = None
+        pages = []
+        status, error = "success", None
 
         while True:
             self.logger.info(
-                f"Scraping caregiver={caregiver_id}, care_type={care_type}, page={page_number}, token={next_page_token or 'NONE'}"
+                f"Scraping caregiver={caregiver_id}, care_type={care_type}, page={page_number}, "
+                f"token={next_page_token or 'NONE'}, refresh={watermark is not None}"
             )
 
-            data = self.fetch_reviews_page(
-                caregiver_id=caregiver_id,
-                care_type=care_type,
-                page_size=page_size,
-                page_token=next_page_token
-            )
-
-            file_path = build_review_path(self.postal_code, care_type, caregiver_id, page_number)
+            if first_page is not None:
+                data, first_page = first_page, None
+            else:
+                data = self.fetch_reviews_page(
+                    caregiver_id=caregiver_id,
+                    care_type=care_type,
+                    page_size=page_size,
+                    page_token=next_page_token
+                )
 
             if not data:
                 self.logger.error(
                     f"Failed to get reviews for caregiver={caregiver_id}, care_type={care_type}, page={page_number}"
                 )
-                save_metadata(
-                    directory=os.path.dirname(file_path),
-                    caregiver_id=caregiver_id,
-                    care_type=care_type,
-                    page_number=page_number,
-                    run_id=self.run_id,
-                    status="error",
-                    error="fetch_reviews_page returned None"
-                )
+                status, error = "error", "fetch_reviews_page returned None"
                 break  # stop pagination if we get an error
 
-            # Save JSON
-            try:
-                save_json(file_path, data)
-                self.logger.info(
-                    f"Saved caregiver={caregiver_id} reviews for {care_type}, page={page_number} -> {file_path}"
-                )
-                save_metadata(
-                    directory=os.path.dirname(file_path),
-                    caregiver_id=caregiver_id,
-                    care_type=care_type,
-                    page_number=page_number,
-                    run_id=self.run_id,
-                    status="success"
-                )
-            except Exception as e:
-                self.logger.error(f"Error saving caregiver={caregiver_id}, page={page_number}, care_type={care_type}: {e}")
-                save_metadata(
-                    directory=os.path.dirname(file_path),
-                    caregiver_id=caregiver_id,
-                    care_type=care_type,
-                    page_number=page_number,
-                    run_id=self.run_id,
-                    status="error",
-                    error=str(e)
-                )
-                break  # stop pagination if we fail to save
-
-            # Check nextPageToken
             reviews_by_reviewee = data["data"]["reviewsByReviewee"]
-            if reviews_by_reviewee["__typename"] == "ReviewsByRevieweePayload":
-                next_page_token = reviews_by_reviewee["nextPageToken"]
-                if not next_page_token:
-                    # no more pages
+            if reviews_by_reviewee.get("__typename") != "ReviewsByRevieweePayload":
+                # ReviewFailureResponse: nothing to store for this care type
+                status, error = "failure", reviews_by_reviewee.get("message")
+                break
+
+            reviews = reviews_by_reviewee.get("reviews") or []
+            if watermark is not None:
+                fresh, reached = split_new_reviews(reviews, watermark)
+                pages.append((page_number, fresh))
+                if reached:
                     break
             else:
-                # failure or no next page
+                pages.append((page_number, reviews))
+
+            # Check nextPageToken
+            next_page_token = reviews_by_reviewee.get("nextPageToken")
+            if not next_page_token:
+                # no more pages
                 break
 
             page_number += 1
 
+        return {"pages": pages, "status": status, "error_message": error}
+
+    def update_watermark(
+        self,
+        caregiver_id: str,
+        care_type: str,
+        reviews: List[Dict[str, Any]],
+        previous_count: int = 0
+    ):
+        """
+        Record the newest stored review for (caregiver_id, care_type).
+        Keeps the previous newest review if 'reviews' is empty.
+        """
+        key = watermark_key(caregiver_id, care_type)
+        previous = self.watermarks.get(key, {})
+        newest = newest_review(reviews)
+        self.watermarks[key] = {
+            "newest_review_id": newest.get("id") if newest else previous.get("newest_review_id"),
+            "newest_create_time": newest.get("createTime") if newest else previous.get("newest_create_time"),
+            "review_count": previous_count + len([r for r in reviews if isinstance(r, dict)]),
+            "run_id": self.run_id,
+            "last_synced": datetime.utcnow().isoformat() + "Z"
+        }
+
     def scrape_reviews_for_caregiver(self, caregiver_id: str):
         """
         For one caregiver, request 3 care types: "CHILD_CARE", "SENIOR_CARE", "HOUSEKEEPING".
-        Fetch multiple pages if nextPageToken is set.
+        The first page of all 3 comes from a single aliased request; follow-up pages are
+        only fetched for the care types that returned a nextPageToken.
+        Everything is merged into the caregiver's single review document.
         """
-        CARE_TYPES = ["CHILD_CARE", "SENIOR_CARE", "HOUSEKEEPING"]
+        file_path = build_caregiver_reviews_path(self.postal_code, caregiver_id)
+        document = load_caregiver_document(file_path)
+        is_new_document = document is None
+        if is_new_document:
+            document = new_caregiver_document(caregiver_id, self.postal_code)
+
+        first_pages = self.fetch_first_pages(caregiver_id, CARE_TYPES)
 
+        total_added = 0
         for ctype in CARE_TYPES:
-            self.fetch_all_pages_of_reviews(caregiver_id, ctype)
+            key = watermark_key(caregiver_id, ctype)
+            # Only trust the watermark if the reviews it points to are actually on disk
+            watermark = self.watermarks.get(key) if self.incremental and not is_new_document else None
+            result = self.fetch_all_pages_of_reviews(
+                caregiver_id, ctype, first_page=first_pages.get(ctype), watermark=watermark
+            )
+            fetched = [r for _, page_reviews in result["pages"] for r in page_reviews]
+            total_added += merge_reviews_into_document(document, ctype, result["pages"], self.run_id)
+            document["fetch_status"][ctype] = {
+                "run_id": self.run_id,
+                "status": result["status"],
+                "error_message": result["error_message"],
+                "pages": len(result["pages"]),
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            }
+            # A failed page leaves older pages unfetched; keep the previous watermark so the next
+            # refresh reaches them again
+            if result["status"] == "success" and result["pages"]:
+                previous_count = int(watermark.get("review_count") or 0) if watermark else 0
+                self.update_watermark(caregiver_id, ctype, fetched, previous_count)
+
+        document["updated_at"] = datetime.utcnow().isoformat() + "Z"
+        try:
+            save_json(file_path, document)
+            self.logger.info(
+                f"Saved caregiver={caregiver_id}: {len(document['reviews'])} review(s), {total_added} new -> {file_path}"
+            )
+        except Exception as e:
+            self.logger.error(f"Error saving review document for caregiver={caregiver_id} -> {file_path}: {e}")
+
+    def consolidate_legacy_pages(self, delete_pages: bool = False) -> int:
+        """
+        Fold the legacy per-page layout
+          raw_data/USA/<postal_code>/reviews/<careType>/<caregiverID>_<careType>_<pageNumber>.json
+        into per-caregiver documents, and build watermarks from them.
+        :param delete_pages: If True, remove the page files and their metadata_ files once merged.
+        :return: Number of caregiver documents written.
+        """
+        reviews_dir = os.path.join("raw_data", "USA", self.postal_code, "reviews")
+        pages_by_caregiver: Dict[str, List[Tuple[str, int, str]]] = {}
+        for care_type in CARE_TYPES:
+            type_dir = os.path.join(reviews_dir, care_type)
+            if not os.path.isdir(type_dir):
+                continue
+            suffix = f"_{care_type}"
+            for filename in os.listdir(type_dir):
+                if not filename.endswith(".json") or filename.startswith("metadata_"):
+                    continue
+                stem, _, page = filename[:-len(".json")].rpartition("_")
+                if not stem.endswith(suffix) or not page.isdigit():
+                    continue
+                caregiver_id = stem[:-len(suffix)]
+                pages_by_caregiver.setdefault(caregiver_id, []).append(
+                    (care_type, int(page), os.path.join(type_dir, filename))
+                )
+
+        self.logger.info(f"Consolidating legacy review pages for {len(pages_by_caregiver)} caregivers.")
+        written = 0
+        for caregiver_id, page_files in pages_by_caregiver.items():
+            file_path = build_caregiver_reviews_path(self.postal_code, caregiver_id)
+            document = load_caregiver_document(file_path) or new_caregiver_document(caregiver_id, self.postal_code)
+            pages_by_type: Dict[str, List[Tuple[int, List[Dict[str, Any]]]]] = {}
+            for care_type, page_number, page_path in sorted(page_files):
+                try:
+                    with open(page_path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    payload = data["data"]["reviewsByReviewee"]
+                except Exception as e:
+                    self.logger.error(f"Could not read legacy review page {page_path}: {e}")
+                    continue
+                reviews = (payload.get("reviews") or []) if isinstance(payload, dict) else []
+                pages_by_type.setdefault(care_type, []).append((page_number, reviews))
+
+            for care_type, pages in pages_by_type.items():
+                merge_reviews_into_document(document, care_type, pages, self.run_id)
+                fetched = [r for _, page_reviews in pages for r in page_reviews]
+                self.update_watermark(caregiver_id, care_type, fetched)
+            document["updated_at"] = datetime.utcnow().isoformat() + "Z"
+            try:
+                save_json(file_path, document)
+                written += 1
+            except Exception as e:
+                self.logger.error(f"Error saving review document for caregiver={caregiver_id}: {e}")
+                continue
+
+            if delete_pages:
+                for _, _, page_path in page_files:
+                    meta_path = os.path.join(os.path.dirname(page_path), "metadata_" + os.path.basename(page_path))
+                    for path in (page_path, meta_path):
+                        if os.path.exists(path):
+                            os.remove(path)
+
+        save_watermarks(self.watermark_path, self.watermarks)
+        self.logger.info(f"Wrote {written} caregiver review documents from legacy pages.")
+        return written
 
     def run_scrape(self):
         """
         Main method:
           1) Load caregiver IDs from 'raw_data/USA/<postal_code>/all_profiles/'
           2) For each caregiver, scrape 3 care types with pagination
-          3) Save data + logs + metadata
+             (or only the new reviews, when a watermark exists)
+          3) Save data + logs + metadata + watermarks
         """
         caregiver_ids = self.load_caregiver_ids()
-        self.logger.info(f"Starting review scrape for {len(caregiver_ids)} caregivers. run_id={self.run_id}")
+        self.logger.info(
+            f"Starting review scrape for {len(caregiver_ids)} caregivers. run_id={self.run_id}, incremental={self.incremental}"
+        )
 
-        for cid in caregiver_ids:
-            self.scrape_reviews_for_caregiver(cid)
+        try:
+            for i, cid in enumerate(caregiver_ids, start=1):
+                self.scrape_reviews_for_caregiver(cid)
+                if i % WATERMARK_FLUSH_EVERY == 0:
+                    save_watermarks(self.watermark_path, self.watermarks)
+        finally:
+            save_watermarks(self.watermark_path, self.watermarks)
+            self.logger.info(f"Saved {len(self.watermarks)} review watermarks -> {self.watermark_path}")
 
         self.logger.info("Review scraping complete.")
 
@@ -57,6 +57,7 @@ import requests
 from datetime import datetime
 from typing import Tuple, List, Optional
 from config import COOKIE
+from Scrapers.care_com.USA.blob_store import BlobStore
 # Append parent directory to sys.path so that modules in utils can be imported
 sys.path.append('..')
 from Scrapers.care_com.USA.seniorcare_helpers_attribute_combo import (
@@ -318,7 +319,8 @@ query SearchProvidersSeniorCare($input: SearchProvidersSeniorCareInput!) {
         sub_type: str = "inhome",
         search_page_size: int = 10,
         min_pay_range: int = 0,
-        max_pay_range: int = 100
+        max_pay_range: int = 100,
+        blob_store_root: Optional[str] = None
     ):
         """
         :param country_name: e.g., "USA"
@@ -328,6 +330,8 @@ query SearchProvidersSeniorCare($input: SearchProvidersSeniorCareInput!) {
         :param search_page_size: number of caregivers per page
         :param min_pay_range: global min boundary for pay range
         :param max_pay_range: global max boundary for pay range
+        :param blob_store_root: if set (e.g. "raw_data/_blobs"), pages go to the content-addressed
+                                BlobStore instead of page_<n>.json files (unchanged pages cost no new bytes)
         """
         self.country_name = country_name
         self.postal_code = postal_code
@@ -341,6 +345,7 @@ query SearchProvidersSeniorCare($input: SearchProvidersSeniorCareInput!) {
         self.session.headers.update(self.HEADERS)
         # Unique run ID for the entire scrape
         self.run_id = str(uuid.uuid4())
+        self.blob_store = BlobStore(blob_store_root, run_id=self.run_id) if blob_store_root else None
 
         # Directory structure:
         #   raw_data/<country_name>/<postal_code>/search_of_<care_type>/<sub_type>/
@@ -602,8 +607,11 @@ query SearchProvidersSeniorCare($input: SearchProvidersSeniorCareInput!) {
 
                 # Save page data
                 page_file = os.path.join(range_dir, f"page_{page_count}.json")
-                with open(page_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                if self.blob_store:
+                    self.blob_store.put(os.path.relpath(page_file, "raw_data"), data)
+                else:
+                    with open(page_file, "w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False, indent=2)
 
                 self.logger.info(
                     f"  - Page {page_count} => {num_edges} caregivers, saved to {page_file}"
@@ -772,6 +780,8 @@ query SearchProvidersSeniorCare($input: SearchProvidersSeniorCareInput!) {
                 scrape_status="success"
             )
             self.logger.info("All pay range segments processed. Scraping complete!")
+            if self.blob_store:
+                self.logger.info(f"Blob store: {self.blob_store.summary()}")
 
         except Exception as e:
             self.logger.error(f"Unexpected error in run(): {e}")
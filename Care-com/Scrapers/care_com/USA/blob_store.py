@@ -0,0 +1,215 @@
+"""
+BlobStore: content-addressed store for raw API responses.
+
+PURPOSE:
+  Reruns of the scrapers mostly fetch responses that are byte-identical to the previous run
+  (unchanged profiles, unchanged search pages). Instead of rewriting one pretty-printed JSON file
+  per response, each response is:
+    1) canonicalized (sorted keys, compact separators, UTF-8),
+    2) hashed with SHA-256,
+    3) stored ONCE, gzip-compressed, under its hash,
+    4) referenced from a per-run manifest that maps the logical path it would have had
+       (e.g. 'USA/07008/all_profiles/<id>.json') to the hash.
+  A rerun therefore only adds the bytes that changed, plus one manifest line per response.
+
+DIRECTORY STRUCTURE:
+  raw_data/
+    _blobs/
+      objects/<sha[:2]>/<sha>.json.gz      one object per distinct canonical response
+      manifests/<run_id>.jsonl             one line per put(): key, sha256, sizes, is_new, meta
+
+DOWNSTREAM:
+  - BlobStore.iter_latest(prefix) yields the newest (key, entry) per logical key across all runs.
+  - ProcessedBlobLedger records the hashes an ETL already processed, so a consumer can skip
+    blobs it has seen (same hash == same content).
+"""
+
+import os
+import json
+import gzip
+import uuid
+import hashlib
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, Tuple, Iterable, Set
+
+BLOBS_DIRNAME = "_blobs"
+DEFAULT_BLOB_ROOT = os.path.join("raw_data", BLOBS_DIRNAME)
+
+
+def canonicalize(data: Any) -> bytes:
+    """
+    Canonical byte representation used for hashing and storage:
+    sorted keys, no whitespace, UTF-8. Two equal JSON values always give the same bytes.
+    """
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(data: Any) -> str:
+    """
+    SHA-256 hex digest of the canonical form of 'data'.
+    """
+    return hashlib.sha256(canonicalize(data)).hexdigest()
+
+
+class BlobStore:
+    """
+    Content-addressed, gzip-compressed store of JSON responses with per-run manifests.
+    """
+
+    def __init__(self, root: str = DEFAULT_BLOB_ROOT, run_id: Optional[str] = None):
+        """
+        :param root: Store directory (default 'raw_data/_blobs').
+        :param run_id: Run identifier used to name this run's manifest. A new UUID if omitted.
+        """
+        self.root = root
+        self.run_id = run_id or str(uuid.uuid4())
+        self.objects_dir = os.path.join(root, "objects")
+        self.manifests_dir = os.path.join(root, "manifests")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.manifests_dir, exist_ok=True)
+        self.manifest_path = os.path.join(self.manifests_dir, f"{self.run_id}.jsonl")
+
+        # Per-run counters, handy for the scrapers' final log line
+        self.puts = 0
+        self.new_blobs = 0
+        self.new_bytes = 0
+
+    def object_path(self, sha: str) -> str:
+        """
+        e.g. raw_data/_blobs/objects/ab/ab12...ef.json.gz
+        """
+        return os.path.join(self.objects_dir, sha[:2], f"{sha}.json.gz")
+
+    def has(self, sha: str) -> bool:
+        return os.path.exists(self.object_path(sha))
+
+    def put(self, key: str, data: Any, meta: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Store 'data' under its content hash (if not already stored) and record
+        key -> hash in this run's manifest.
+
+        :param key: Logical path of the response, relative to raw_data (e.g. 'USA/07008/all_profiles/<id>.json').
+        :param data: JSON-serializable response.
+        :param meta: Optional small metadata dict stored in the manifest line (replaces metadata_ files).
+        :return: The SHA-256 hash of the canonical content.
+        """
+        raw = canonicalize(data)
+        sha = hashlib.sha256(raw).hexdigest()
+        path = self.object_path(sha)
+        is_new = not os.path.exists(path)
+        stored_bytes = 0
+        if is_new:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with gzip.open(tmp_path, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+            stored_bytes = os.path.getsize(path)
+            self.new_blobs += 1
+            self.new_bytes += stored_bytes
+
+        entry = {
+            "key": key.replace(os.sep, "/"),
+            "sha256": sha,
+            "size": len(raw),
+            "stored_bytes": stored_bytes,
+            "is_new": is_new,
+            "run_id": self.run_id,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "meta": meta,
+        }
+        with open(self.manifest_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.puts += 1
+        return sha
+
+    def get(self, sha: str) -> Any:
+        """
+        Load and decode the object stored under 'sha'.
+        """
+        with gzip.open(self.object_path(sha), "rb") as f:
+            return json.loads(f.read().decode("utf-8"))
+
+    def iter_manifest(self, run_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the entries of one run's manifest, in write order.
+        """
+        path = os.path.join(self.manifests_dir, f"{run_id}.jsonl")
+        if not os.path.isfile(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def list_runs(self) -> list:
+        """
+        Run ids that have a manifest, oldest manifest first (by modification time).
+        """
+        manifests = [
+            name for name in os.listdir(self.manifests_dir) if name.endswith(".jsonl")
+        ]
+        manifests.sort(key=lambda name: os.path.getmtime(os.path.join(self.manifests_dir, name)))
+        return [name[: -len(".jsonl")] for name in manifests]
+
+    def iter_latest(self, prefix: str = "") -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (key, entry) for the most recent entry of every logical key starting with 'prefix',
+        across all run manifests. This is the store's equivalent of walking the raw_data tree.
+        """
+        prefix = prefix.replace(os.sep, "/")
+        latest: Dict[str, Dict[str, Any]] = {}
+        for run_id in self.list_runs():
+            for entry in self.iter_manifest(run_id):
+                if entry.get("key", "").startswith(prefix):
+                    latest[entry["key"]] = entry
+        for key in sorted(latest):
+            yield key, latest[key]
+
+    def summary(self) -> str:
+        return (
+            f"{self.puts} response(s) referenced, {self.new_blobs} new blob(s), "
+            f"{self.new_bytes} new compressed byte(s) -> {self.manifest_path}"
+        )
+
+
+class ProcessedBlobLedger:
+    """
+    Append-only list of blob hashes an ETL step has already processed
+    (one hash per line). Lets downstream jobs skip unchanged content.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._seen: Set[str] = set()
+        self._pending: Set[str] = set()
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._seen = {line.strip() for line in f if line.strip()}
+
+    def __contains__(self, sha: str) -> bool:
+        return sha in self._seen or sha in self._pending
+
+    def __len__(self) -> int:
+        return len(self._seen) + len(self._pending)
+
+    def mark(self, hashes: Iterable[str]) -> None:
+        """
+        Mark hashes as processed (written on flush()).
+        """
+        for sha in hashes:
+            if sha not in self._seen:
+                self._pending.add(sha)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for sha in sorted(self._pending):
+                f.write(sha + "\n")
+        self._seen |= self._pending
+        self._pending = set()
@@ -0,0 +1,231 @@
+"""
+File: benchmark_etl.py
+
+Description:
+-------------
+Stage benchmarks for the Care-com data quality ETL (data_quality_check.py), run on a synthetic
+corpus (synthetic_corpus.py) so they can be shared and repeated:
+  1. load      - json.load of every profile and review file (load_json_files)
+  2. flatten   - flattening into the main, nested and review DataFrames, deduplication included
+  3. validate  - pandera validation of every frame (validate_whole / validate_in_chunks)
+  4. write     - processed CSVs and Parquet datasets
+
+Each stage is timed on its own, 'repeats' times (the fastest run is kept). Every run appends one
+JSON line to BENCHMARK_RESULTS_FILE with the git commit, corpus size, stage timings and row counts,
+and logs the stages that got slower than REGRESSION_THRESHOLD compared with the previous run of
+the same scale.
+
+Usage:
+------
+    python -m etl.benchmark_etl 10k
+or call run_benchmarks("10k", repeats=3).
+"""
+
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from etl import data_quality_check as dqc
+from etl.synthetic_corpus import SCALES, generate_corpus
+
+BENCHMARK_CORPUS_DIR = Path("bench_data")  # <scale>/raw_data/USA/<zip>/... (regenerated when missing)
+BENCHMARK_RESULTS_FILE = dqc.BASE_PREPROCESSED_DIR / "benchmarks" / "etl_benchmarks.jsonl"
+CORPUS_SUMMARY_FILE = "corpus.json"
+REGRESSION_THRESHOLD = 0.25  # Stage slower by more than 25% than the previous run is reported
+STAGES = ["load", "flatten", "validate", "write"]
+
+logger = dqc.logger
+
+
+def ensure_corpus(scale: str, seed: int = 0) -> tuple:
+    """Returns (country raw dir, corpus summary) of the synthetic corpus of 'scale', generating it once."""
+    caregivers = SCALES[scale] if scale in SCALES else int(scale)
+    corpus_dir = BENCHMARK_CORPUS_DIR / scale
+    summary_file = corpus_dir / CORPUS_SUMMARY_FILE
+    if summary_file.is_file():
+        summary = json.loads(summary_file.read_text(encoding="utf-8"))
+        if summary.get("caregivers") == caregivers and summary.get("seed") == seed:
+            return corpus_dir / "raw_data" / dqc.COUNTRY, summary
+    if corpus_dir.exists():
+        shutil.rmtree(corpus_dir)
+    logger.info(f"Generating synthetic corpus of {caregivers} caregivers in {corpus_dir} ...")
+    started = time.perf_counter()
+    summary = generate_corpus(corpus_dir / "raw_data", caregivers, seed=seed, country=dqc.COUNTRY)
+    summary["seed"] = seed
+    summary_file.write_text(json.dumps(summary), encoding="utf-8")
+    logger.info(f"Corpus generated in {time.perf_counter() - started:.1f}s: {json.dumps(summary)}")
+    return corpus_dir / "raw_data" / dqc.COUNTRY, summary
+
+
+def load_stage(country_raw_dir: Path) -> tuple:
+    """Loads every profile and review file of the corpus, like run_quality() does."""
+    profile_items, review_items = [], []
+    for zip_dir in sorted(country_raw_dir.iterdir()):
+        if not (zip_dir.is_dir() and zip_dir.name.isdigit()):
+            continue
+        profile_items.extend(dqc.load_json_files(zip_dir / "all_profiles", zip_dir.name))
+        reviews_dir = zip_dir / "reviews"
+        if reviews_dir.is_dir():
+            for type_dir in sorted(reviews_dir.iterdir()):
+                if type_dir.is_dir():
+                    review_items.extend(dqc.load_json_files(type_dir, zip_dir.name))
+    return profile_items, review_items
+
+
+def flatten_stage(profile_items: list, review_items: list) -> dict:
+    """Flattens and deduplicates the loaded items into {df_name: (DataFrame, schema)}."""
+    frames = {}
+    main_df = dqc.create_dataframe(profile_items, dqc.flatten_main_profile, "all_main_profiles")
+    if not main_df.empty:
+        main_df = main_df.dropna(subset=["profile_id"]).drop_duplicates(subset=["profile_id"], keep="first")
+        for sub_type, rows in dqc.pop_nested_profiles(main_df).items():
+            nested_df = dqc.apply_dtype_plan(pd.DataFrame(rows), f"nested_{sub_type}")
+            nested_df = nested_df.drop_duplicates(subset=["profile_id", "sub_profile_type"], keep="first")
+            frames[f"nested_{sub_type}"] = (nested_df, dqc.nested_profile_schema)
+        frames["main_profiles"] = (main_df, dqc.main_profile_schema)
+    seen = dqc.SeenKeySet()
+    try:
+        reviews_df = dqc.create_reviews_dataframe(review_items, seen)
+    finally:
+        seen.close()
+    if not reviews_df.empty:
+        frames["reviews"] = (reviews_df.drop_duplicates(subset=["review_id"], keep="first"), dqc.review_schema)
+    for df, _ in frames.values():
+        dqc.pop_json_lengths(df)
+    return frames
+
+
+def validate_stage(frames: dict) -> dict:
+    """Validates every frame the way run_quality_checks_and_report() does; returns {df_name: DataFrame}."""
+    validated = {}
+    for df_name, (df, schema) in frames.items():
+        if len(df) > dqc.VALIDATION_CHUNK_ROWS:
+            validated_df, errors = dqc.validate_in_chunks(df, schema, df_name)
+        else:
+            validated_df, errors = dqc.validate_whole(df, schema, df_name)
+        validated[df_name] = validated_df if errors is None else df
+    return validated
+
+
+def write_stage(validated: dict, output_dir: Path) -> None:
+    """Writes the processed CSV and Parquet dataset of every frame to 'output_dir'."""
+    dqc.ensure_dir_exists(output_dir)
+    for df_name, df in validated.items():
+        df.to_csv(output_dir / f"{df_name}_processed.csv", index=False, encoding="utf-8")
+        dqc.write_parquet_dataset(df, df_name, output_dir)
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB, or None where 'resource' is unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_previous_result(scale: str, results_file: Path):
+    """Last recorded result of 'scale', or None."""
+    if not results_file.is_file():
+        return None
+    previous = None
+    with open(results_file, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("scale") == scale:
+                previous = record
+    return previous
+
+
+def report_regressions(result: dict, previous: dict) -> list:
+    """Logs and returns the stages slower than REGRESSION_THRESHOLD compared with 'previous'."""
+    if not previous or previous.get("corpus") != result["corpus"]:
+        return []
+    regressions = []
+    for stage, seconds in result["stage_seconds"].items():
+        before = previous.get("stage_seconds", {}).get(stage)
+        if before and seconds > before * (1 + REGRESSION_THRESHOLD):
+            regressions.append(stage)
+            logger.warning(
+                f"Benchmark regression in '{stage}' ({result['scale']}): {before:.2f}s -> {seconds:.2f}s "
+                f"(previous run {previous.get('git_commit')} at {previous.get('timestamp')})."
+            )
+    return regressions
+
+
+def run_benchmarks(scale: str = "1k", repeats: int = 1, seed: int = 0, results_file: Path = None) -> dict:
+    """
+    Times the load, flatten, validate and write stages on the synthetic corpus of 'scale'
+    ("1k", "10k", "100k" or a caregiver count) and appends the result to 'results_file'.
+    """
+    dqc.configure_logging()
+    results_file = results_file or BENCHMARK_RESULTS_FILE
+    country_raw_dir, corpus = ensure_corpus(scale, seed)
+    # Source filenames are stored relative to BASE_RAW_DIR, so point the ETL config at the corpus
+    dqc.BASE_RAW_DIR = country_raw_dir.parent
+    dqc.COUNTRY_RAW_DIR = country_raw_dir
+    output_dir = BENCHMARK_CORPUS_DIR / scale / "preprocessed_data"
+    stage_seconds = {stage: None for stage in STAGES}
+
+    def timed(stage: str, func, *args):
+        started = time.perf_counter()
+        value = func(*args)
+        elapsed = round(time.perf_counter() - started, 3)
+        if stage_seconds[stage] is None or elapsed < stage_seconds[stage]:
+            stage_seconds[stage] = elapsed
+        return value
+
+    for run in range(repeats):
+        logger.info(f"--- Benchmark run {run + 1}/{repeats} on {scale} corpus ---")
+        profile_items, review_items = timed("load", load_stage, country_raw_dir)
+        frames = timed("flatten", flatten_stage, profile_items, review_items)
+        del profile_items, review_items
+        validated = timed("validate", validate_stage, frames)
+        timed("write", write_stage, validated, output_dir)
+
+    result = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "scale": scale,
+        "repeats": repeats,
+        "corpus": {key: corpus.get(key) for key in ("caregivers", "seed", "profile_files", "review_files", "reviews")},
+        "rows": {df_name: len(df) for df_name, df in validated.items()},
+        "stage_seconds": stage_seconds,
+        "total_seconds": round(sum(stage_seconds.values()), 3),
+        "peak_rss_mb": peak_rss_mb(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+    }
+    result["regressions"] = report_regressions(result, load_previous_result(scale, results_file))
+    dqc.ensure_dir_exists(results_file.parent)
+    with open(results_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result) + "\n")
+    logger.info(f"Benchmark result ({scale}): {json.dumps(stage_seconds)} -> {results_file}")
+    return result
+
+
+if __name__ == "__main__":
+    run_benchmarks(
+        sys.argv[1] if len(sys.argv) > 1 else "1k",
+        repeats=int(sys.argv[2]) if len(sys.argv) > 2 else 1,
+    )
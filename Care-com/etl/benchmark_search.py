@@ -0,0 +1,218 @@
+"""
+File: benchmark_search.py
+
+Description:
+-------------
+Query latency benchmark of the caregiver search (caregiver_search.py) on the synthetic corpus
+of benchmark_etl.py:
+  1. the preprocessed outputs of the corpus are created with benchmark_etl.run_benchmarks() when
+     missing and loaded with sql_modeling.run_etl() into the configured PostgreSQL database
+     (load=False reuses what is loaded);
+  2. 'queries' parameter sets are sampled (seeded) from caregiver_search: the zip code and
+     service of a row, a RATE_BAND_WIDTH band around its rate and one of its badges, so every
+     query has at least one hit;
+  3. each set is run in every shape of QUERY_SHAPES, and the fullest shape also as the same
+     question on the normalized tables (NORMALIZED_QUERY). 'mismatches' counts the sets where
+     the two return different caregivers.
+Latencies are milliseconds per query (p50, p95, max) after one warm-up pass. The indexes each
+shape's plan uses are recorded too. Every run appends one JSON line to
+SEARCH_BENCHMARK_RESULTS_FILE.
+
+Usage:
+------
+    python -m etl.benchmark_search 10k [queries]
+or call run_search_benchmark("10k", queries=200).
+"""
+
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+import sqlalchemy
+from sqlalchemy import select, text
+
+from etl import benchmark_etl
+from etl import sql_modeling as sm
+from etl.caregiver_search import search_query
+
+SEARCH_BENCHMARK_RESULTS_FILE = benchmark_etl.BENCHMARK_RESULTS_FILE.with_name("search_benchmarks.jsonl")
+RATE_BAND_WIDTH = 10  # Width of the sampled rate bands, in currency units
+RESULT_LIMIT = 20
+QUERY_SHAPES = {  # shape -> search_query() filters used
+    "zip_service": (),
+    "zip_service_rate": ("rate_min", "rate_max"),
+    "zip_service_rate_badge": ("rate_min", "rate_max", "badges"),
+}
+
+# The fullest shape written against the normalized schema, for comparison
+NORMALIZED_QUERY = """
+SELECT p.profile_id
+FROM {nested_table} n
+JOIN profiles p ON p.profile_id = n.profile_id
+LEFT JOIN (
+    SELECT r.profile_id, COUNT(DISTINCT r.review_id) AS review_count,
+           ROUND(AVG(rr.rating_value) FILTER (WHERE rr.rating_type = 'OVERALL'), 2) AS average_rating
+    FROM reviews r LEFT JOIN review_ratings rr ON rr.review_id = r.review_id
+    GROUP BY r.profile_id
+) rs ON rs.profile_id = p.profile_id
+WHERE p.zip_code = :zip_code
+  AND n.payrange_from_amount <= :rate_max AND n.payrange_to_amount >= :rate_min
+  AND EXISTS (SELECT 1 FROM profile_badges b WHERE b.profile_id = p.profile_id AND b.badge = :badge)
+ORDER BY rs.average_rating DESC NULLS LAST, COALESCE(rs.review_count, 0) DESC, p.profile_id
+LIMIT :limit
+"""
+
+logger = sm.logger
+
+
+def load_corpus(scale: str, seed: int = 0) -> dict:
+    """Preprocesses the corpus of 'scale' if needed and loads it; returns the corpus summary."""
+    _, corpus = benchmark_etl.ensure_corpus(scale, seed)
+    output_dir = benchmark_etl.BENCHMARK_CORPUS_DIR / scale / "preprocessed_data"
+    if not any(output_dir.glob("main_profiles_processed.*")):
+        benchmark_etl.run_benchmarks(scale, seed=seed)
+    sm.COUNTRY_PREPROCESSED_DIR = output_dir
+    sm.run_etl()
+    return corpus
+
+
+def sample_parameters(connection, queries: int, seed: int) -> list:
+    """'queries' seeded parameter sets, each taken from a caregiver_search row with rate and badges."""
+    rows = connection.execute(
+        select(
+            sm.CaregiverSearch.zip_code,
+            sm.CaregiverSearch.service,
+            sm.CaregiverSearch.rate_from,
+            sm.CaregiverSearch.badges,
+        )
+        .where(sm.CaregiverSearch.rate_from.is_not(None), sm.CaregiverSearch.badges.is_not(None))
+        .order_by(sm.CaregiverSearch.id)
+    ).all()
+    if not rows:
+        raise RuntimeError("caregiver_search has no rows with a rate and badges; load the corpus first.")
+    rng = random.Random(seed)
+    parameters = []
+    for row in (rng.choice(rows) for _ in range(queries)):
+        rate_min = (row.rate_from // RATE_BAND_WIDTH) * RATE_BAND_WIDTH
+        parameters.append(
+            {
+                "zip_code": row.zip_code,
+                "service": row.service,
+                "rate_min": rate_min,
+                "rate_max": rate_min + RATE_BAND_WIDTH,
+                "badges": [rng.choice(row.badges)],
+            }
+        )
+    return parameters
+
+
+def shape_query(shape: str, parameters: dict):
+    filters = {name: parameters[name] for name in QUERY_SHAPES[shape]}
+    return search_query(parameters["zip_code"], parameters["service"], limit=RESULT_LIMIT, **filters)
+
+
+def normalized_query(parameters: dict):
+    nested_table = sm.NESTED_MODEL_MAP[parameters["service"]]["model"].__tablename__
+    return text(NORMALIZED_QUERY.format(nested_table=nested_table)).bindparams(
+        zip_code=parameters["zip_code"],
+        rate_min=parameters["rate_min"],
+        rate_max=parameters["rate_max"],
+        badge=parameters["badges"][0],
+        limit=RESULT_LIMIT,
+    )
+
+
+def plan_indexes(connection, statement) -> list:
+    """Names of the indexes in the PostgreSQL plan of 'statement'."""
+    compiled = statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    names, nodes = set(), [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            names.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return sorted(names)
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[round(fraction * (len(ordered) - 1))]
+
+
+def time_queries(connection, statements: list) -> tuple:
+    """Runs every statement once to warm up, then once timed; returns (latencies in ms, results)."""
+    for statement in statements:
+        connection.execute(statement).all()
+    latencies, results = [], []
+    for statement in statements:
+        started = time.perf_counter()
+        rows = connection.execute(statement).all()
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append([row.profile_id for row in rows])
+    return latencies, results
+
+
+def run_search_benchmark(
+    scale: str = "1k", queries: int = 200, seed: int = 0, load: bool = True, results_file=None
+) -> dict:
+    """
+    Loads the synthetic corpus of 'scale' (unless load=False), times 'queries' sampled searches in
+    every shape and on the normalized tables, and appends the result to 'results_file'.
+    """
+    sm.configure_logging()
+    results_file = results_file or SEARCH_BENCHMARK_RESULTS_FILE
+    corpus = load_corpus(scale, seed) if load else {}
+    latency_ms, plans = {}, {}
+    with sm.get_engine().connect() as connection:
+        search_rows = connection.execute(select(sqlalchemy.func.count()).select_from(sm.CaregiverSearch)).scalar()
+        parameters = sample_parameters(connection, queries, seed)
+        shapes = {
+            shape: [shape_query(shape, p) for p in parameters] for shape in QUERY_SHAPES
+        }
+        shapes["normalized_zip_service_rate_badge"] = [normalized_query(p) for p in parameters]
+        results = {}
+        for shape, statements in shapes.items():
+            latencies, results[shape] = time_queries(connection, statements)
+            latency_ms[shape] = {
+                "p50": round(percentile(latencies, 0.5), 3),
+                "p95": round(percentile(latencies, 0.95), 3),
+                "max": round(max(latencies), 3),
+                "mean_rows": round(sum(map(len, results[shape])) / len(parameters), 1),
+            }
+            plans[shape] = plan_indexes(connection, statements[0])
+            logger.info(f"Search benchmark '{shape}': {json.dumps(latency_ms[shape])}, indexes {plans[shape]}")
+    mismatches = sum(
+        a != b
+        for a, b in zip(results["zip_service_rate_badge"], results["normalized_zip_service_rate_badge"])
+    )
+    if mismatches:
+        logger.warning(f"{mismatches} search(es) returned other caregivers than the normalized query.")
+    result = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": benchmark_etl.git_commit(),
+        "scale": scale,
+        "corpus": {key: corpus.get(key) for key in ("caregivers", "seed", "reviews")},
+        "caregiver_search_rows": search_rows,
+        "queries": queries,
+        "latency_ms": latency_ms,
+        "plan_indexes": plans,
+        "mismatches": mismatches,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+    }
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(results_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result, default=str) + "\n")
+    logger.info(f"Search benchmark result ({scale}) -> {results_file}")
+    return result
+
+
+if __name__ == "__main__":
+    run_search_benchmark(
+        sys.argv[1] if len(sys.argv) > 1 else "1k",
+        queries=int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
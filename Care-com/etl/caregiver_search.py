@@ -0,0 +1,112 @@
+"""
+File: caregiver_search.py
+
+Description:
+-------------
+Query API over caregiver_search (sql_modeling.CaregiverSearch), the read-optimized table the
+loader rebuilds per changed zip code. It answers "caregivers in zip X offering service Y in rate
+band Z with badge B, sorted by rating" from one table, instead of joining profiles,
+profile_badges, nested_* and reviews:
+  - zip code and service are equality conditions on the leading columns of the composite indexes
+    (zip_code, service, average_rating DESC NULLS LAST) and (zip_code, service, rate_from, rate_to);
+  - badges and supported service names are array containment (@>) filters served by GIN indexes.
+Results are sorted by average OVERALL rating (unrated last), then review count.
+
+Usage:
+------
+    from etl import sql_modeling as sm
+    from etl.caregiver_search import search_caregivers
+
+    with sm.get_session() as session:
+        rows = search_caregivers(
+            session, "10002", "childCareCaregiverProfile", rate_max=25, badges=["CARE_CHECK"]
+        )
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.sql import Select
+
+try:
+    from etl.sql_modeling import NESTED_MODEL_MAP, CaregiverSearch
+except ImportError:  # Run as a script from inside etl/
+    from sql_modeling import NESTED_MODEL_MAP, CaregiverSearch
+
+SERVICES = list(NESTED_MODEL_MAP)  # Values of caregiver_search.service
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 200
+
+RESULT_COLUMNS = [
+    CaregiverSearch.profile_id,
+    CaregiverSearch.zip_code,
+    CaregiverSearch.service,
+    CaregiverSearch.display_name,
+    CaregiverSearch.address_city,
+    CaregiverSearch.image_url,
+    CaregiverSearch.years_of_experience,
+    CaregiverSearch.rate_from,
+    CaregiverSearch.rate_to,
+    CaregiverSearch.currency,
+    CaregiverSearch.badges,
+    CaregiverSearch.service_names,
+    CaregiverSearch.review_count,
+    CaregiverSearch.average_rating,
+    CaregiverSearch.hired_times,
+    CaregiverSearch.is_premium,
+]
+
+
+def search_query(
+    zip_code: str,
+    service: str,
+    rate_min: Optional[Decimal] = None,
+    rate_max: Optional[Decimal] = None,
+    badges: Sequence[str] = (),
+    service_names: Sequence[str] = (),
+    min_rating: Optional[Decimal] = None,
+    limit: int = DEFAULT_LIMIT,
+    offset: int = 0,
+) -> Select:
+    """
+    SELECT of the caregivers of 'zip_code' with sub-profile 'service' (a NESTED_MODEL_MAP key),
+    whose pay range overlaps [rate_min, rate_max], who hold all 'badges', offer all
+    'service_names' and are rated at least 'min_rating'; best rated first.
+    """
+    if service not in NESTED_MODEL_MAP:
+        raise ValueError(f"Unknown service {service!r}; expected one of {SERVICES}.")
+    if not 0 < limit <= MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_LIMIT}, got {limit}.")
+    query = select(*RESULT_COLUMNS).where(
+        CaregiverSearch.zip_code == zip_code, CaregiverSearch.service == service
+    )
+    # Overlap of the caregiver's pay range with the requested band
+    if rate_max is not None:
+        query = query.where(CaregiverSearch.rate_from <= rate_max)
+    if rate_min is not None:
+        query = query.where(CaregiverSearch.rate_to >= rate_min)
+    if badges:
+        query = query.where(CaregiverSearch.badges.contains(sorted(set(badges))))
+    if service_names:
+        query = query.where(CaregiverSearch.service_names.contains(sorted(set(service_names))))
+    if min_rating is not None:
+        query = query.where(CaregiverSearch.average_rating >= min_rating)
+    return (
+        query.order_by(
+            CaregiverSearch.average_rating.desc().nulls_last(),
+            CaregiverSearch.review_count.desc(),
+            CaregiverSearch.profile_id,
+        )
+        .limit(limit)
+        .offset(offset)
+    )
+
+
+def search_caregivers(connection, zip_code: str, service: str, **filters) -> List[Dict[str, Any]]:
+    """
+    Runs search_query(zip_code, service, **filters) on a Session or Connection (PostgreSQL) and
+    returns the results as {column: value} dicts.
+    """
+    result = connection.execute(search_query(zip_code, service, **filters))
+    return [dict(row) for row in result.mappings()]
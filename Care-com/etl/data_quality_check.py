@@ -7,32 +7,64 @@ Description:
 -------------
 This module loads raw caregiver profile JSON files from:
     Care-com/raw_data/USA/10002/all_profiles/<id>.json
+and review files from:
+    Care-com/raw_data/USA/10002/reviews/caregivers/<id>.json  (one document per caregiver)
+    Care-com/raw_data/USA/10002/reviews/<careType>/<id>_<careType>_<page>.json  (legacy, one file per page)
+and, when the scrapers run with a blob store, profiles referenced from:
+    Care-com/raw_data/_blobs/manifests/<run_id>.jsonl  (latest blob per 'USA/<zip>/all_profiles/<id>.json' key)
+or appended to the sharded raw-data lake:
+    Care-com/raw_data/_lake/care_com/<zip>/profiles/run=<run_id>/part-*.jsonl.gz  (newest record per id)
 
 It performs the following steps:
   1. Loads and flattens the main caregiver fields (e.g., member details, contact info, etc.)
-     into a main profiles DataFrame.
-  2. Separately extracts and flattens the nested "profiles" field into a Nested_Profiles DataFrame.
+     into a main profiles DataFrame. Each frame gets a dtype plan (categoricals for enumerations,
+     small nullable ints, Arrow-backed strings) as it is built.
+  2. In the same pass, flattens the nested "profiles" field into Nested_Profiles DataFrames.
      Each non-null sub-profile (e.g., commonCaregiverProfile, houseKeepingCaregiverProfile) is expanded into its own row.
+     Reviews whose id was already flattened are skipped before flattening (SeenKeySet).
   3. Validates the main profiles DataFrame using pandera.
-  4. Performs data quality checks and exports a quality report.
+  4. Performs data quality checks and exports a quality report, the processed CSVs and typed
+     Parquet datasets partitioned by zip (<name>_processed.parquet/zip_code=<zip>/).
   5. Prints a proposed relational data model (designed in 3NF) as a blueprint for further ETL.
 
 Usage:
 ------
 Run the module from the project root:
     python -m src.etl.data_quality_check
+or call run_quality(streaming=..., chunk_size=..., workers=..., incremental=...). workers > 1 parses
+and flattens the raw JSON files on a process pool; incremental=True only flattens raw files that are
+new or changed since the previous incremental run (raw_manifest_<COUNTRY>.json). Wall/CPU time,
+rows in/out, bytes and peak RSS of every stage are saved to run_report_data_quality_<COUNTRY>.json
+(see instrumentation.py).
 """
 
 # data_quality_check_hybrid_flattening.py
 
 import os
+import sys
 import json
 import logging
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import pandera as pa
 from pandera import Column, DataFrameSchema
 import traceback  # For detailed error logging
+import shutil
+import pickle
+import hashlib
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+try:
+    from etl.instrumentation import RunInstrumentation, path_size
+except ImportError:  # Run as a script from inside etl/
+    from instrumentation import RunInstrumentation, path_size
 
 # --- Configuration (!!! ADJUST THESE PATHS AND VALUES !!!) ---
 BASE_RAW_DIR = Path("raw_data")
@@ -42,26 +74,39 @@ COUNTRY = "USA"  # CHANGE this if needed
 # --- Dynamic Path Construction ---
 COUNTRY_RAW_DIR = BASE_RAW_DIR / COUNTRY
 COUNTRY_PREPROCESSED_DIR = BASE_PREPROCESSED_DIR / COUNTRY  # Output directory
+BLOB_STORE_DIR = BASE_RAW_DIR / "_blobs"  # Content-addressed store (Scrapers/care_com/USA/blob_store.py)
+PROCESSED_BLOBS_LEDGER = BASE_PREPROCESSED_DIR / f"processed_blobs_{COUNTRY}.txt"
+LAKE_DIR = BASE_RAW_DIR / "_lake"  # Sharded raw-data lake (common/raw_lake.py)
+LAKE_SITE = "care_com"
+RAW_MANIFEST_FILE = BASE_PREPROCESSED_DIR / f"raw_manifest_{COUNTRY}.json"  # Incremental mode
+INCREMENTAL_CACHE_DIR = COUNTRY_PREPROCESSED_DIR / "_incremental"  # Flattened rows per zip
 
 # --- Logging Setup ---
 LOG_FILE = (
     BASE_PREPROCESSED_DIR / f"data_quality_{COUNTRY}_all.log"
 )  # Log file at BASE level
+logger = logging.getLogger(__name__)
+
 
-# Ensure log directory exists *before* setting up logging handlers
-if not LOG_FILE.parent.exists():
+def configure_logging() -> None:
+    """
+    Logs to LOG_FILE and the console, unless logging is configured already. Called by the entry
+    points (and as process-pool initializer), not at import, so importing this module (e.g. in
+    pool workers or benchmarks) creates no directories or handlers.
+    """
+    if logging.getLogger().handlers:
+        return
+    handlers = [logging.StreamHandler()]
     try:
         LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        print(f"Created log directory: {LOG_FILE.parent}")
-    except Exception as e:
-        print(f"FATAL: Could not create log directory {LOG_FILE.parent}: {e}")
-        exit(1)  # Exit if logging can't be set up
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
-    handlers=[logging.FileHandler(LOG_FILE, encoding="utf-8"), logging.StreamHandler()],
-)
-logger = logging.getLogger(__name__)
+        handlers.insert(0, logging.FileHandler(LOG_FILE, encoding="utf-8"))
+    except OSError as e:
+        print(f"Could not open log file {LOG_FILE}, logging to the console only: {e}")
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
+        handlers=handlers,
+    )
 
 # --- Helper Functions ---
 
@@ -77,55 +122,202 @@ def ensure_dir_exists(path: Path):
             raise
 
 
-def load_json_files(directory: Path, zip_code: str) -> list:  # Added zip_code parameter
+def iter_json_files(directory: Path, zip_code: str):
     """
-    Recursively loads JSON files (excluding 'metadata_') from a directory.
-    Adds zip_code to each loaded object.
+    Yields JSON files (excluding 'metadata_') from a directory one at a time, recursively,
+    as {"filename", "data", "zip_code"} items. Used by load_json_files() and the streaming mode.
     """
-    json_objects = []
     if not directory.is_dir():
         logger.warning(f"Input directory not found or is not a directory: {directory}")
-        return json_objects
+        return
     logger.info(f"Scanning for JSON files in: {directory}")
     file_count = 0
+    valid_count = 0
     for file_path in directory.rglob("*.json"):
         file_count += 1
         if file_path.name.startswith("metadata_"):
             continue
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            json_objects.append(
-                {
-                    "filename": str(file_path.relative_to(BASE_RAW_DIR)),
-                    "data": data,
-                    "zip_code": zip_code,
-                }
-            )  # Add zip code here
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON Decode Error in file {file_path}: {e}")
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
+        item = read_json_item(file_path, zip_code)
+        if item is None:
+            continue
+        valid_count += 1
+        yield item
     logger.info(
-        f"Scanned {file_count} files. Found {len(json_objects)} valid JSON files in {directory}."
+        f"Scanned {file_count} files. Found {valid_count} valid JSON files in {directory}."
     )
-    return json_objects
 
 
-def safe_json_dump(data, default="null"):
-    """Safely dumps data to JSON string, handling potential type errors."""
+def read_json_item(file_path: Path, zip_code: str):
+    """Loads one raw JSON file as a {"filename", "data", "zip_code", "size_bytes"} item, or None if
+    unreadable."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            size_bytes = os.fstat(f.fileno()).st_size
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON Decode Error in file {file_path}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Error reading file {file_path}: {e}")
+        return None
+    return {
+        "filename": str(file_path.relative_to(BASE_RAW_DIR)),
+        "data": data,
+        "zip_code": zip_code,
+        "size_bytes": size_bytes,
+    }  # Add zip code here
+
+
+def iter_json_paths(directory: Path):
+    """Yields the paths iter_json_files() would load from 'directory', in the same order."""
+    if not directory.is_dir():
+        logger.warning(f"Input directory not found or is not a directory: {directory}")
+        return
+    for file_path in directory.rglob("*.json"):
+        if not file_path.name.startswith("metadata_"):
+            yield file_path
+
+
+def load_json_files(directory: Path, zip_code: str) -> list:  # Added zip_code parameter
+    """
+    Recursively loads JSON files (excluding 'metadata_') from a directory.
+    Adds zip_code to each loaded object.
+    """
+    return list(iter_json_files(directory, zip_code))
+
+
+def iter_blob_entries(store_dir: Path, section: str = "all_profiles"):
+    """
+    Yields (store, key, zip_code, sha256) of the latest blob of every '<COUNTRY>/<zip>/<section>/...'
+    key of the content-addressed store, from its manifests only (no blob is read).
+    """
+    if not store_dir.is_dir():
+        return
+    try:
+        from Scrapers.care_com.USA.blob_store import BlobStore
+    except ImportError as e:
+        logger.warning(f"Blob store found at {store_dir} but blob_store module not importable: {e}")
+        return
+
+    store = BlobStore(str(store_dir))
+    for key, entry in store.iter_latest(f"{COUNTRY}/"):
+        parts = key.split("/")
+        if len(parts) < 4 or parts[2] != section or parts[-1].startswith("metadata_"):
+            continue
+        yield store, key, parts[1], entry["sha256"]
+
+
+def iter_blob_items(store_dir: Path, section: str = "all_profiles", ledger=None):
+    """
+    Yields the latest blob of every '<COUNTRY>/<zip>/<section>/...' key from the content-addressed
+    store, as items shaped like iter_json_files() output (plus 'blob_sha256').
+    Blobs whose hash is already in 'ledger' (a ProcessedBlobLedger) are skipped.
+    """
+    loaded = 0
+    skipped = 0
+    for store, key, zip_code, sha in iter_blob_entries(store_dir, section):
+        if ledger is not None and sha in ledger:
+            skipped += 1
+            continue
+        try:
+            data = store.get(sha)
+        except Exception as e:
+            logger.error(f"Error reading blob {sha} for {key}: {e}")
+            continue
+        loaded += 1
+        yield {
+            "filename": key,
+            "data": data,
+            "zip_code": zip_code,
+            "blob_sha256": sha,
+        }
+    if loaded or skipped:
+        logger.info(
+            f"Loaded {loaded} '{section}' blobs from {store_dir} (skipped {skipped} already processed)."
+        )
+
+
+def load_blob_items(store_dir: Path, section: str = "all_profiles", ledger=None) -> list:
+    """List version of iter_blob_items()."""
+    return list(iter_blob_items(store_dir, section, ledger))
+
+
+def iter_lake_items(lake_dir: Path, entity: str = "profiles"):
+    """
+    Streams the newest record of every id of 'entity' from the sharded raw-data lake,
+    as items shaped like iter_json_files() output.
+    """
+    if not (lake_dir / LAKE_SITE).is_dir():
+        return
+    try:
+        from common.raw_lake import iter_records
+    except ImportError as e:
+        logger.warning(f"Lake found at {lake_dir} but raw_lake module not importable: {e}")
+        return
+
+    loaded = 0
+    try:
+        for record in iter_records(str(lake_dir), LAKE_SITE, entity=entity):
+            loaded += 1
+            yield {
+                "filename": f"_lake/{LAKE_SITE}/{record['partition']}/{entity}/run={record['run_id']}#{record['id']}",
+                "data": record["data"],
+                "zip_code": record["partition"],
+            }
+    except Exception as e:
+        logger.error(f"Error streaming lake records from {lake_dir}: {e}\n{traceback.format_exc()}")
+    logger.info(f"Loaded {loaded} '{entity}' records from lake {lake_dir}.")
+
+
+def load_lake_items(lake_dir: Path, entity: str = "profiles") -> list:
+    """List version of iter_lake_items()."""
+    return list(iter_lake_items(lake_dir, entity))
+
+
+def open_blob_ledger():
+    """The processed-blob ledger (PROCESSED_BLOBS_LEDGER)."""
+    from Scrapers.care_com.USA.blob_store import ProcessedBlobLedger
+
+    return ProcessedBlobLedger(str(PROCESSED_BLOBS_LEDGER))
+
+
+def mark_blobs_processed(items: list) -> None:
+    """Records the blob hashes of processed items in the processed-blob ledger."""
+    hashes = [item["blob_sha256"] for item in items if item.get("blob_sha256")]
+    if not hashes:
+        return
+    ledger = open_blob_ledger()
+    ledger.mark(hashes)
+    ledger.flush()
+    logger.info(f"Processed-blob ledger now holds {len(ledger)} hashes: {PROCESSED_BLOBS_LEDGER}")
+
+
+def safe_json_dump(data, default="null", lengths: dict = None, key: str = None):
+    """Safely dumps data to JSON string, handling potential type errors.
+    If 'lengths' is given, also records lengths[key] = number of items in 'data' (0 unless it is
+    a list/dict), the figure the quality report gives for *_json columns."""
     try:
-        return json.dumps(data)
+        dumped = json.dumps(data)
     except TypeError as e:
         logger.warning(
             f"Could not serialize data to JSON: {e}. Data type: {type(data)}. Returning '{default}'."
         )
-        return default  # Return valid JSON null or empty object/list string
+        dumped = default  # Return valid JSON null or empty object/list string
+        data = None
+    if lengths is not None:
+        lengths[key] = len(data) if isinstance(data, (list, dict)) else 0
+    return dumped
+
+
+NESTED_PROFILES_COLUMN = "_nested_profiles"  # Transient column, popped before checks/saving
+JSON_LENGTHS_COLUMN = "_json_lengths"  # Transient {*_json column: item count}, see pop_json_lengths()
 
 
 def flatten_main_profile(profile_item: dict) -> dict:  # Takes the item dict now
     """Flattens main caregiver fields explicitly. Includes zip_code.
-    Stores complex nested objects (profiles, backgroundChecks, etc.) as JSON strings."""
+    Stores complex nested objects (profiles, backgroundChecks, etc.) as JSON strings.
+    The flattened sub-profiles ({sub_profile_type: [rows]}) are returned under
+    NESTED_PROFILES_COLUMN; see pop_nested_profiles()."""
     profile_data = profile_item.get("data", {})
     filename = profile_item.get("filename", "unknown")
     zip_code = profile_item.get("zip_code", "unknown")  # Get zip_code
@@ -134,6 +326,7 @@ def flatten_main_profile(profile_item: dict) -> dict:  # Takes the item dict now
         "zip_code": zip_code,
         "_flattening_error": False,
     }  # Add zip_code
+    json_lengths = {}
     try:
         # Basic structure check
         if not isinstance(profile_data.get("data", {}).get("getCaregiver"), dict):
@@ -146,6 +339,7 @@ def flatten_main_profile(profile_item: dict) -> dict:  # Takes the item dict now
         caregiver = profile_data["data"]["getCaregiver"]
         member = caregiver.get("member", {})
         address = member.get("address", {}) if isinstance(member, dict) else {}
+        profiles_obj = caregiver.get("profiles", {})
 
         # --- Explicitly flatten member fields ---
         flat_profile.update(
@@ -164,7 +358,11 @@ def flatten_main_profile(profile_item: dict) -> dict:  # Takes the item dict now
                 "member_address_zip": address.get(
                     "zip"
                 ),  # Note: zip from address vs zip_code from folder might differ
-                "member_languages_json": safe_json_dump(member.get("languages", [])),
+                "member_languages_json": safe_json_dump(
+                    member.get("languages", []),
+                    lengths=json_lengths,
+                    key="member_languages_json",
+                ),
                 "member_legacyId": member.get("legacyId"),
                 "member_isPremium": member.get("isPremium", None),  # Keep None for now
             }
@@ -192,28 +390,48 @@ def flatten_main_profile(profile_item: dict) -> dict:  # Takes the item dict now
                 "signUpDate": caregiver.get("signUpDate"),
                 "yearsOfExperience": caregiver.get("yearsOfExperience"),
                 # --- Store complex fields as JSON ---
-                "badges_json": safe_json_dump(caregiver.get("badges", [])),
+                "badges_json": safe_json_dump(
+                    caregiver.get("badges", []), lengths=json_lengths, key="badges_json"
+                ),
                 "backgroundChecks_json": safe_json_dump(
-                    caregiver.get("backgroundChecks", [])
+                    caregiver.get("backgroundChecks", []),
+                    lengths=json_lengths,
+                    key="backgroundChecks_json",
                 ),
                 "educationDegrees_json": safe_json_dump(
-                    caregiver.get("educationDegrees", [])
+                    caregiver.get("educationDegrees", []),
+                    lengths=json_lengths,
+                    key="educationDegrees_json",
                 ),
                 "hiredByCounts_json": safe_json_dump(
-                    caregiver.get("hiredByCounts", {})
+                    caregiver.get("hiredByCounts", {}),
+                    lengths=json_lengths,
+                    key="hiredByCounts_json",
+                ),
+                "placeInfo_json": safe_json_dump(
+                    caregiver.get("placeInfo", {}),
+                    lengths=json_lengths,
+                    key="placeInfo_json",
                 ),
-                "placeInfo_json": safe_json_dump(caregiver.get("placeInfo", {})),
                 "profiles_json": safe_json_dump(
-                    caregiver.get("profiles", {})
+                    caregiver.get("profiles", {}),
+                    lengths=json_lengths,
+                    key="profiles_json",
                 ),  # Key for nested processing
                 "recurringAvailability_json": safe_json_dump(
-                    caregiver.get("recurringAvailability", {})
+                    caregiver.get("recurringAvailability", {}),
+                    lengths=json_lengths,
+                    key="recurringAvailability_json",
                 ),
                 "nonPrimaryImages_json": safe_json_dump(
-                    caregiver.get("nonPrimaryImages", [])
+                    caregiver.get("nonPrimaryImages", []),
+                    lengths=json_lengths,
+                    key="nonPrimaryImages_json",
                 ),
                 "continuousBackgroundCheck_json": safe_json_dump(
-                    caregiver.get("continuousBackgroundCheck", {})
+                    caregiver.get("continuousBackgroundCheck", {}),
+                    lengths=json_lengths,
+                    key="continuousBackgroundCheck_json",
                 ),
             }
         )
@@ -265,6 +483,12 @@ def flatten_main_profile(profile_item: dict) -> dict:  # Takes the item dict now
         if pd.isna(flat_profile["profile_id"]):
             logger.warning(f"Missing profile_id for record from {filename}.")
 
+        # Sub-profile rows straight from the parsed dict (no profiles_json round trip)
+        flat_profile[NESTED_PROFILES_COLUMN] = flatten_nested_profiles(
+            profiles_obj, flat_profile["profile_id"], zip_code, filename
+        )
+        flat_profile[JSON_LENGTHS_COLUMN] = json_lengths
+
         return flat_profile
     except Exception as e:
         logger.error(
@@ -304,16 +528,30 @@ def extract_and_flatten_nested_profiles(
             if isinstance(profiles_str, str) and profiles_str
             else {}
         )
-        if not isinstance(profiles_obj, dict):
-            logger.warning(
-                f"Parsed 'profiles_json' is not a dict for profile_id {profile_id} from {filename}. Skipping."
-            )
-            return nested_rows_by_type  # Return empty dict
     except Exception as e:
         logger.error(
             f"Error parsing nested profiles JSON for profile_id {profile_id} from {filename}: {e}. JSON: '{str(profiles_str)[:100]}...'"
         )
         return nested_rows_by_type  # Return empty dict
+    return flatten_nested_profiles(profiles_obj, profile_id, zip_code, filename)
+
+
+def flatten_nested_profiles(
+    profiles_obj, profile_id, zip_code: str, filename: str
+) -> dict[str, list[dict]]:
+    """
+    Flattens the already-parsed 'profiles' object of one caregiver into sub-profile rows
+    ({sub_profile_type: [flat row]}). Called by flatten_main_profile() in the same pass as the
+    main fields, and by extract_and_flatten_nested_profiles() for rows that only have profiles_json.
+    """
+    nested_rows_by_type = {}
+    if profile_id is None or pd.isna(profile_id):
+        return nested_rows_by_type
+    if not isinstance(profiles_obj, dict):
+        logger.warning(
+            f"Parsed 'profiles_json' is not a dict for profile_id {profile_id} from {filename}. Skipping."
+        )
+        return nested_rows_by_type
 
     service_ids = profiles_obj.get("serviceIds", [])  # List
     # Known sub-profile keys
@@ -348,11 +586,14 @@ def extract_and_flatten_nested_profiles(
         if isinstance(sub_profile, dict):  # Process only if it's a dictionary
             try:
                 # Base info
+                json_lengths = {}
                 flat_sub = {
                     "profile_id": profile_id,
                     "zip_code": zip_code,  # Added zip_code
                     "sub_profile_type": sub_profile_type,  # Store the type within the flat dict
-                    "service_ids_json": safe_json_dump(service_ids),
+                    "service_ids_json": safe_json_dump(
+                        service_ids, lengths=json_lengths, key="service_ids_json"
+                    ),
                 }
                 prefix = sub_profile_type + "_"  # Prefix for column names
 
@@ -379,22 +620,30 @@ def extract_and_flatten_nested_profiles(
                                 flat_sub[f"{col_name_base}_{inner_key}"] = inner_val
                         # Store the collected True flags (or key names) as a JSON list
                         flat_sub[f"{col_name_base}_flags_json"] = safe_json_dump(
-                            inner_vals_list
+                            inner_vals_list,
+                            lengths=json_lengths,
+                            key=f"{col_name_base}_flags_json",
                         )  # Changed column name for clarity
                     # 2. Handle known lists to store as JSON
                     elif field in json_lists and isinstance(value, list):
-                        flat_sub[f"{col_name_base}_json"] = safe_json_dump(value)
+                        flat_sub[f"{col_name_base}_json"] = safe_json_dump(
+                            value, lengths=json_lengths, key=f"{col_name_base}_json"
+                        )
                     # 3. Handle other nested lists/dicts (store as JSON as fallback)
                     elif isinstance(value, list):
                         logger.debug(
                             f"Storing unhandled list field '{field}' as JSON for {sub_profile_type}, profile {profile_id}"
                         )
-                        flat_sub[f"{col_name_base}_json"] = safe_json_dump(value)
+                        flat_sub[f"{col_name_base}_json"] = safe_json_dump(
+                            value, lengths=json_lengths, key=f"{col_name_base}_json"
+                        )
                     elif isinstance(value, dict):
                         logger.debug(
                             f"Storing unhandled dict field '{field}' as JSON for {sub_profile_type}, profile {profile_id}"
                         )
-                        flat_sub[f"{col_name_base}_json"] = safe_json_dump(value)
+                        flat_sub[f"{col_name_base}_json"] = safe_json_dump(
+                            value, lengths=json_lengths, key=f"{col_name_base}_json"
+                        )
                     # 4. Handle simple, explicitly known fields (including booleans directly)
                     else:
                         flat_sub[col_name_base] = (
@@ -406,6 +655,8 @@ def extract_and_flatten_nested_profiles(
                 # The boolean logic for string representations ('true'/'false') is also removed
                 # as direct boolean values are handled in step 4, and flags from dicts in step 1.
 
+                flat_sub[JSON_LENGTHS_COLUMN] = json_lengths
+
                 # CHANGED: Append the flattened dict to the list for this sub_profile_type
                 if sub_profile_type not in nested_rows_by_type:
                     nested_rows_by_type[sub_profile_type] = []
@@ -434,6 +685,7 @@ def flatten_review(review_item: dict) -> dict:  # Takes the item dict now
         "zip_code": zip_code,
         "_flattening_error": False,
     }  # Add zip_code
+    json_lengths = {}
 
     try:
         if not isinstance(review_data, dict):
@@ -505,9 +757,21 @@ def flatten_review(review_item: dict) -> dict:  # Takes the item dict now
                     reviewer.get("type") if isinstance(reviewer, dict) else None
                 ),
                 # JSON fields
-                "ratings_json": safe_json_dump(review_data.get("ratings", [])),
-                "retort_json": safe_json_dump(review_data.get("retort", {})),
-                "attributes_json": safe_json_dump(review_data.get("attributes", [])),
+                "ratings_json": safe_json_dump(
+                    review_data.get("ratings", []),
+                    lengths=json_lengths,
+                    key="ratings_json",
+                ),
+                "retort_json": safe_json_dump(
+                    review_data.get("retort", {}),
+                    lengths=json_lengths,
+                    key="retort_json",
+                ),
+                "attributes_json": safe_json_dump(
+                    review_data.get("attributes", []),
+                    lengths=json_lengths,
+                    key="attributes_json",
+                ),
             }
         )
 
@@ -531,6 +795,7 @@ def flatten_review(review_item: dict) -> dict:  # Takes the item dict now
             except:
                 flat_review["verifiedByCare"] = pd.NA
 
+        flat_review[JSON_LENGTHS_COLUMN] = json_lengths
         return flat_review
     except Exception as e:
         logger.error(
@@ -540,10 +805,11 @@ def flatten_review(review_item: dict) -> dict:  # Takes the item dict now
         return flat_review
 
 
-def create_dataframe(
-    item_objs: list, flatten_func: callable, desc: str
-) -> pd.DataFrame:  # Takes list of items now
-    """Creates DataFrame by applying flattening function to item objects, skipping errors."""
+def flatten_items(item_objs: list, flatten_func: callable) -> tuple:
+    """
+    Applies 'flatten_func' to item objects. Returns (flattened rows, error count);
+    items whose 'data' is not a dict are skipped with a warning.
+    """
     flattened_data = []
     error_count = 0
     for item in item_objs:  # item is {"filename":..., "data":..., "zip_code":...}
@@ -558,6 +824,119 @@ def create_dataframe(
             logger.warning(
                 f"Skipping record from {item['filename']}: invalid 'data' structure."
             )
+    return flattened_data, error_count
+
+
+# --- Memory-Optimized Dtype Plan ---
+# convert_dtypes() alone leaves enumerations as one string per row and integers as Int64.
+# apply_dtype_plan() then stores known enumerations (and nested sub-profile status/type fields)
+# as categoricals, downcasts integer columns to the smallest nullable integer type and keeps the
+# remaining strings Arrow-backed when pyarrow is installed. The frame's memory before and after
+# the plan is kept in df.attrs[DTYPE_PLAN_MEMORY_ATTR] and reported in the quality report.
+CATEGORY_COLUMNS = {
+    "zip_code",
+    "sub_profile_type",
+    "member_gender",
+    "member_primaryService",
+    "member_address_state",
+    "providerStatus",
+    "approvalStatus",
+    "careType",
+    "languageCode",
+    "originalSource",
+    "status",
+    "updateSource",
+    "reviewee_providerType",
+    "reviewee_type",
+    "reviewer_source",
+    "reviewer_type",
+}
+CATEGORY_COLUMN_SUFFIXES = ("_approvalStatus", "_status", "_providerType")  # Nested sub-profile fields
+DTYPE_PLAN_MEMORY_ATTR = "dtype_plan_memory_bytes"
+INTERNAL_COLUMNS = {"_flattening_error", NESTED_PROFILES_COLUMN, JSON_LENGTHS_COLUMN}
+
+
+def frame_memory_bytes(df: pd.DataFrame) -> int:
+    """Deep memory usage of 'df', ignoring the internal columns popped before the checks."""
+    columns = [c for c in df.columns if c not in INTERNAL_COLUMNS]
+    return int(df[columns].memory_usage(index=False, deep=True).sum())
+
+
+def plan_column_dtype(series: pd.Series, string_dtype):
+    """Returns the planned dtype of one convert_dtypes() column, or None to keep it."""
+    name = str(series.name)
+    if name in INTERNAL_COLUMNS:
+        return None
+    dtype = series.dtype
+    is_text = isinstance(dtype, pd.StringDtype) or (
+        dtype == object and series.dropna().map(type).eq(str).all()
+    )
+    if is_text and (name in CATEGORY_COLUMNS or name.endswith(CATEGORY_COLUMN_SUFFIXES)):
+        return "category"
+    if is_text:
+        return string_dtype
+    if isinstance(dtype, pd.Int64Dtype):
+        values = series.dropna()
+        if values.empty:
+            return "Int8"
+        low, high = int(values.min()), int(values.max())
+        for candidate, np_type in (("Int8", np.int8), ("Int16", np.int16), ("Int32", np.int32)):
+            if np.iinfo(np_type).min <= low and high <= np.iinfo(np_type).max:
+                return candidate
+    return None
+
+
+def apply_dtype_plan(df: pd.DataFrame, desc: str) -> pd.DataFrame:
+    """
+    Runs convert_dtypes() followed by the dtype plan above on a freshly built frame and records
+    the memory saving (relative to convert_dtypes() alone) in df.attrs.
+    """
+    df = df.convert_dtypes()
+    if df.empty:
+        return df
+    try:
+        import pyarrow  # noqa: F401
+
+        string_dtype = pd.StringDtype("pyarrow")
+    except ImportError:
+        string_dtype = pd.StringDtype()
+    before = frame_memory_bytes(df)
+    planned = {}
+    for col in df.columns:
+        target = plan_column_dtype(df[col], string_dtype)
+        if target is not None and str(df[col].dtype) != str(target):
+            planned[col] = target
+    if planned:
+        try:
+            df = df.astype(planned)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Dtype plan for {desc} could not be applied ({e}); keeping inferred dtypes.")
+    after = frame_memory_bytes(df)
+    df.attrs[DTYPE_PLAN_MEMORY_ATTR] = {"before": before, "after": after}
+    logger.info(
+        f"Dtype plan for {desc}: {len(planned)} column(s) retyped, "
+        f"{before / 1e6:.2f} MB -> {after / 1e6:.2f} MB."
+    )
+    return df
+
+
+def dtype_plan_report_fields(memory: dict) -> dict:
+    """Quality-report columns describing the dtype plan saving ('memory' as in df.attrs)."""
+    if not memory or not memory.get("before"):
+        return {
+            "memory_bytes_before_dtype_plan": "N/A",
+            "memory_bytes_after_dtype_plan": "N/A",
+            "memory_saving_pct": "N/A",
+        }
+    return {
+        "memory_bytes_before_dtype_plan": memory["before"],
+        "memory_bytes_after_dtype_plan": memory["after"],
+        "memory_saving_pct": round(100 * (1 - memory["after"] / memory["before"]), 1),
+    }
+
+
+def rows_to_dataframe(flattened_data: list, error_count: int, desc: str) -> pd.DataFrame:
+    """Builds the DataFrame from flattened rows (shared by the serial and parallel paths)."""
     if error_count > 0:
         logger.error(f"{error_count} records failed to flatten during {desc} creation.")
     if not flattened_data:
@@ -566,30 +945,151 @@ def create_dataframe(
     df = pd.DataFrame(flattened_data)
     if "_flattening_error" in df.columns:
         df = df.drop(columns=["_flattening_error"])
-    df = df.convert_dtypes()
+    df = apply_dtype_plan(df, desc)
     logger.info(
         f"Created DataFrame for {desc} with {len(df)} records and {len(df.columns)} columns."
     )
     return df
 
 
-def create_reviews_dataframe(item_objs: list) -> pd.DataFrame:  # Takes list of items
-    """Creates DataFrame for reviews, handling nested list structure."""
+def create_dataframe(
+    item_objs: list, flatten_func: callable, desc: str
+) -> pd.DataFrame:  # Takes list of items now
+    """Creates DataFrame by applying flattening function to item objects, skipping errors."""
+    flattened_data, error_count = flatten_items(item_objs, flatten_func)
+    return rows_to_dataframe(flattened_data, error_count, desc)
+
+
+def pop_nested_profiles(main_df: pd.DataFrame) -> dict:
+    """
+    Removes NESTED_PROFILES_COLUMN from a (deduplicated) main profiles DataFrame and returns its
+    sub-profile rows grouped by type, in main row order: {sub_profile_type: [rows]}.
+    """
+    nested_profiles_data = {}
+    if NESTED_PROFILES_COLUMN not in main_df.columns:
+        return nested_profiles_data
+    for nested_data_for_row in main_df.pop(NESTED_PROFILES_COLUMN):
+        for sub_type, flat_dict_list in nested_data_for_row.items():
+            nested_profiles_data.setdefault(sub_type, []).extend(flat_dict_list)
+    return nested_profiles_data
+
+
+def pop_json_lengths(df: pd.DataFrame):
+    """
+    Removes JSON_LENGTHS_COLUMN from a DataFrame and returns the item counts recorded at flatten
+    time as a DataFrame (one column per *_json column, same index), or None if it is absent.
+    """
+    if JSON_LENGTHS_COLUMN not in df.columns:
+        return None
+    return pd.DataFrame.from_records(
+        [lengths if isinstance(lengths, dict) else {} for lengths in df.pop(JSON_LENGTHS_COLUMN)],
+        index=df.index,
+    )
+
+
+def extract_reviews_list(data_level: dict) -> list:
+    """
+    Returns the list of review objects from one loaded review file. Supports both layouts:
+      - per-caregiver document (reviews/caregivers/<id>.json, format "caregiver_reviews")
+      - legacy per-page API response (reviews/<careType>/<id>_<careType>_<page>.json)
+    """
+    if data_level.get("format") == "caregiver_reviews":
+        return data_level.get("reviews", [])
+    payload_level = data_level.get("data", {}) or {}
+    review_payload = payload_level.get("reviewsByReviewee", {}) or {}
+    return review_payload.get("reviews", [])
+
+
+SEEN_KEYS_MEMORY_LIMIT = 5_000_000  # Digests kept in memory before SeenKeySet spills to disk
+
+
+class SeenKeySet:
+    """
+    Set of keys already seen, kept compact as 16-byte BLAKE2b digests. The first 'max_in_memory'
+    digests live in a Python set; the rest go to a temporary SQLite file (removed by close()),
+    so very large corpora do not grow memory without bound.
+    """
+
+    def __init__(self, max_in_memory: int = None, spill_path: Path = None):
+        self.max_in_memory = max_in_memory or SEEN_KEYS_MEMORY_LIMIT
+        self.spill_path = spill_path
+        self._memory = set()
+        self._db = None
+        self._count = 0
+
+    @staticmethod
+    def _digest(key) -> bytes:
+        return hashlib.blake2b(str(key).encode("utf-8"), digest_size=16).digest()
+
+    def _spilled(self, digest: bytes) -> bool:
+        return (
+            self._db is not None
+            and self._db.execute("SELECT 1 FROM seen WHERE k = ?", (digest,)).fetchone() is not None
+        )
+
+    def __contains__(self, key) -> bool:
+        digest = self._digest(key)
+        return digest in self._memory or self._spilled(digest)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, key) -> bool:
+        """Adds 'key'; returns False if it was already present."""
+        digest = self._digest(key)
+        if digest in self._memory or self._spilled(digest):
+            return False
+        if len(self._memory) < self.max_in_memory:
+            self._memory.add(digest)
+        else:
+            if self._db is None:
+                if self.spill_path is None:
+                    handle, spill_file = tempfile.mkstemp(suffix=".sqlite", prefix="seen_keys_")
+                    os.close(handle)
+                    self.spill_path = Path(spill_file)
+                self._db = sqlite3.connect(str(self.spill_path))
+                self._db.execute("CREATE TABLE IF NOT EXISTS seen (k BLOB PRIMARY KEY)")
+                self._db.execute("DELETE FROM seen")
+                logger.info(f"Seen-key set exceeded {self.max_in_memory} keys; spilling to {self.spill_path}")
+            self._db.execute("INSERT INTO seen (k) VALUES (?)", (digest,))
+        self._count += 1
+        return True
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            try:
+                self.spill_path.unlink()
+            except OSError:
+                pass
+
+
+def flatten_review_items(item_objs: list, seen: SeenKeySet = None) -> tuple:
+    """
+    Flattens every review of the given review file items. Returns (rows, error count).
+    With 'seen', reviews whose id is missing or already flattened (in this or an earlier call)
+    are skipped before flattening; the kept rows are exactly the first occurrences that
+    dropna + drop_duplicates(subset=["review_id"]) would keep.
+    """
     all_reviews = []
     error_count = 0
+    skipped_count = 0
     for item in item_objs:  # item is {"filename":..., "data":..., "zip_code":...}
         filename = item["filename"]
         zip_code = item["zip_code"]  # Get zip_code
         try:
             data_level = item.get("data", {})
-            payload_level = data_level.get("data", {})
-            review_payload = payload_level.get("reviewsByReviewee", {})
-            reviews_list = review_payload.get("reviews", [])
+            reviews_list = extract_reviews_list(data_level)
             if not isinstance(reviews_list, list):
                 logger.warning(f"Reviews not a list in {filename}.")
                 continue
             for review_obj in reviews_list:
                 if isinstance(review_obj, dict):
+                    review_id = review_obj.get("id")
+                    if seen is not None and (review_id is None or review_id in seen):
+                        skipped_count += 1
+                        continue
                     # Create item-like structure for flatten_review
                     review_item_data = {
                         "filename": filename,
@@ -603,6 +1103,8 @@ def create_reviews_dataframe(item_objs: list) -> pd.DataFrame:  # Takes list of
                         "_flattening_error"
                     ):
                         all_reviews.append(flat_review)
+                        if seen is not None:
+                            seen.add(review_id)
                     else:
                         error_count += 1
                 else:
@@ -612,19 +1114,267 @@ def create_reviews_dataframe(item_objs: list) -> pd.DataFrame:  # Takes list of
                 f"Error processing review payload {filename}: {e}\n{traceback.format_exc()}"
             )
             error_count += 1
-    if error_count > 0:
-        logger.error(f"{error_count} reviews failed to flatten.")
-    if not all_reviews:
-        logger.warning("No valid review data found.")
-        return pd.DataFrame()
-    df = pd.DataFrame(all_reviews)
-    if "_flattening_error" in df.columns:
-        df = df.drop(columns=["_flattening_error"])
-    df = df.convert_dtypes()
+    if skipped_count:
+        logger.info(f"Skipped {skipped_count} duplicate or id-less reviews before flattening.")
+    return all_reviews, error_count
+
+
+def create_reviews_dataframe(item_objs: list, seen: SeenKeySet = None) -> pd.DataFrame:
+    """Creates DataFrame for reviews, handling nested list structure.
+    'seen' enables early deduplication (see flatten_review_items)."""
+    all_reviews, error_count = flatten_review_items(item_objs, seen)
+    return rows_to_dataframe(all_reviews, error_count, "reviews")
+
+
+# --- Parallel Parse-and-Flatten ---
+# json.load + flattening is pure-Python and CPU bound, so with workers > 1 the raw files are handed
+# to a process pool. Each worker parses and flattens one file and only the flat rows travel back to
+# the parent. executor.map() returns results in submission order, so rows come out in exactly the
+# order of the serial path and the DataFrames (and every file written from them) are identical.
+PARALLEL_TASK_CHUNKSIZE = 32  # Files sent to a worker per round trip
+
+
+def parse_and_flatten_profile_file(task: tuple) -> tuple:
+    """Process-pool worker: (path, zip_code) -> (flattened main profile rows, error count)."""
+    file_path, zip_code = task
+    item = read_json_item(Path(file_path), zip_code)
+    if item is None:
+        return [], 0
+    return flatten_items([item], flatten_main_profile)
+
+
+def parse_and_flatten_review_file(task: tuple) -> tuple:
+    """Process-pool worker: (path, zip_code) -> (flattened review rows, error count)."""
+    file_path, zip_code = task
+    item = read_json_item(Path(file_path), zip_code)
+    if item is None:
+        return [], 0
+    return flatten_review_items([item])
+
+
+def flatten_files_parallel(tasks: list, worker: callable, executor) -> tuple:
+    """
+    Runs 'worker' over (path, zip_code) tasks on 'executor' (a ProcessPoolExecutor).
+    Returns (rows in task order, total error count).
+    """
+    rows = []
+    error_count = 0
+    for file_rows, file_errors in executor.map(worker, tasks, chunksize=PARALLEL_TASK_CHUNKSIZE):
+        rows.extend(file_rows)
+        error_count += file_errors
+    return rows, error_count
+
+
+# --- Incremental Mode ---
+# RAW_MANIFEST_FILE records every processed raw file: {path: {kind, partition (zip), size,
+# mtime_ns, sha256}}. The flattened rows of each file are cached per zip under
+# INCREMENTAL_CACHE_DIR/<kind>/<zip>.pkl as {path: rows}. A run hashes only files whose size or
+# mtime changed, re-flattens the new/changed ones, retracts the rows of deleted files, and then
+# rebuilds the full row list in scan order. Deduplication, checks and reports therefore run on the
+# same rows, in the same order, as a full rebuild. Blob store keys are recorded the same way
+# ({key: {kind, partition, sha256}}), and a blob already in the processed-blob ledger with
+# cached rows is not read at all.
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_raw_manifest() -> dict:
+    if not RAW_MANIFEST_FILE.is_file():
+        return {}
+    try:
+        with open(RAW_MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"Could not read raw-file manifest {RAW_MANIFEST_FILE} ({e}); doing a full rebuild.")
+        return {}
+
+
+def save_raw_manifest(manifest: dict) -> None:
+    tmp_file = RAW_MANIFEST_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, sort_keys=True)
+    os.replace(tmp_file, RAW_MANIFEST_FILE)
+
+
+def _partition_cache_file(kind: str, partition: str) -> Path:
+    return INCREMENTAL_CACHE_DIR / kind / f"{partition}.pkl"
+
+
+def _load_partition_cache(kind: str, partition: str) -> dict:
+    cache_file = _partition_cache_file(kind, partition)
+    if not cache_file.is_file():
+        return {}
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.error(f"Unreadable incremental cache {cache_file} ({e}); its files will be re-flattened.")
+        return {}
+
+
+def _save_partition_cache(kind: str, partition: str, rows_by_path: dict) -> None:
+    cache_file = _partition_cache_file(kind, partition)
+    if not rows_by_path:
+        if cache_file.exists():
+            cache_file.unlink()
+        return
+    ensure_dir_exists(cache_file.parent)
+    tmp_file = cache_file.with_suffix(".pkl.tmp")
+    with open(tmp_file, "wb") as f:
+        pickle.dump(rows_by_path, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+
+
+def flatten_files_incremental(
+    kind: str, tasks: list, manifest: dict, worker: callable, workers: int = 1
+) -> tuple:
+    """
+    Returns (rows of every (path, zip_code) task in task order, error count of the files
+    flattened in this run), re-flattening only files that are new or whose content changed.
+    Updates 'manifest' in place and rewrites the affected partition caches.
+    """
+    previous = {path: entry for path, entry in manifest.items() if entry.get("kind") == kind}
+    partitions = {zip_code for _, zip_code in tasks} | {e["partition"] for e in previous.values()}
+    caches = {partition: _load_partition_cache(kind, partition) for partition in partitions}
+    dirty = set()
+
+    current = {}
+    changed_tasks = []
+    for path, zip_code in tasks:
+        stat = os.stat(path)
+        entry = previous.get(path)
+        cached = entry is not None and path in caches.get(entry["partition"], {})
+        if cached and entry["partition"] == zip_code and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            current[path] = entry
+            continue
+        sha = file_sha256(path)
+        current[path] = {
+            "kind": kind,
+            "partition": zip_code,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha,
+        }
+        if cached and entry["partition"] == zip_code and entry["sha256"] == sha:
+            continue  # Touched but identical content
+        if entry is not None:
+            caches.get(entry["partition"], {}).pop(path, None)  # Retract the old rows
+            dirty.add(entry["partition"])
+        changed_tasks.append((path, zip_code))
+
+    deleted = [path for path in previous if path not in current]
+    for path in deleted:
+        partition = previous[path]["partition"]
+        caches.get(partition, {}).pop(path, None)
+        dirty.add(partition)
+
+    error_count = 0
+    if changed_tasks:
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=configure_logging) as executor:
+                results = list(executor.map(worker, changed_tasks, chunksize=PARALLEL_TASK_CHUNKSIZE))
+        else:
+            results = [worker(task) for task in changed_tasks]
+        for (path, zip_code), (file_rows, file_errors) in zip(changed_tasks, results):
+            caches[zip_code][path] = file_rows
+            dirty.add(zip_code)
+            error_count += file_errors
+
+    for partition in dirty:
+        _save_partition_cache(kind, partition, caches[partition])
+    for path in deleted:
+        del manifest[path]
+    manifest.update(current)
     logger.info(
-        f"Created DataFrame for reviews with {len(df)} records and {len(df.columns)} columns."
+        f"Incremental {kind}: {len(tasks)} files, {len(changed_tasks)} new/changed, "
+        f"{len(deleted)} deleted, {len(tasks) - len(changed_tasks)} unchanged "
+        f"({len(dirty)} partition(s) rewritten)."
     )
-    return df
+
+    rows = []
+    for path, zip_code in tasks:
+        rows.extend(caches[zip_code][path])
+    return rows, error_count
+
+
+def flatten_blobs_incremental(entries: list, manifest: dict) -> tuple:
+    """
+    Blob store counterpart of flatten_files_incremental() for the (store, key, zip_code, sha256)
+    'entries' of iter_blob_entries(): blobs already in the processed-blob ledger whose rows are
+    cached under the same key are not read again; the others are read, flattened and cached.
+    Returns (rows of every entry in entry order, error count, items of the blobs read), the
+    latter for mark_blobs_processed().
+    """
+    kind = "blob_profiles"
+    ledger = open_blob_ledger()
+    previous = {key: entry for key, entry in manifest.items() if entry.get("kind") == kind}
+    partitions = {zip_code for _, _, zip_code, _ in entries} | {e["partition"] for e in previous.values()}
+    caches = {partition: _load_partition_cache(kind, partition) for partition in partitions}
+    dirty = set()
+
+    current = {}
+    read_items = []
+    error_count = 0
+    for store, key, zip_code, sha in entries:
+        current[key] = {"kind": kind, "partition": zip_code, "sha256": sha}
+        entry = previous.get(key)
+        if (
+            entry is not None
+            and entry["partition"] == zip_code
+            and entry["sha256"] == sha
+            and sha in ledger
+            and key in caches[zip_code]
+        ):
+            continue
+        if entry is not None:
+            caches.get(entry["partition"], {}).pop(key, None)  # Retract the old rows
+            dirty.add(entry["partition"])
+        try:
+            item = {"filename": key, "data": store.get(sha), "zip_code": zip_code, "blob_sha256": sha}
+        except Exception as e:
+            logger.error(f"Error reading blob {sha} for {key}: {e}")
+            caches[zip_code][key] = []
+            error_count += 1
+            continue
+        caches[zip_code][key], item_errors = flatten_items([item], flatten_main_profile)
+        error_count += item_errors
+        dirty.add(zip_code)
+        read_items.append({"blob_sha256": sha})
+
+    deleted = [key for key in previous if key not in current]
+    for key in deleted:
+        partition = previous[key]["partition"]
+        caches.get(partition, {}).pop(key, None)
+        dirty.add(partition)
+
+    for partition in dirty:
+        _save_partition_cache(kind, partition, caches[partition])
+    for key in deleted:
+        del manifest[key]
+    manifest.update(current)
+    logger.info(
+        f"Incremental blobs: {len(entries)} keys, {len(read_items)} read, "
+        f"{len(entries) - len(read_items)} already processed, {len(deleted)} deleted."
+    )
+
+    rows = []
+    for _, key, zip_code, _ in entries:
+        rows.extend(caches[zip_code][key])
+    return rows, error_count, read_items
+
+
+def items_size(items: list) -> int:
+    """Bytes read from disk for loaded raw items (see read_json_item)."""
+    return sum(item.get("size_bytes", 0) for item in items)
+
+
+def tasks_size(tasks: list) -> int:
+    """Bytes of the raw files behind (path, zip_code) tasks, read by the workers."""
+    return sum(os.path.getsize(path) for path, _ in tasks if os.path.isfile(path))
 
 
 # --- Pandera Schemas (Explicit Core Fields, Non-Strict for Dynamic Nested) ---
@@ -634,9 +1384,9 @@ main_profile_schema = DataFrameSchema(
             str, nullable=False, unique=True
         ),  # Expect this to be non-null after fixing potential issues
         "source_filename": Column(str, nullable=False),
-        "zip_code": Column(str, nullable=False),  # Added zip_code
+        "zip_code": Column("category", nullable=False),  # Added zip_code
         "member_firstName": Column(str, nullable=True, coerce=True),
-        "member_gender": Column(str, nullable=True, coerce=True),
+        "member_gender": Column("category", nullable=True, coerce=True),
         "member_isPremium": Column(bool, nullable=True, coerce=True),
         "yearsOfExperience": Column(
             float, nullable=True, coerce=True
@@ -651,8 +1401,8 @@ main_profile_schema = DataFrameSchema(
 nested_profile_schema = DataFrameSchema(
     {
         "profile_id": Column(str, nullable=False),
-        "sub_profile_type": Column(str, nullable=False),
-        "zip_code": Column(str, nullable=False),  # Added zip_code
+        "sub_profile_type": Column("category", nullable=False),
+        "zip_code": Column("category", nullable=False),  # Added zip_code
         # Known simple fields (examples)
         "commonCaregiverProfile_id": Column(
             str, nullable=True, coerce=True, required=False
@@ -676,7 +1426,7 @@ review_schema = DataFrameSchema(
     {
         "review_id": Column(str, nullable=False, unique=True),
         "profile_id": Column(str, nullable=True),  # Allow null if link failed initially
-        "zip_code": Column(str, nullable=False),  # Added zip_code
+        "zip_code": Column("category", nullable=False),  # Added zip_code
         "createTime": Column("datetime64[ns]", nullable=True, coerce=True),
         "verifiedByCare": Column(bool, nullable=True, coerce=True),
         "ratings_json": Column(str, nullable=True),
@@ -701,40 +1451,168 @@ def safe_json_load(json_string):
         return []
 
 
-def run_quality_checks_and_report(
-    df: pd.DataFrame, schema: DataFrameSchema, df_name: str, output_dir: Path
-) -> pd.DataFrame:
-    """Performs validation, calculates quality metrics, saves report/validated data."""
-    logger.info(f"--- Running Quality Checks for {df_name} ({len(df)} rows) ---")
-    if df.empty:
-        logger.warning(f"DataFrame '{df_name}' is empty.")
-        return df
+VALIDATION_CHUNK_ROWS = 50_000  # Frames larger than this are validated in row chunks
+
+
+def log_validation_failure(df_name: str, failure_cases: pd.DataFrame) -> None:
+    logger.error(f"Schema validation FAILED for {df_name}.")
+    try:
+        error_details = failure_cases.to_dict(orient="records")
+        logger.error(
+            f"Validation Failure Cases (sample):\n{json.dumps(error_details[:5], indent=2, default=str)}"
+        )
+    except Exception as json_err:
+        logger.error(f"Could not serialize validation errors: {json_err}")
+        logger.error(f"Pandera failure cases head:\n{failure_cases.head()}")
+    logger.warning(f"Proceeding with checks on *original* {df_name} DataFrame.")
 
-    logger.info(f"Data types PRE-validation for {df_name}:\n{df.dtypes.value_counts()}")
 
+def validate_whole(df: pd.DataFrame, schema: DataFrameSchema, df_name: str) -> tuple:
+    """
+    Validates (and coerces) a copy of the whole frame in one pandera call.
+    Returns (validated_df, failure_cases or None); on failure validated_df is the original df.
+    """
     validated_df, validation_errors = df, None
     try:
         validated_df = schema.validate(df.copy(), lazy=True)
         logger.info(f"Schema validation PASSED for {df_name}.")
     except pa.errors.SchemaErrors as err:
-        logger.error(f"Schema validation FAILED for {df_name}.")
-        try:
-            error_details = err.failure_cases.to_dict(orient="records")
-            logger.error(
-                f"Validation Failure Cases (sample):\n{json.dumps(error_details[:5], indent=2, default=str)}"
-            )
-            validation_errors = err.failure_cases
-        except Exception as json_err:
-            logger.error(f"Could not serialize validation errors: {json_err}")
-            logger.error(f"Pandera failure cases head:\n{err.failure_cases.head()}")
-            validation_errors = err.failure_cases
-        logger.warning(f"Proceeding with checks on *original* {df_name} DataFrame.")
+        validation_errors = err.failure_cases
+        log_validation_failure(df_name, validation_errors)
         validated_df = df  # Use original for reporting
     except Exception as verr:
         logger.error(
             f"Unexpected error during Pandera validation for {df_name}: {verr}\n{traceback.format_exc()}"
         )
         validated_df = df
+    return validated_df, validation_errors
+
+
+def validate_in_chunks(
+    df: pd.DataFrame,
+    schema: DataFrameSchema,
+    df_name: str,
+    workers: int = 1,
+    chunk_rows: int = None,
+) -> tuple:
+    """
+    Same contract as validate_whole() without copying the frame:
+      1) the schema's columns are coerced one by one (only those columns are materialized),
+      2) row chunks of the coerced schema columns are checked on 'workers' threads with a
+         check-only copy of the schema (no coercion, no per-chunk uniqueness),
+      3) column uniqueness is checked once on the full column,
+      4) failure cases of all chunks are merged (frame-level ones, e.g. a missing column, once).
+    If validation passes the coerced columns replace the originals in 'df' in place; if a column
+    cannot be coerced it falls back to validate_whole().
+    """
+    chunk_rows = chunk_rows or VALIDATION_CHUNK_ROWS
+    coerced = {}
+    for name, column in schema.columns.items():
+        if name in df.columns and (column.coerce or schema.coerce):
+            try:
+                coerced[name] = column.coerce_dtype(df[name])
+            except pa.errors.SchemaError as coerce_err:
+                logger.warning(
+                    f"Could not coerce {df_name}.{name} ({coerce_err}); validating the whole frame."
+                )
+                return validate_whole(df, schema, df_name)
+    check_frame = pd.DataFrame(
+        {name: coerced.get(name, df[name]) for name in schema.columns if name in df.columns},
+        index=df.index,
+    )
+    check_schema = schema.update_columns(
+        {name: {"coerce": False, "unique": False} for name in schema.columns}
+    )
+    check_schema.coerce = False
+
+    def validate_chunk(start: int):
+        try:
+            check_schema.validate(check_frame.iloc[start : start + chunk_rows], lazy=True, inplace=True)
+            return None
+        except pa.errors.SchemaErrors as err:
+            return err.failure_cases
+
+    starts = range(0, len(check_frame), chunk_rows)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunk_failures = list(executor.map(validate_chunk, starts))
+    else:
+        chunk_failures = [validate_chunk(start) for start in starts]
+    failures = [f for f in chunk_failures if f is not None]
+
+    for name, column in schema.columns.items():
+        if column.unique and name in check_frame.columns:
+            values = check_frame[name]
+            duplicated = values[values.notna() & values.duplicated(keep=False)]
+            if not duplicated.empty:
+                failures.append(
+                    pd.DataFrame(
+                        {
+                            "schema_context": "Column",
+                            "column": name,
+                            "check": "field_uniqueness",
+                            "check_number": None,
+                            "failure_case": duplicated.astype(str).tolist(),
+                            "index": duplicated.index.tolist(),
+                        }
+                    )
+                )
+
+    if failures:
+        validation_errors = pd.concat(failures, ignore_index=True)
+        frame_level = validation_errors["index"].isna()
+        validation_errors = validation_errors[
+            ~(
+                frame_level
+                & validation_errors.duplicated(
+                    subset=["schema_context", "column", "check", "failure_case"]
+                )
+            )
+        ].reset_index(drop=True)
+        log_validation_failure(df_name, validation_errors)
+        return df, validation_errors
+
+    for name, values in coerced.items():
+        df[name] = values
+    logger.info(
+        f"Schema validation PASSED for {df_name} ({len(starts)} chunk(s) of {chunk_rows} rows)."
+    )
+    return df, None
+
+
+def run_quality_checks_and_report(
+    df: pd.DataFrame,
+    schema: DataFrameSchema,
+    df_name: str,
+    output_dir: Path,
+    json_lengths: pd.DataFrame = None,
+    workers: int = 1,
+    instrumentation: RunInstrumentation = None,
+) -> pd.DataFrame:
+    """Performs validation, calculates quality metrics, saves report/validated data.
+    JSON item counts come from 'json_lengths' (or the flatten-time JSON_LENGTHS_COLUMN) when
+    available; frames above VALIDATION_CHUNK_ROWS rows, or any frame when workers > 1, are
+    validated with validate_in_chunks(). Validation and writing are recorded as
+    'validate:<df_name>' and 'write:<df_name>' spans of 'instrumentation'."""
+    instrumentation = instrumentation or RunInstrumentation(df_name)
+    logger.info(f"--- Running Quality Checks for {df_name} ({len(df)} rows) ---")
+    if JSON_LENGTHS_COLUMN in df.columns:
+        flatten_lengths = pop_json_lengths(df)
+        json_lengths = json_lengths if json_lengths is not None else flatten_lengths
+    if df.empty:
+        logger.warning(f"DataFrame '{df_name}' is empty.")
+        return df
+
+    logger.info(f"Data types PRE-validation for {df_name}:\n{df.dtypes.value_counts()}")
+
+    with instrumentation.span(f"validate:{df_name}", rows_in=len(df)) as span:
+        if workers > 1 or len(df) > VALIDATION_CHUNK_ROWS:
+            validated_df, validation_errors = validate_in_chunks(df, schema, df_name, workers)
+        else:
+            validated_df, validation_errors = validate_whole(df, schema, df_name)
+        span.rows_out = len(validated_df)
+    if validation_errors is not None:
+        instrumentation.count(f"validation_errors:{df_name}", len(validation_errors))
 
     report = {
         "dataframe_name": df_name,
@@ -745,6 +1623,7 @@ def run_quality_checks_and_report(
             len(validation_errors) if validation_errors is not None else 0
         ),
     }
+    report.update(dtype_plan_report_fields(df.attrs.get(DTYPE_PLAN_MEMORY_ATTR)))
     missing_counts = validated_df.isnull().sum()
     report["missing_values_summary"] = json.dumps(
         missing_counts[missing_counts > 0].apply(int).to_dict()
@@ -768,7 +1647,15 @@ def run_quality_checks_and_report(
     for col in json_string_cols:
         try:
             if col in validated_df and not validated_df[col].dropna().empty:
-                lengths = validated_df[col].apply(safe_json_load).apply(len)
+                counted = (
+                    json_lengths[col]
+                    if json_lengths is not None and col in json_lengths.columns
+                    else None
+                )
+                if counted is not None and not counted[validated_df[col].notna()].isna().any():
+                    lengths = counted.fillna(0)
+                else:
+                    lengths = validated_df[col].apply(safe_json_load).apply(len)
                 json_len_summary[col] = {
                     "mean_items": round(lengths.mean(), 2),
                     "max_items": int(lengths.max()),
@@ -831,8 +1718,14 @@ def run_quality_checks_and_report(
         output_data_file = output_dir / f"{df_name}_processed.csv"
         # Use validated_df if validation passed, otherwise original df might be more complete
         df_to_save = validated_df if validation_errors is None else df
-        df_to_save.to_csv(output_data_file, index=False, encoding="utf-8")
-        logger.info(f"Processed data saved to: {output_data_file}")
+        with instrumentation.span(f"write:{df_name}", rows_in=len(df_to_save)) as span:
+            df_to_save.to_csv(output_data_file, index=False, encoding="utf-8")
+            logger.info(f"Processed data saved to: {output_data_file}")
+            write_parquet_dataset(df_to_save, df_name, output_dir)
+            span.rows_out = len(df_to_save)
+            span.bytes_written = path_size(output_data_file) + path_size(
+                parquet_dataset_dir(output_dir, df_name)
+            )
         if validation_errors is not None:
             error_file = output_dir / f"validation_errors_{df_name}.csv"
             validation_errors.to_csv(error_file, index=False, encoding="utf-8")
@@ -846,9 +1739,542 @@ def run_quality_checks_and_report(
     return validated_df  # Return the validated df
 
 
-def print_proposed_data_model():
-    """Prints the proposed relational data model (hybrid flattening)."""
-    model = """
+# --- Typed Parquet Intermediate ---
+# Next to every <name>_processed.csv the checks write <name>_processed.parquet/, a Parquet dataset
+# partitioned by zip (zip_code=<zip>/part-*.parquet). Scalar columns keep their pandas types and the
+# *_json columns are stored as native Arrow list/struct columns, so sql_modeling.run_etl reads them
+# without CSV type inference or per-row json.loads. A *_json column stays a JSON string when its
+# values have no Arrow equivalent (mixed types, or only empty objects, which Parquet cannot store).
+# pyarrow is optional: without it only the CSV files are written.
+PARQUET_PARTITION_COL = "zip_code"
+
+
+def parquet_dataset_dir(output_dir: Path, df_name: str) -> Path:
+    return output_dir / f"{df_name}_processed.parquet"
+
+
+def _has_empty_struct(arrow_type) -> bool:
+    """True if 'arrow_type' is, or contains, a struct with no fields (not storable in Parquet)."""
+    import pyarrow as pa
+
+    if pa.types.is_struct(arrow_type):
+        return arrow_type.num_fields == 0 or any(
+            _has_empty_struct(arrow_type.field(i).type) for i in range(arrow_type.num_fields)
+        )
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return _has_empty_struct(arrow_type.value_type)
+    return False
+
+
+def to_arrow_table(df: pd.DataFrame):
+    """Converts a processed DataFrame to an Arrow table with native nested *_json columns."""
+    import pyarrow as pa
+
+    json_cols = [c for c in df.columns if c.endswith("_json")]
+    table = pa.Table.from_pandas(df.drop(columns=json_cols), preserve_index=False)
+    for col in json_cols:
+        values = [
+            json.loads(v) if isinstance(v, str) and v else None for v in df[col].tolist()
+        ]
+        try:
+            array = pa.array(values)
+            if _has_empty_struct(array.type):
+                raise TypeError("empty struct")
+        except (pa.ArrowException, TypeError, ValueError):
+            array = pa.array(df[col].astype(object).where(df[col].notna(), None).tolist(), pa.string())
+        table = table.append_column(col, array)
+    return table.select(list(df.columns))
+
+
+def write_parquet_dataset(df: pd.DataFrame, df_name: str, output_dir: Path, part: int = 0) -> None:
+    """
+    Writes 'df' to <output_dir>/<df_name>_processed.parquet/, partitioned by zip_code.
+    part=0 replaces the dataset; higher part numbers append (streaming mode).
+    """
+    if df.empty or PARQUET_PARTITION_COL not in df.columns:
+        return
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        if part == 0:
+            logger.warning(f"pyarrow not installed; skipping Parquet output for {df_name}.")
+        return
+    dataset_dir = parquet_dataset_dir(output_dir, df_name)
+    try:
+        if part == 0 and dataset_dir.exists():
+            shutil.rmtree(dataset_dir)
+        pq.write_to_dataset(
+            to_arrow_table(df),
+            root_path=str(dataset_dir),
+            partition_cols=[PARQUET_PARTITION_COL],
+            basename_template=f"part-{part:05d}-{{i}}.parquet",
+        )
+        if part == 0:
+            logger.info(f"Parquet dataset saved to: {dataset_dir}")
+    except Exception as e:
+        logger.error(f"Failed to write Parquet dataset for {df_name}: {e}\n{traceback.format_exc()}")
+
+
+# --- Streaming (Chunked) Mode ---
+# Loading, flattening, deduplication and validation run on bounded chunks of raw items; each
+# processed chunk is appended to the output tables, so peak memory follows the chunk size
+# instead of the number of zips. Only primary keys are kept across chunks (for deduplication).
+DEFAULT_CHUNK_SIZE = 2000  # Raw items (profile files / review files) per chunk
+
+
+def iter_chunks(iterable, chunk_size: int):
+    """Yields lists of at most chunk_size items from any iterable."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_zip_dirs():
+    """Yields (zip_code, zip_dir) for every zip code directory under COUNTRY_RAW_DIR."""
+    for zip_dir in COUNTRY_RAW_DIR.iterdir():
+        if zip_dir.is_dir() and zip_dir.name.isdigit():
+            yield zip_dir.name, zip_dir
+
+
+def iter_profile_items(blob_hashes: list = None):
+    """
+    Yields every raw profile item (zip directories, then blob store, then lake) in the same order
+    run_quality() loads them. Hashes of blob items are appended to 'blob_hashes' if given.
+    """
+    for zip_code, zip_dir in iter_zip_dirs():
+        yield from iter_json_files(zip_dir / "all_profiles", zip_code)
+    yield from iter_stored_profile_items(blob_hashes)
+
+
+def iter_stored_profile_items(blob_hashes: list = None):
+    """Profile items that do not come from plain files: blob store, then lake."""
+    for item in iter_blob_items(BLOB_STORE_DIR, "all_profiles"):
+        if blob_hashes is not None:
+            blob_hashes.append(item["blob_sha256"])
+        yield item
+    yield from iter_lake_items(LAKE_DIR, "profiles")
+
+
+def iter_review_type_dirs():
+    """Yields (zip_code, review type directory) for every zip code, in load order."""
+    for zip_code, zip_dir in iter_zip_dirs():
+        reviews_dir = zip_dir / "reviews"
+        if not reviews_dir.is_dir():
+            logger.warning(f"Reviews directory not found for zip {zip_code}: {reviews_dir}")
+            continue
+        for type_dir in reviews_dir.iterdir():
+            if type_dir.is_dir():
+                yield zip_code, type_dir
+
+
+def iter_review_items():
+    """Yields every raw review file item (all zips, all review sub-directories)."""
+    for zip_code, type_dir in iter_review_type_dirs():
+        yield from iter_json_files(type_dir, zip_code)
+
+
+def iter_profile_file_tasks():
+    """(path, zip_code) tasks for the parallel workers, in the order iter_profile_items() reads files."""
+    for zip_code, zip_dir in iter_zip_dirs():
+        for file_path in iter_json_paths(zip_dir / "all_profiles"):
+            yield str(file_path), zip_code
+
+
+def iter_review_file_tasks():
+    """(path, zip_code) tasks for the parallel workers, in the order iter_review_items() reads files."""
+    for zip_code, type_dir in iter_review_type_dirs():
+        for file_path in iter_json_paths(type_dir):
+            yield str(file_path), zip_code
+
+
+def iter_main_profile_frames(chunk_size: int, blob_hashes: list = None, executor=None):
+    """
+    Yields flattened main-profile DataFrames of at most 'chunk_size' raw items each. With an
+    executor, profile files are parsed and flattened in the pool; stored (blob/lake) items are
+    already in memory and are flattened here.
+    """
+    chunk_number = 0
+    if executor is None:
+        for chunk in iter_chunks(iter_profile_items(blob_hashes), chunk_size):
+            yield create_dataframe(chunk, flatten_main_profile, f"main_profiles chunk {chunk_number}")
+            chunk_number += 1
+        return
+    for tasks in iter_chunks(iter_profile_file_tasks(), chunk_size):
+        rows, error_count = flatten_files_parallel(tasks, parse_and_flatten_profile_file, executor)
+        yield rows_to_dataframe(rows, error_count, f"main_profiles chunk {chunk_number}")
+        chunk_number += 1
+    for chunk in iter_chunks(iter_stored_profile_items(blob_hashes), chunk_size):
+        yield create_dataframe(chunk, flatten_main_profile, f"main_profiles chunk {chunk_number}")
+        chunk_number += 1
+
+
+def iter_review_frames(chunk_size: int, executor=None, seen: SeenKeySet = None):
+    """Review counterpart of iter_main_profile_frames(). Without an executor, reviews already in
+    'seen' are skipped before flattening."""
+    if executor is None:
+        for chunk in iter_chunks(iter_review_items(), chunk_size):
+            yield create_reviews_dataframe(chunk, seen)
+        return
+    for tasks in iter_chunks(iter_review_file_tasks(), chunk_size):
+        rows, error_count = flatten_files_parallel(tasks, parse_and_flatten_review_file, executor)
+        yield rows_to_dataframe(rows, error_count, "reviews")
+
+
+def drop_seen_keys(df: pd.DataFrame, key_cols: list, seen: set, df_name: str) -> pd.DataFrame:
+    """
+    Chunk-level deduplication against every earlier chunk: drops rows with a null key, duplicate
+    keys within the chunk (keeping the first) and keys already in 'seen', then records the new keys.
+    """
+    if df.empty:
+        return df
+    missing = [c for c in key_cols if c not in df.columns]
+    if missing:
+        logger.error(f"Key column(s) {missing} not found in {df_name} chunk! Cannot deduplicate.")
+        return df
+    initial_count = len(df)
+    df = df.dropna(subset=key_cols)
+    keys = list(zip(*(df[c].astype(str) for c in key_cols)))
+    keep = []
+    for key in keys:
+        if key in seen:
+            keep.append(False)
+        else:
+            seen.add(key)
+            keep.append(True)
+    df = df[keep]
+    dropped = initial_count - len(df)
+    if dropped > 0:
+        logger.info(f"Dropped {dropped} null/duplicate rows on {key_cols} in {df_name} chunk.")
+    return df
+
+
+class StreamingQualityReport:
+    """
+    Incremental counterpart of run_quality_checks_and_report() for one output table.
+
+    Each add(chunk) validates the chunk, accumulates the report metrics and appends the rows to a
+    part file; finalize() aligns all parts on the union of their columns (nested tables have
+    dynamic columns), writes <name>_processed.csv chunk by chunk and saves the quality report and
+    validation errors. Numeric stats are exact for count/mean/std/min/max; quartiles are not
+    computed in streaming mode.
+    """
+
+    def __init__(
+        self,
+        df_name: str,
+        schema: DataFrameSchema,
+        output_dir: Path,
+        instrumentation: RunInstrumentation = None,
+    ):
+        self.df_name = df_name
+        self.schema = schema
+        self.output_dir = output_dir
+        self.instrumentation = instrumentation or RunInstrumentation(df_name)
+        self.parts_dir = output_dir / "_parts" / df_name
+        self.columns = []  # Union of columns, first-seen order
+        self.part_files = []
+        self.total_rows = 0
+        self.chunks_failed_validation = 0
+        self.validation_error_count = 0
+        self.missing_counts = {}
+        self.rows_with_column = {}
+        self.numeric = {}  # col -> [count, sum, sum_sq, min, max]
+        self.json_lengths = {}  # col -> [count, total_items, max_items]
+        self.dtype_plan_memory = {"before": 0, "after": 0}
+        self.errors_file = output_dir / f"validation_errors_{df_name}.csv"
+        ensure_dir_exists(self.parts_dir)
+        for old_part in self.parts_dir.glob("part-*.csv"):
+            old_part.unlink()
+        if self.errors_file.exists():
+            self.errors_file.unlink()
+
+    def add(self, df: pd.DataFrame) -> None:
+        json_lengths = pop_json_lengths(df)
+        if df.empty:
+            return
+        for key, value in df.attrs.get(DTYPE_PLAN_MEMORY_ATTR, {}).items():
+            self.dtype_plan_memory[key] += value
+        validated_df, validation_errors = df, None
+        with self.instrumentation.span(f"validate:{self.df_name}", rows_in=len(df)) as span:
+            try:
+                validated_df = self.schema.validate(df.copy(), lazy=True)
+            except pa.errors.SchemaErrors as err:
+                validation_errors = err.failure_cases
+                validated_df = df
+            except Exception as verr:
+                logger.error(
+                    f"Unexpected error during Pandera validation for {self.df_name} chunk: {verr}\n{traceback.format_exc()}"
+                )
+                validated_df = df
+            span.rows_out = len(validated_df)
+
+        if validation_errors is not None:
+            self.chunks_failed_validation += 1
+            self.validation_error_count += len(validation_errors)
+            self.instrumentation.count(f"validation_errors:{self.df_name}", len(validation_errors))
+            validation_errors.to_csv(
+                self.errors_file,
+                mode="a",
+                header=not self.errors_file.exists(),
+                index=False,
+                encoding="utf-8",
+            )
+
+        # Missing values
+        for col, count in validated_df.isnull().sum().items():
+            self.missing_counts[col] = self.missing_counts.get(col, 0) + int(count)
+            self.rows_with_column[col] = self.rows_with_column.get(col, 0) + len(validated_df)
+
+        # Numeric stats (running moments)
+        for col in validated_df.select_dtypes(include=["number"]).columns:
+            values = pd.to_numeric(validated_df[col], errors="coerce").dropna().astype(float)
+            if values.empty:
+                continue
+            acc = self.numeric.setdefault(col, [0, 0.0, 0.0, float("inf"), float("-inf")])
+            acc[0] += len(values)
+            acc[1] += float(values.sum())
+            acc[2] += float((values**2).sum())
+            acc[3] = min(acc[3], float(values.min()))
+            acc[4] = max(acc[4], float(values.max()))
+
+        # JSON list/dict lengths (counted at flatten time when available)
+        for col in [c for c in validated_df.columns if c.endswith("_json")]:
+            counted = json_lengths[col] if json_lengths is not None and col in json_lengths else None
+            if counted is not None and not counted[validated_df[col].notna()].isna().any():
+                lengths = counted.fillna(0)
+            else:
+                lengths = validated_df[col].apply(safe_json_load).apply(len)
+            acc = self.json_lengths.setdefault(col, [0, 0, 0])
+            acc[0] += len(lengths)
+            acc[1] += int(lengths.sum())
+            acc[2] = max(acc[2], int(lengths.max()) if len(lengths) else 0)
+
+        for col in validated_df.columns:
+            if col not in self.columns:
+                self.columns.append(col)
+        part_file = self.parts_dir / f"part-{len(self.part_files):05d}.csv"
+        with self.instrumentation.span(f"write_parts:{self.df_name}", rows_in=len(validated_df)) as span:
+            validated_df.to_csv(part_file, index=False, encoding="utf-8")
+            write_parquet_dataset(validated_df, self.df_name, self.output_dir, len(self.part_files))
+            span.rows_out = len(validated_df)
+            span.bytes_written = path_size(part_file)
+        self.part_files.append(part_file)
+        self.total_rows += len(validated_df)
+
+    def finalize(self) -> dict:
+        """Writes the processed CSV and quality report; returns the report dict."""
+        if not self.part_files:
+            logger.warning(f"Streaming table '{self.df_name}' is empty.")
+            return {}
+        output_data_file = self.output_dir / f"{self.df_name}_processed.csv"
+        first = True
+        with self.instrumentation.span(f"write:{self.df_name}", rows_in=self.total_rows) as span:
+            for part_file in self.part_files:
+                # Read parts back as exact text so values are written out unchanged
+                for part_chunk in pd.read_csv(
+                    part_file, dtype=str, keep_default_na=False, chunksize=DEFAULT_CHUNK_SIZE
+                ):
+                    part_chunk = part_chunk.reindex(columns=self.columns)
+                    part_chunk.to_csv(
+                        output_data_file,
+                        mode="w" if first else "a",
+                        header=first,
+                        index=False,
+                        encoding="utf-8",
+                    )
+                    first = False
+                part_file.unlink()
+            span.rows_out = self.total_rows
+            span.bytes_written = path_size(output_data_file)
+        for directory in (self.parts_dir, self.parts_dir.parent):
+            try:
+                directory.rmdir()  # Only succeeds once empty
+            except OSError:
+                pass
+        logger.info(f"Processed data saved to: {output_data_file}")
+
+        stats_summary = {}
+        for col, (count, total, total_sq, min_val, max_val) in self.numeric.items():
+            mean = total / count
+            variance = (total_sq - total * total / count) / (count - 1) if count > 1 else float("nan")
+            stats_summary[col] = {
+                "count": count,
+                "mean": round(mean, 2),
+                "std": round(max(variance, 0.0) ** 0.5, 2) if count > 1 else None,
+                "min": round(min_val, 2),
+                "max": round(max_val, 2),
+            }
+        json_len_summary = {
+            col: {
+                "mean_items": round(total / count, 2) if count else 0,
+                "max_items": max_items,
+                "total_items": total,
+            }
+            for col, (count, total, max_items) in self.json_lengths.items()
+        }
+        # A column absent from some chunks is missing for all rows of those chunks
+        missing = {}
+        for col in self.columns:
+            missing_count = self.missing_counts.get(col, 0) + (
+                self.total_rows - self.rows_with_column.get(col, 0)
+            )
+            if missing_count > 0:
+                missing[col] = missing_count
+        report = {
+            "dataframe_name": self.df_name,
+            "total_rows": self.total_rows,
+            "total_columns": len(self.columns),
+            "schema_validation_passed": self.chunks_failed_validation == 0,
+            "validation_error_count": self.validation_error_count,
+            **dtype_plan_report_fields(self.dtype_plan_memory),
+            "missing_values_summary": json.dumps(missing),
+            "numeric_column_stats": json.dumps(stats_summary, default=str),
+            "json_string_column_stats": json.dumps(json_len_summary, default=str),
+            "duplicate_pk_rows": 0,  # Deduplicated across chunks before reaching the report
+            "processing_mode": "streaming",
+            "chunks": len(self.part_files),
+        }
+        report_file = self.output_dir / f"quality_report_{self.df_name}.csv"
+        pd.DataFrame([report]).to_csv(report_file, index=False, encoding="utf-8")
+        logger.info(f"Quality report saved to: {report_file}")
+        if self.validation_error_count:
+            logger.warning(
+                f"Schema validation FAILED for {self.chunks_failed_validation} chunk(s) of {self.df_name}; "
+                f"errors saved to: {self.errors_file}"
+            )
+        return report
+
+
+def run_quality_streaming(chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1):
+    """
+    Streaming version of run_quality(): same inputs and output files, processed in chunks of
+    'chunk_size' raw items so memory does not grow with the number of zips.
+    With workers > 1 each chunk of files is parsed and flattened on a process pool.
+    """
+    configure_logging()
+    logger.info(
+        f"Starting STREAMING Data Quality Check for ALL ZIPS in {COUNTRY} (chunk size {chunk_size})"
+    )
+    ensure_dir_exists(BASE_PREPROCESSED_DIR)
+    ensure_dir_exists(COUNTRY_PREPROCESSED_DIR)
+    if not COUNTRY_RAW_DIR.is_dir():
+        logger.error(f"Country directory not found: {COUNTRY_RAW_DIR}. Exiting.")
+        exit(1)
+
+    instrumentation = RunInstrumentation(
+        f"data_quality_{COUNTRY}", mode="streaming", chunk_size=chunk_size, workers=workers
+    )
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=configure_logging) if workers > 1 else None
+    try:
+        run_streaming_stages(chunk_size, executor, instrumentation)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    logger.info(f"Stage timings (workers={workers}): {json.dumps(instrumentation.stage_seconds())}")
+    instrumentation.write_report(COUNTRY_PREPROCESSED_DIR)
+
+    logger.info("--- Proposed Data Model ---")
+    print_proposed_data_model()
+    logger.info(f"--- Streaming Data Quality Check Finished for {COUNTRY} ---")
+
+
+def iter_timed_frames(frames, instrumentation: RunInstrumentation, name: str):
+    """Yields the frames of 'frames', recording the time spent producing each one (loading and
+    flattening, in the streaming mode) as span 'name'."""
+    frames = iter(frames)
+    while True:
+        with instrumentation.span(name) as span:
+            frame = next(frames, None)
+            if frame is not None:
+                span.rows_out = len(frame)
+        if frame is None:
+            return
+        yield frame
+
+
+def run_streaming_stages(
+    chunk_size: int, executor=None, instrumentation: RunInstrumentation = None
+) -> dict:
+    """Profiles then reviews, chunk by chunk. Returns the stage timings (wall seconds per span)."""
+    instrumentation = instrumentation or RunInstrumentation(f"data_quality_{COUNTRY}")
+
+    # --- Profiles (main + nested) ---
+    main_report = StreamingQualityReport(
+        "main_profiles", main_profile_schema, COUNTRY_PREPROCESSED_DIR, instrumentation
+    )
+    nested_reports = {}  # sub_type -> StreamingQualityReport
+    seen_profile_ids = set()
+    blob_hashes = []
+    main_frames = iter_main_profile_frames(chunk_size, blob_hashes, executor)
+    for chunk_number, main_df in enumerate(
+        iter_timed_frames(main_frames, instrumentation, "load_flatten_profiles")
+    ):
+        with instrumentation.span("dedup_profiles", rows_in=len(main_df)) as span:
+            main_df = drop_seen_keys(main_df, ["profile_id"], seen_profile_ids, "main_profiles")
+            span.rows_out = len(main_df)
+        if main_df.empty:
+            continue
+        with instrumentation.span("nested_extraction", rows_in=len(main_df)) as span:
+            nested_rows = pop_nested_profiles(main_df)
+            nested_frames = {}
+            for sub_type, rows in nested_rows.items():
+                df_for_type = apply_dtype_plan(pd.DataFrame(rows), f"nested_{sub_type}")
+                # profile_id is already unique across chunks, so (profile_id, sub_profile_type) is too
+                nested_frames[sub_type] = df_for_type.drop_duplicates(
+                    subset=["profile_id", "sub_profile_type"], keep="first"
+                )
+            span.rows_out = sum(len(df_for_type) for df_for_type in nested_frames.values())
+        main_report.add(main_df)
+
+        for sub_type, df_for_type in nested_frames.items():
+            if sub_type not in nested_reports:
+                nested_reports[sub_type] = StreamingQualityReport(
+                    f"nested_{sub_type}", nested_profile_schema, COUNTRY_PREPROCESSED_DIR, instrumentation
+                )
+            nested_reports[sub_type].add(df_for_type)
+        logger.info(
+            f"Profiles chunk {chunk_number}: {len(main_df)} new profiles ({len(seen_profile_ids)} so far)."
+        )
+
+    main_report.finalize()
+    for nested_report in nested_reports.values():
+        nested_report.finalize()
+
+    # --- Reviews ---
+    reviews_report = StreamingQualityReport(
+        "reviews", review_schema, COUNTRY_PREPROCESSED_DIR, instrumentation
+    )
+    seen_review_ids = SeenKeySet(spill_path=COUNTRY_PREPROCESSED_DIR / "_seen_review_ids.sqlite")
+    try:
+        review_frames = iter_review_frames(chunk_size, executor, None if executor else seen_review_ids)
+        for chunk_number, reviews_df in enumerate(
+            iter_timed_frames(review_frames, instrumentation, "load_flatten_reviews")
+        ):
+            if executor is not None:  # Pool workers cannot share the set; dedup after flattening
+                with instrumentation.span("dedup_reviews", rows_in=len(reviews_df)) as span:
+                    reviews_df = drop_seen_keys(reviews_df, ["review_id"], seen_review_ids, "reviews")
+                    span.rows_out = len(reviews_df)
+            reviews_report.add(reviews_df)
+            logger.info(
+                f"Reviews chunk {chunk_number}: {len(reviews_df)} new reviews ({len(seen_review_ids)} so far)."
+            )
+    finally:
+        seen_review_ids.close()
+    reviews_report.finalize()
+
+    if blob_hashes:
+        mark_blobs_processed([{"blob_sha256": sha} for sha in blob_hashes])
+    return instrumentation.stage_seconds()
+
+
+def print_proposed_data_model():
+    """Prints the proposed relational data model (hybrid flattening)."""
+    model = """
     Proposed Relational Data Model (Hybrid Flattening):
     ----------------------------------------------------
     NOTE: NestedServiceProfiles columns contain dynamically flattened fields
@@ -964,6 +2390,7 @@ def print_proposed_data_model():
 
 # --- Main Execution ---
 if __name__ == "__main__":
+    configure_logging()
     logger.info(f"Starting Data Quality Check Script for ALL ZIPS in {COUNTRY}")
     ensure_dir_exists(BASE_PREPROCESSED_DIR)
     ensure_dir_exists(COUNTRY_PREPROCESSED_DIR)  # Ensure country output dir exists
@@ -1009,6 +2436,12 @@ if __name__ == "__main__":
                 )
     logger.info(f"Finished scanning {zip_count} potential zip code directories.")
 
+    # Profiles written through the blob store. Outputs are a full rebuild, so nothing is skipped
+    # here; the ledger only records which contents have been processed.
+    blob_profile_items = load_blob_items(BLOB_STORE_DIR, "all_profiles")
+    all_profile_json_items.extend(blob_profile_items)
+    all_profile_json_items.extend(load_lake_items(LAKE_DIR, "profiles"))
+
     # --- Process AGGREGATED Data ---
     main_profiles_df = pd.DataFrame()
     nested_profiles_data = {}  # Dict to hold lists for each type {type: [rows]}
@@ -1050,6 +2483,8 @@ if __name__ == "__main__":
                     "Column 'profile_id' not found! Cannot deduplicate profiles."
                 )
             # --- END DEDUPLICATION STEP ---
+            # Sub-profile rows were flattened with their main profile; keep those of the kept rows
+            nested_profiles_data = pop_nested_profiles(main_profiles_df)  # {sub_type: [rows]}
             # Run checks and save at COUNTRY level
             logger.info("333 out")
             main_profiles_df = run_quality_checks_and_report(
@@ -1061,21 +2496,8 @@ if __name__ == "__main__":
 
             # Extract nested profiles from the AGGREGATED main dataframe
             logger.info(
-                "Extracting and flattening nested profiles from aggregated main profiles..."
+                "Collecting nested profiles flattened alongside the aggregated main profiles..."
             )
-            nested_profiles_data = {}  # {sub_type: [rows]}
-            if not main_profiles_df.empty:
-                for idx, row in main_profiles_df.iterrows():
-                    try:
-                        nested_data_for_row = extract_and_flatten_nested_profiles(row)
-                        for sub_type, flat_dict_list in nested_data_for_row.items():
-                            if sub_type not in nested_profiles_data:
-                                nested_profiles_data[sub_type] = []
-                            nested_profiles_data[sub_type].extend(flat_dict_list)
-                    except Exception as nested_err:
-                        logger.error(
-                            f"Err extract nested agg {row.get('profile_id','N/A')}: {nested_err}\n{traceback.format_exc()}"
-                        )
 
             # Create, check, and save DataFrames for each nested profile type
             if nested_profiles_data:
@@ -1086,8 +2508,9 @@ if __name__ == "__main__":
                             f"--- Creating DataFrame and running checks for aggregated: nested_{sub_type} ---"
                         )
                         try:
-                            df_for_type = pd.DataFrame(list_of_dicts)
-                            df_for_type = df_for_type.convert_dtypes()
+                            df_for_type = apply_dtype_plan(
+                                pd.DataFrame(list_of_dicts), f"nested_{sub_type}"
+                            )
                             # --- DEDUPLICATION STEP FOR NESTED PROFILES ---
                             # Check duplicates based on profile_id and sub_profile_type
                             if (
@@ -1137,7 +2560,11 @@ if __name__ == "__main__":
     # Create Reviews DataFrame from ALL loaded items
     logger.info(f"--- Processing ALL {len(all_review_json_items)} Review Items ---")
     if all_review_json_items:
-        reviews_df = create_reviews_dataframe(all_review_json_items)
+        seen_review_ids = SeenKeySet(spill_path=COUNTRY_PREPROCESSED_DIR / "_seen_review_ids.sqlite")
+        try:
+            reviews_df = create_reviews_dataframe(all_review_json_items, seen_review_ids)
+        finally:
+            seen_review_ids.close()
         if not reviews_df.empty:
             # --- DEDUPLICATION STEP FOR REVIEWS ---
             if "review_id" in reviews_df.columns:
@@ -1174,12 +2601,39 @@ if __name__ == "__main__":
     else:
         logger.warning(f"No review JSON files found across all zip codes.")
 
+    mark_blobs_processed(blob_profile_items)
+
     logger.info("--- Proposed Data Model ---")
     print_proposed_data_model()
     logger.info(f"--- Data Quality Check Script Finished for {COUNTRY} ---")
 
 
-def run_quality():
+def run_quality(
+    streaming: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    incremental: bool = False,
+):
+    """
+    Runs the country-level quality checks. With streaming=True the work is done in chunks of
+    'chunk_size' raw items (see run_quality_streaming) instead of loading every file first.
+    With workers > 1 raw files are parsed and flattened on a process pool of that size;
+    the output is identical to the single-process run.
+    With incremental=True only raw files that are new or changed since the last incremental run
+    are flattened (see flatten_files_incremental); reports still cover the full result.
+    """
+    configure_logging()
+    if streaming:
+        if incremental:
+            logger.warning("incremental=True is not supported in streaming mode; ignoring it.")
+        return run_quality_streaming(chunk_size, workers)
+    parallel = workers > 1
+    list_files_only = parallel or incremental
+    instrumentation = RunInstrumentation(
+        f"data_quality_{COUNTRY}",
+        mode="incremental" if incremental else "batch",
+        workers=workers,
+    )
     logger.info(f"Starting Data Quality Check Script for ALL ZIPS in {COUNTRY}")
     ensure_dir_exists(BASE_PREPROCESSED_DIR)
     ensure_dir_exists(COUNTRY_PREPROCESSED_DIR)  # Ensure country output dir exists
@@ -1187,6 +2641,9 @@ def run_quality():
     # Initialize lists to hold data from ALL zip codes
     all_profile_json_items = []
     all_review_json_items = []
+    # Parallel/incremental modes only list the files here; they are read later
+    profile_file_tasks = []
+    review_file_tasks = []
 
     # Iterate through potential zip code directories
     if not COUNTRY_RAW_DIR.is_dir():
@@ -1194,36 +2651,63 @@ def run_quality():
         exit(1)
 
     logger.info(f"Scanning for zip code directories in: {COUNTRY_RAW_DIR}")
-    zip_count = 0
-    for zip_dir in COUNTRY_RAW_DIR.iterdir():
-        # Basic check: is it a directory and does the name look like a zip code?
-        if zip_dir.is_dir() and zip_dir.name.isdigit():
-            zip_code = zip_dir.name
-            zip_count += 1
-            logger.info(f"--- Processing Zip Code: {zip_code} ---")
-
-            # Define input paths for this zip code
-            current_profiles_input_dir = zip_dir / "all_profiles"
-            current_reviews_input_dir = zip_dir / "reviews"
-
-            # Load profiles for this zip code
-            profile_items = load_json_files(current_profiles_input_dir, zip_code)
-            all_profile_json_items.extend(profile_items)
-            logger.info(f"Loaded {len(profile_items)} profiles for zip {zip_code}.")
-
-            # Load reviews for this zip code (check all subdirs like CHILD_CARE etc.)
-            if current_reviews_input_dir.is_dir():
-                for type_dir in current_reviews_input_dir.iterdir():
-                    if type_dir.is_dir():
-                        # logger.info(f"Loading reviews from: {type_dir}") # Verbose
-                        review_items = load_json_files(type_dir, zip_code)
-                        all_review_json_items.extend(review_items)
-                        # logger.info(f"Loaded {len(review_items)} reviews for zip {zip_code}, type {type_dir.name}.")
-            else:
-                logger.warning(
-                    f"Reviews directory not found for zip {zip_code}: {current_reviews_input_dir}"
-                )
-    logger.info(f"Finished scanning {zip_count} potential zip code directories.")
+    with instrumentation.span("load") as span:
+        zip_count = 0
+        for zip_dir in COUNTRY_RAW_DIR.iterdir():
+            # Basic check: is it a directory and does the name look like a zip code?
+            if zip_dir.is_dir() and zip_dir.name.isdigit():
+                zip_code = zip_dir.name
+                zip_count += 1
+                logger.info(f"--- Processing Zip Code: {zip_code} ---")
+
+                # Define input paths for this zip code
+                current_profiles_input_dir = zip_dir / "all_profiles"
+                current_reviews_input_dir = zip_dir / "reviews"
+
+                # Load profiles for this zip code
+                if list_files_only:
+                    zip_tasks = [
+                        (str(path), zip_code) for path in iter_json_paths(current_profiles_input_dir)
+                    ]
+                    profile_file_tasks.extend(zip_tasks)
+                    logger.info(f"Listed {len(zip_tasks)} profile files for zip {zip_code}.")
+                else:
+                    profile_items = load_json_files(current_profiles_input_dir, zip_code)
+                    all_profile_json_items.extend(profile_items)
+                    logger.info(f"Loaded {len(profile_items)} profiles for zip {zip_code}.")
+
+                # Load reviews for this zip code (check all subdirs like CHILD_CARE etc.)
+                if current_reviews_input_dir.is_dir():
+                    for type_dir in current_reviews_input_dir.iterdir():
+                        if type_dir.is_dir():
+                            # logger.info(f"Loading reviews from: {type_dir}") # Verbose
+                            if list_files_only:
+                                review_file_tasks.extend(
+                                    (str(path), zip_code) for path in iter_json_paths(type_dir)
+                                )
+                                continue
+                            review_items = load_json_files(type_dir, zip_code)
+                            all_review_json_items.extend(review_items)
+                            # logger.info(f"Loaded {len(review_items)} reviews for zip {zip_code}, type {type_dir.name}.")
+                else:
+                    logger.warning(
+                        f"Reviews directory not found for zip {zip_code}: {current_reviews_input_dir}"
+                    )
+        logger.info(f"Finished scanning {zip_count} potential zip code directories.")
+
+        # Profiles written through the blob store. Incremental runs only list them here and skip
+        # the blobs in the processed-blob ledger (see flatten_blobs_incremental); other runs are a
+        # full rebuild and read every blob, the ledger only recording what has been processed.
+        blob_entries = list(iter_blob_entries(BLOB_STORE_DIR, "all_profiles")) if incremental else []
+        blob_profile_items = [] if incremental else load_blob_items(BLOB_STORE_DIR, "all_profiles")
+        all_profile_json_items.extend(blob_profile_items)
+        all_profile_json_items.extend(load_lake_items(LAKE_DIR, "profiles"))
+        span.rows_out = (
+            len(all_profile_json_items) + len(all_review_json_items)
+            + len(profile_file_tasks) + len(review_file_tasks) + len(blob_entries)
+        )
+        if not list_files_only:  # Otherwise the files are read while flattening
+            span.bytes_read = items_size(all_profile_json_items) + items_size(all_review_json_items)
 
     # --- Process AGGREGATED Data ---
     main_profiles_df = pd.DataFrame()
@@ -1231,164 +2715,241 @@ def run_quality():
     reviews_df = pd.DataFrame()
 
     # Create Main Profiles DataFrame from ALL loaded items
-    logger.info(f"--- Processing ALL {len(all_profile_json_items)} Profile Items ---")
-    if all_profile_json_items:
-        main_profiles_df = create_dataframe(
-            all_profile_json_items, flatten_main_profile, "all_main_profiles"
-        )
+    profile_item_count = len(profile_file_tasks) + len(all_profile_json_items) + len(blob_entries)
+    logger.info(f"--- Processing ALL {profile_item_count} Profile Items ---")
+    with instrumentation.span("parse_flatten_profiles", rows_in=profile_item_count) as span:
+        raw_manifest = load_raw_manifest() if incremental else None
+        if incremental:
+            rows, error_count = flatten_files_incremental(
+                "profiles", profile_file_tasks, raw_manifest, parse_and_flatten_profile_file, workers
+            )
+            # Blob rows come before the lake items, as in the other modes
+            blob_rows, blob_errors, blob_profile_items = flatten_blobs_incremental(
+                blob_entries, raw_manifest
+            )
+            stored_rows, stored_errors = flatten_items(all_profile_json_items, flatten_main_profile)
+            main_profiles_df = rows_to_dataframe(
+                rows + blob_rows + stored_rows,
+                error_count + blob_errors + stored_errors,
+                "all_main_profiles",
+            )
+            del rows, blob_rows, stored_rows
+        elif parallel and profile_item_count:
+            with ProcessPoolExecutor(max_workers=workers, initializer=configure_logging) as executor:
+                rows, error_count = flatten_files_parallel(
+                    profile_file_tasks, parse_and_flatten_profile_file, executor
+                )
+            # Blob/lake items are already in memory; they come after the files, as in serial mode
+            stored_rows, stored_errors = flatten_items(all_profile_json_items, flatten_main_profile)
+            main_profiles_df = rows_to_dataframe(
+                rows + stored_rows, error_count + stored_errors, "all_main_profiles"
+            )
+            del rows, stored_rows
+        elif all_profile_json_items:
+            main_profiles_df = create_dataframe(
+                all_profile_json_items, flatten_main_profile, "all_main_profiles"
+            )
+        span.rows_out = len(main_profiles_df)
+        if parallel and not incremental:
+            span.bytes_read = tasks_size(profile_file_tasks)
+    if profile_item_count:
         if not main_profiles_df.empty:
-            # --- DEDUPLICATION STEP FOR PROFILES ---
-            if "profile_id" in main_profiles_df.columns:
-                logger.info("DEDUPLICATION STEP FOR PROFILES...")
-                initial_count = len(main_profiles_df)
-                # Drop rows missing profile_id first, as they cannot be deduplicated properly
-                main_profiles_df.dropna(subset=["profile_id"], inplace=True)
-                dropped_null = initial_count - len(main_profiles_df)
-                if dropped_null > 0:
-                    logger.info(
-                        f"Dropped {dropped_null} profiles missing profile_id before deduplication."
-                    )
+            with instrumentation.span("dedup_profiles", rows_in=len(main_profiles_df)) as span:
+                # --- DEDUPLICATION STEP FOR PROFILES ---
+                if "profile_id" in main_profiles_df.columns:
+                    logger.info("DEDUPLICATION STEP FOR PROFILES...")
+                    initial_count = len(main_profiles_df)
+                    # Drop rows missing profile_id first, as they cannot be deduplicated properly
+                    main_profiles_df.dropna(subset=["profile_id"], inplace=True)
+                    dropped_null = initial_count - len(main_profiles_df)
+                    if dropped_null > 0:
+                        logger.info(
+                            f"Dropped {dropped_null} profiles missing profile_id before deduplication."
+                        )
 
-                # Now drop duplicates based on profile_id, keeping the first
-                initial_count_after_null = len(main_profiles_df)
-                main_profiles_df.drop_duplicates(
-                    subset=["profile_id"], keep="first", inplace=True
-                )
-                dropped_duplicates = initial_count_after_null - len(main_profiles_df)
-                if dropped_duplicates > 0:
-                    logger.warning(
-                        f"Removed {dropped_duplicates} duplicate profiles based on 'profile_id'. Kept first occurrence."
+                    # Now drop duplicates based on profile_id, keeping the first
+                    initial_count_after_null = len(main_profiles_df)
+                    main_profiles_df.drop_duplicates(
+                        subset=["profile_id"], keep="first", inplace=True
                     )
-            else:
-                logger.error(
-                    "Column 'profile_id' not found! Cannot deduplicate profiles."
-                )
-            # --- END DEDUPLICATION STEP ---
+                    dropped_duplicates = initial_count_after_null - len(main_profiles_df)
+                    instrumentation.count("duplicate_profiles", dropped_duplicates)
+                    if dropped_duplicates > 0:
+                        logger.warning(
+                            f"Removed {dropped_duplicates} duplicate profiles based on 'profile_id'. Kept first occurrence."
+                        )
+                else:
+                    logger.error(
+                        "Column 'profile_id' not found! Cannot deduplicate profiles."
+                    )
+                # --- END DEDUPLICATION STEP ---
+                span.rows_out = len(main_profiles_df)
+            # Sub-profile rows were flattened with their main profile; keep those of the kept rows
+            with instrumentation.span("nested_extraction", rows_in=len(main_profiles_df)) as span:
+                nested_profiles_data = pop_nested_profiles(main_profiles_df)  # {sub_type: [rows]}
+                span.rows_out = sum(len(rows) for rows in nested_profiles_data.values())
             # Run checks and save at COUNTRY level
-            main_profiles_df = run_quality_checks_and_report(
-                main_profiles_df,
-                main_profile_schema,
-                "main_profiles",
-                COUNTRY_PREPROCESSED_DIR,
-            )
+            with instrumentation.span("check:main_profiles", rows_in=len(main_profiles_df)) as span:
+                main_profiles_df = run_quality_checks_and_report(
+                    main_profiles_df,
+                    main_profile_schema,
+                    "main_profiles",
+                    COUNTRY_PREPROCESSED_DIR,
+                    workers=workers,
+                    instrumentation=instrumentation,
+                )
+                span.rows_out = len(main_profiles_df)
 
             # Extract nested profiles from the AGGREGATED main dataframe
-            logger.info(
-                "Extracting and flattening nested profiles from aggregated main profiles..."
-            )
-            nested_profiles_data = {}  # {sub_type: [rows]}
-            if not main_profiles_df.empty:
-                for idx, row in main_profiles_df.iterrows():
-                    try:
-                        nested_data_for_row = extract_and_flatten_nested_profiles(row)
-                        for sub_type, flat_dict_list in nested_data_for_row.items():
-                            if sub_type not in nested_profiles_data:
-                                nested_profiles_data[sub_type] = []
-                            nested_profiles_data[sub_type].extend(flat_dict_list)
-                    except Exception as nested_err:
-                        logger.error(
-                            f"Err extract nested agg {row.get('profile_id','N/A')}: {nested_err}\n{traceback.format_exc()}"
-                        )
+            with instrumentation.span("check:nested_profiles", rows_in=sum(len(rows) for rows in nested_profiles_data.values())):
+                logger.info(
+                    "Collecting nested profiles flattened alongside the aggregated main profiles..."
+                )
 
-            # Create, check, and save DataFrames for each nested profile type
-            if nested_profiles_data:
-                logger.info("Processing aggregated nested profiles by type...")
-                for sub_type, list_of_dicts in nested_profiles_data.items():
-                    if list_of_dicts:
-                        logger.info(
-                            f"--- Creating DataFrame and running checks for aggregated: nested_{sub_type} ---"
-                        )
-                        try:
-                            df_for_type = pd.DataFrame(list_of_dicts)
-                            df_for_type = df_for_type.convert_dtypes()
-                            # --- DEDUPLICATION STEP FOR NESTED PROFILES ---
-                            # Check duplicates based on profile_id and sub_profile_type
-                            if (
-                                "profile_id" in df_for_type.columns
-                                and "sub_profile_type" in df_for_type.columns
-                            ):
-                                logger.info("DEDUPLICATION STEP FOR NESTED PROFILES...")
-                                initial_nested_count = len(df_for_type)
-                                df_for_type.drop_duplicates(
-                                    subset=["profile_id", "sub_profile_type"],
-                                    keep="first",
-                                    inplace=True,
-                                )
-                                dropped_nested_dupes = initial_nested_count - len(
-                                    df_for_type
-                                )
-                                if dropped_nested_dupes > 0:
-                                    logger.warning(
-                                        f"Removed {dropped_nested_dupes} duplicate nested profiles (profile_id, sub_profile_type) for type '{sub_type}'."
-                                    )
-                            # --- END DEDUPLICATION STEP ---
-                            df_name = f"nested_{sub_type}"
-                            # Save at COUNTRY level
-                            run_quality_checks_and_report(
-                                df_for_type,
-                                nested_profile_schema,
-                                df_name,
-                                COUNTRY_PREPROCESSED_DIR,
-                            )
+                # Create, check, and save DataFrames for each nested profile type
+                if nested_profiles_data:
+                    logger.info("Processing aggregated nested profiles by type...")
+                    for sub_type, list_of_dicts in nested_profiles_data.items():
+                        if list_of_dicts:
                             logger.info(
-                                f"--- Finished checks for aggregated: {df_name} ---"
+                                f"--- Creating DataFrame and running checks for aggregated: nested_{sub_type} ---"
                             )
-                        except Exception as type_proc_err:
-                            logger.error(
-                                f"Error processing aggregated sub_profile_type '{sub_type}': {type_proc_err}\n{traceback.format_exc()}"
+                            try:
+                                df_for_type = apply_dtype_plan(
+                                    pd.DataFrame(list_of_dicts), f"nested_{sub_type}"
+                                )
+                                # --- DEDUPLICATION STEP FOR NESTED PROFILES ---
+                                # Check duplicates based on profile_id and sub_profile_type
+                                if (
+                                    "profile_id" in df_for_type.columns
+                                    and "sub_profile_type" in df_for_type.columns
+                                ):
+                                    logger.info("DEDUPLICATION STEP FOR NESTED PROFILES...")
+                                    initial_nested_count = len(df_for_type)
+                                    df_for_type.drop_duplicates(
+                                        subset=["profile_id", "sub_profile_type"],
+                                        keep="first",
+                                        inplace=True,
+                                    )
+                                    dropped_nested_dupes = initial_nested_count - len(
+                                        df_for_type
+                                    )
+                                    instrumentation.count("duplicate_nested_profiles", dropped_nested_dupes)
+                                    if dropped_nested_dupes > 0:
+                                        logger.warning(
+                                            f"Removed {dropped_nested_dupes} duplicate nested profiles (profile_id, sub_profile_type) for type '{sub_type}'."
+                                        )
+                                # --- END DEDUPLICATION STEP ---
+                                df_name = f"nested_{sub_type}"
+                                # Save at COUNTRY level
+                                run_quality_checks_and_report(
+                                    df_for_type,
+                                    nested_profile_schema,
+                                    df_name,
+                                    COUNTRY_PREPROCESSED_DIR,
+                                    workers=workers,
+                                    instrumentation=instrumentation,
+                                )
+                                logger.info(
+                                    f"--- Finished checks for aggregated: {df_name} ---"
+                                )
+                            except Exception as type_proc_err:
+                                logger.error(
+                                    f"Error processing aggregated sub_profile_type '{sub_type}': {type_proc_err}\n{traceback.format_exc()}"
+                                )
+                        else:
+                            logger.warning(
+                                f"No aggregated data found for sub_profile_type '{sub_type}'."
                             )
-                    else:
-                        logger.warning(
-                            f"No aggregated data found for sub_profile_type '{sub_type}'."
-                        )
-            else:
-                logger.warning("No nested profile data was extracted or aggregated.")
+                else:
+                    logger.warning("No nested profile data was extracted or aggregated.")
         else:
             logger.warning("Aggregated Main profiles DataFrame empty.")
     else:
         logger.warning(f"No profile JSON files found across all zip codes.")
 
     # Create Reviews DataFrame from ALL loaded items
-    logger.info(f"--- Processing ALL {len(all_review_json_items)} Review Items ---")
-    if all_review_json_items:
-        reviews_df = create_reviews_dataframe(all_review_json_items)
-        if not reviews_df.empty:
-            # --- DEDUPLICATION STEP FOR REVIEWS ---
-            if "review_id" in reviews_df.columns:
-                logger.info("DEDUPLICATION STEP FOR REVIEWS...")
-                initial_r_count = len(reviews_df)
-                # Drop rows missing review_id first
-                reviews_df.dropna(subset=["review_id"], inplace=True)
-                dropped_r_null = initial_r_count - len(reviews_df)
-                if dropped_r_null > 0:
-                    logger.info(
-                        f"Dropped {dropped_r_null} total reviews missing review_id before deduplication."
-                    )
-
-                # Drop duplicates based on review_id
-                initial_r_count_after_null = len(reviews_df)
-                reviews_df.drop_duplicates(
-                    subset=["review_id"], keep="first", inplace=True
+    review_item_count = len(review_file_tasks) + len(all_review_json_items)
+    logger.info(f"--- Processing ALL {review_item_count} Review Items ---")
+    # Incremental runs always come here, so rows of deleted review files are retracted
+    if review_item_count or incremental:
+        with instrumentation.span("parse_flatten_reviews", rows_in=review_item_count) as span:
+            if incremental:
+                rows, error_count = flatten_files_incremental(
+                    "reviews", review_file_tasks, raw_manifest, parse_and_flatten_review_file, workers
                 )
-                dropped_r_duplicates = initial_r_count_after_null - len(reviews_df)
-                if dropped_r_duplicates > 0:
-                    logger.warning(
-                        f"Removed {dropped_r_duplicates} duplicate reviews based on 'review_id'. Kept first occurrence."
+                save_raw_manifest(raw_manifest)
+                reviews_df = rows_to_dataframe(rows, error_count, "reviews")
+                del rows
+            elif parallel:
+                with ProcessPoolExecutor(max_workers=workers, initializer=configure_logging) as executor:
+                    rows, error_count = flatten_files_parallel(
+                        review_file_tasks, parse_and_flatten_review_file, executor
                     )
+                reviews_df = rows_to_dataframe(rows, error_count, "reviews")
+                del rows
             else:
-                logger.error(
-                    "Column 'review_id' not found! Cannot deduplicate reviews."
+                seen_review_ids = SeenKeySet(
+                    spill_path=COUNTRY_PREPROCESSED_DIR / "_seen_review_ids.sqlite"
                 )
-            # --- END DEDUPLICATION STEP ---
+                try:
+                    reviews_df = create_reviews_dataframe(all_review_json_items, seen_review_ids)
+                finally:
+                    seen_review_ids.close()
+            span.rows_out = len(reviews_df)
+            if parallel and not incremental:
+                span.bytes_read = tasks_size(review_file_tasks)
+        if not reviews_df.empty:
+            with instrumentation.span("dedup_reviews", rows_in=len(reviews_df)) as span:
+                # --- DEDUPLICATION STEP FOR REVIEWS ---
+                if "review_id" in reviews_df.columns:
+                    logger.info("DEDUPLICATION STEP FOR REVIEWS...")
+                    initial_r_count = len(reviews_df)
+                    # Drop rows missing review_id first
+                    reviews_df.dropna(subset=["review_id"], inplace=True)
+                    dropped_r_null = initial_r_count - len(reviews_df)
+                    if dropped_r_null > 0:
+                        logger.info(
+                            f"Dropped {dropped_r_null} total reviews missing review_id before deduplication."
+                        )
+
+                    # Drop duplicates based on review_id
+                    initial_r_count_after_null = len(reviews_df)
+                    reviews_df.drop_duplicates(
+                        subset=["review_id"], keep="first", inplace=True
+                    )
+                    dropped_r_duplicates = initial_r_count_after_null - len(reviews_df)
+                    instrumentation.count("duplicate_reviews", dropped_r_duplicates)
+                    if dropped_r_duplicates > 0:
+                        logger.warning(
+                            f"Removed {dropped_r_duplicates} duplicate reviews based on 'review_id'. Kept first occurrence."
+                        )
+                else:
+                    logger.error(
+                        "Column 'review_id' not found! Cannot deduplicate reviews."
+                    )
+                # --- END DEDUPLICATION STEP ---
+                span.rows_out = len(reviews_df)
             # Run checks and save at COUNTRY level
-            reviews_df = run_quality_checks_and_report(
-                reviews_df, review_schema, "reviews", COUNTRY_PREPROCESSED_DIR
-            )
+            with instrumentation.span("check:reviews", rows_in=len(reviews_df)) as span:
+                reviews_df = run_quality_checks_and_report(
+                    reviews_df,
+                    review_schema,
+                    "reviews",
+                    COUNTRY_PREPROCESSED_DIR,
+                    workers=workers,
+                    instrumentation=instrumentation,
+                )
+                span.rows_out = len(reviews_df)
         else:
             logger.warning("Aggregated Reviews DataFrame empty.")
     else:
         logger.warning(f"No review JSON files found across all zip codes.")
 
+    mark_blobs_processed(blob_profile_items)
+    logger.info(f"Stage timings (workers={workers}): {json.dumps(instrumentation.stage_seconds())}")
+    instrumentation.write_report(COUNTRY_PREPROCESSED_DIR)
+
     logger.info("--- Proposed Data Model ---")
     print_proposed_data_model()
     logger.info(f"--- Data Quality Check Script Finished for {COUNTRY} ---")
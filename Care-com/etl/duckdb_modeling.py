@@ -0,0 +1,831 @@
+"""
+File: duckdb_modeling.py
+
+Description:
+-------------
+Embedded alternative to the PostgreSQL load of sql_modeling.py: builds the same normalized schema
+(the tables of sql_modeling.Base, JSONB columns as DuckDB JSON) in a DuckDB database file, straight
+from the preprocessed outputs (<name>_processed.parquet datasets, else <name>_processed.csv).
+No server or credentials are needed and every table is filled with set-based SQL:
+  1. each preprocessed table is staged once as a temporary table (Parquet files with differing
+     schemas, e.g. from streaming parts, are unioned by name with their nested columns as JSON);
+  2. parent tables are filled with one INSERT ... SELECT, with the source columns converted by
+     SQL macros that follow the safe_* helpers of sql_modeling (chosen by target column type);
+  3. child tables are filled by unnesting the JSON lists with json_each, deduplicated on their key
+     columns like the bulk loader does.
+  4. the dashboard aggregates and the caregiver search table are built from the loaded tables
+     with the statements of sql_modeling.aggregate_refresh_statements().
+Rows are mapped like load_*_bulk() maps them (same source columns, same filters), so both
+backends hold the same rows. The file is rebuilt from scratch on every run, so row_hash stays
+NULL. The database is written next to the old one and swapped in when complete.
+
+Usage:
+------
+    python -m etl.duckdb_modeling [database file]
+or call build_duckdb_database().
+"""
+
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import duckdb
+from sqlalchemy import (
+    Boolean,
+    Date,
+    Float,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    Time,
+    TIMESTAMP,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+try:
+    from etl import sql_modeling as sm
+    from etl.instrumentation import RunInstrumentation, path_size
+except ImportError:  # Run as a script from inside etl/
+    import sql_modeling as sm
+    from instrumentation import RunInstrumentation, path_size
+
+logger = sm.logger
+
+DUCKDB_FILE_NAME = f"care_com_{sm.COUNTRY}.duckdb"  # Written to COUNTRY_PREPROCESSED_DIR by default
+
+# SQL counterparts of the safe_* converters of sql_modeling, applied by target column type.
+# Values arrive typed (Parquet), as text (CSV, JSON fields) or as JSON scalars.
+CONVERTER_MACROS = [
+    "CREATE OR REPLACE TEMP MACRO safe_int(v) AS TRY_CAST(trunc(TRY_CAST(v AS DOUBLE)) AS INTEGER)",
+    "CREATE OR REPLACE TEMP MACRO safe_float(v) AS TRY_CAST(v AS DOUBLE)",
+    """CREATE OR REPLACE TEMP MACRO safe_bool(v) AS CASE
+        WHEN lower(CAST(v AS VARCHAR)) IN ('true', 't', '1', 'yes', 'y') THEN true
+        WHEN lower(CAST(v AS VARCHAR)) IN ('false', 'f', '0', 'no', 'n') THEN false
+        ELSE TRY_CAST(CAST(v AS VARCHAR) AS DOUBLE) <> 0 END""",
+    "CREATE OR REPLACE TEMP MACRO safe_decimal(v) AS TRY_CAST(CAST(v AS VARCHAR) AS DECIMAL(10, 2))",
+    # Offsets are applied and dropped (session TimeZone is UTC), like TIMESTAMP WITHOUT TIME ZONE
+    """CREATE OR REPLACE TEMP MACRO safe_timestamp(v) AS
+        TRY_CAST(TRY_CAST(v AS TIMESTAMPTZ) AS TIMESTAMP)""",
+    """CREATE OR REPLACE TEMP MACRO safe_time(v) AS
+        CAST(try_strptime(CAST(v AS VARCHAR), '%H:%M:%S') AS TIME)""",
+    # Parquet structs carry every field seen in the column; drop the null ones (see _drop_null_fields).
+    # A JSON null counts as missing, as pandas reads 'null' in the CSVs as NaN.
+    """CREATE OR REPLACE TEMP MACRO json_without_nulls(j) AS CASE json_type(j)
+        WHEN 'OBJECT' THEN json_merge_patch('{}', j) WHEN 'NULL' THEN NULL ELSE j END""",
+    # Python truthiness of a JSON list element (the 'if value' filters of the *_child_rows helpers)
+    """CREATE OR REPLACE TEMP MACRO json_truthy(j) AS
+        json_type(j) <> 'NULL' AND CAST(j AS VARCHAR) NOT IN ('""', 'false', '0', '0.0', '[]', '{}')""",
+]
+
+# Target column -> source column, or (JSON source column, JSON path) for values inside JSON fields.
+# '{sub}' stands for the sub-profile type of the nested tables.
+PROFILE_SOURCE_COLUMNS = {
+    "profile_id": "profile_id",
+    "zip_code": "zip_code",
+    "source_filename": "source_filename",
+    "first_name": "member_firstName",
+    "last_name": "member_lastName",
+    "gender": "member_gender",
+    "display_name": "member_displayName",
+    "email": "member_email",
+    "primary_service": "member_primaryService",
+    "hi_res_image_url": "member_hiResImageURL",
+    "image_url": "member_imageURL",
+    "address_city": "member_address_city",
+    "address_state": "member_address_state",
+    "address_zip": "member_address_zip",
+    "legacy_id": "member_legacyId",
+    "is_premium": "member_isPremium",
+    "distance_from_seeker": "distanceFromSeekerInMiles",
+    "has_care_check": "hasCareCheck",
+    "has_granted_criminal_bgc_access": "hasGrantedCriminalBGCAccess",
+    "has_granted_mvr_bgc_access": "hasGrantedMvrBGCAccess",
+    "has_granted_premier_bgc_access": "hasGrantedPremierBGCAccess",
+    "hired_times": "hiredTimes",
+    "is_favorite": "isFavorite",
+    "is_mvr_eligible": "isMVREligible",
+    "is_vaccinated": "isVaccinated",
+    "provider_status": "providerStatus",
+    "response_rate": "responseRate",
+    "response_time": "responseTime",
+    "sign_up_date": "signUpDate",
+    "years_of_experience": "yearsOfExperience",
+    "cbc_seeker_limit_reached": ("continuousBackgroundCheck_json", "$.seeker.hasLimitReached"),
+    "cbc_seeker_status": ("continuousBackgroundCheck_json", "$.seeker.subscriptionStatus"),
+    "cbc_has_active_hit": ("continuousBackgroundCheck_json", "$.hasActiveHit"),
+    "hired_by_counts_json": "hiredByCounts_json",
+    "place_info_json": "placeInfo_json",
+    "recurring_availability_json": "recurringAvailability_json",
+}
+NESTED_SOURCE_COLUMNS = {
+    "profile_id": "profile_id",
+    "zip_code": "zip_code",
+    "sub_id": "{sub}_id",
+    "approval_status": "{sub}_approvalStatus",
+    "availability_frequency": "{sub}_availabilityFrequency",
+    "years_of_experience": "{sub}_yearsOfExperience",
+    "service_ids_json": "service_ids_json",
+    "bio_summary": ("{sub}_bio_json", "$.experienceSummary"),
+    "bio_title": ("{sub}_bio_json", "$.title"),
+    "bio_ai_assisted": ("{sub}_bio_json", "$.aiAssistedBio"),
+    "payrange_from_amount": ("{sub}_payRange_hourlyRateFrom", "$.amount"),
+    "payrange_from_currency": ("{sub}_payRange_hourlyRateFrom", "$.currencyCode"),
+    "payrange_to_amount": ("{sub}_payRange_hourlyRateTo", "$.amount"),
+    "payrange_to_currency": ("{sub}_payRange_hourlyRateTo", "$.currencyCode"),
+    "recurring_from_amount": ("{sub}_recurringRate_hourlyRateFrom", "$.amount"),
+    "recurring_from_currency": ("{sub}_recurringRate_hourlyRateFrom", "$.currencyCode"),
+    "recurring_to_amount": ("{sub}_recurringRate_hourlyRateTo", "$.amount"),
+    "recurring_to_currency": ("{sub}_recurringRate_hourlyRateTo", "$.currencyCode"),
+    "repeat_clients_count": "{sub}_repeatClientsCount",
+    "housekeeping_distance_willing_to_travel": "{sub}_distanceWillingToTravel",
+    "schedule_json": "{sub}_schedule_json",
+    "childcare_child_staff_ratio": "{sub}_childStaffRatio",
+    "childcare_max_age_months": "{sub}_maxAgeMonths",
+    "childcare_min_age_months": "{sub}_minAgeMonths",
+    "childcare_number_of_children": "{sub}_numberOfChildren",
+    "petcare_number_of_pets_comfortable_with": "{sub}_numberOfPetsComfortableWith",
+    "tutoring_other_specific_subject": "{sub}_otherSpecificSubject",
+}
+REVIEW_SOURCE_COLUMNS = {
+    "review_id": "review_id",
+    "profile_id": "profile_id",
+    "zip_code": "zip_code",
+    "source_filename": "source_filename",
+    "care_type": "careType",
+    "create_time": "createTime",
+    "delete_time": "deleteTime",
+    "description_display_text": "description_displayText",
+    "description_original_text": "description_originalText",
+    "language_code": "languageCode",
+    "original_source": "originalSource",
+    "status": "status",
+    "update_source": "updateSource",
+    "update_time": "updateTime",
+    "verified_by_care": "verifiedByCare",
+    "reviewee_provider_type": "reviewee_providerType",
+    "reviewee_type": "reviewee_type",
+    "reviewer_image_url": "reviewer_imageURL",
+    "reviewer_first_name": "reviewer_firstName",
+    "reviewer_last_initial": "reviewer_lastInitial",
+    "reviewer_source": "reviewer_source",
+    "reviewer_type": "reviewer_type",
+    "retort_json": "retort_json",
+}
+JSON_DEFAULTS = {  # parse_json_field() defaults of the JSON columns (others default to NULL)
+    "hired_by_counts_json": "{}",
+    "recurring_availability_json": "{}",
+    "service_ids_json": "[]",
+    "schedule_json": "[]",
+    "retort_json": "{}",
+}
+
+# Child rows: relationship -> list of (source JSON column, path of the items: '<list>[*]' for the
+# elements of a list, '<object>.*' for the members of an object, {child column: SQL expression
+# over the json_each() row 'e'}, condition on 'e'). Values are converted like the parent values.
+VALUE = "e.value ->> '$'"
+TRUTHY = "json_truthy(e.value)"
+OBJECT = "e.type = 'OBJECT'"
+PROFILE_CHILD_SOURCES = {
+    "languages": [("member_languages_json", "$[*]", {"language": VALUE}, TRUTHY)],
+    "badges": [("badges_json", "$[*]", {"badge": VALUE}, TRUTHY)],
+    "background_checks": [
+        (
+            "backgroundChecks_json",
+            "$[*]",
+            {
+                "check_name": "e.value ->> '$.backgroundCheckName'",
+                "completed_at": "e.value ->> '$.whenCompleted'",
+            },
+            OBJECT,
+        )
+    ],
+    "non_primary_images": [
+        ("nonPrimaryImages_json", "$[*]", {"image_url": VALUE}, f"e.type = 'VARCHAR' AND {TRUTHY}")
+    ],
+    "service_ids": [("profiles_json", "$.serviceIds[*]", {"service_id_name": VALUE}, TRUTHY)],
+}
+NESTED_CHILD_SOURCES = {
+    "qualities": [("{sub}_qualities_list", "$[*]", {"quality_name": VALUE}, TRUTHY)],
+    "supported_services": [("{sub}_supportedServices_list", "$[*]", {"service_name": VALUE}, TRUTHY)],
+    "merchandized_job_interests": [
+        ("{sub}_merchandizedJobInterests_list", "$[*]", {"interest_name": VALUE}, TRUTHY)
+    ],
+    "other_qualities": [
+        (
+            "{sub}_otherQualities_json",
+            "$[*]",
+            {"nested_profile_type": "'{sub}'", "quality_name": VALUE},
+            TRUTHY,
+        )
+    ],
+    "rates": [
+        (
+            "{sub}_rates_json",
+            "$[*]",
+            {
+                "num_children": "e.value ->> '$.numberOfChildren'",
+                "amount": "e.value ->> '$.hourlyRate.amount'",
+                "currency": "e.value ->> '$.hourlyRate.currencyCode'",
+                "is_default": "e.value ->> '$.isDefaulted'",
+            },
+            OBJECT,
+        )
+    ],
+    "age_groups": [("{sub}_ageGroups_json", "$[*]", {"age_group": VALUE}, TRUTHY)],
+    "activity_rates": [
+        (
+            "{sub}_rates_json",
+            "$[*]",
+            {
+                "activity": "e.value ->> '$.activity'",
+                "amount": "e.value ->> '$.activityRate.amount'",
+                "currency": "e.value ->> '$.activityRate.currencyCode'",
+                "unit": "e.value ->> '$.activityRateUnit'",
+            },
+            OBJECT,
+        )
+    ],
+    "service_rates": [
+        (
+            "{sub}_serviceRates_json",
+            "$[*]",
+            {
+                "subtype": "e.value ->> '$.subtype'",
+                "duration": "e.value ->> '$.duration'",
+                "amount": "e.value ->> '$.rate.amount'",
+                "currency": "e.value ->> '$.rate.currencyCode'",
+            },
+            OBJECT,
+        )
+    ],
+    "species_cared_for": [
+        (
+            "{sub}_petSpecies_json",
+            "$.*",
+            {"species_name": "e.key"},
+            "e.value = 'true'::JSON AND e.key <> '__typename'",
+        )
+    ],
+    "subjects": [  # General subjects first, so they win over a specific one of the same name
+        (
+            "{sub}_otherGeneralSubjects_json",
+            "$[*]",
+            {"subject_name": VALUE, "is_specific": "false"},
+            TRUTHY,
+        ),
+        (
+            "{sub}_specificSubjects_json",
+            "$[*]",
+            {"subject_name": VALUE, "is_specific": "true"},
+            TRUTHY,
+        ),
+    ],
+}
+REVIEW_CHILD_SOURCES = {
+    "ratings": [
+        (
+            "ratings_json",
+            "$[*]",
+            {"rating_type": "e.value ->> '$.type'", "rating_value": "e.value ->> '$.value'"},
+            f"{OBJECT} AND json_truthy(e.value -> '$.type')",
+        )
+    ],
+    "attributes": [
+        (
+            "attributes_json",
+            "$[*]",
+            {"attribute_type": "e.value ->> '$.type'", "attribute_value": "e.value ->> '$.truthy'"},
+            f"{OBJECT} AND json_truthy(e.value -> '$.type')",
+        )
+    ],
+}
+
+
+# --- Schema ---
+def duckdb_type(column) -> str:
+    """DuckDB type of a sql_modeling column (JSONB as JSON, Float as DOUBLE like PostgreSQL's)."""
+    column_type = column.type
+    if isinstance(column_type, JSONB):
+        return "JSON"
+    if isinstance(column_type, ARRAY):
+        return "VARCHAR[]"
+    if isinstance(column_type, Boolean):
+        return "BOOLEAN"
+    if isinstance(column_type, Integer):
+        return "INTEGER"
+    if isinstance(column_type, Numeric) and not isinstance(column_type, Float):
+        return f"DECIMAL({column_type.precision}, {column_type.scale})"
+    if isinstance(column_type, Float):
+        return "DOUBLE"
+    if isinstance(column_type, TIMESTAMP):
+        return "TIMESTAMP"
+    if isinstance(column_type, Time):
+        return "TIME"
+    if isinstance(column_type, Date):
+        return "DATE"
+    if isinstance(column_type, (String, Text)):
+        return "VARCHAR"
+    raise TypeError(f"No DuckDB type for column {column} ({column_type!r})")
+
+
+def _is_serial(column) -> bool:
+    """True for the surrogate 'id' key PostgreSQL creates as SERIAL."""
+    primary_key = column.table.primary_key.columns
+    return (
+        column.primary_key
+        and len(primary_key) == 1
+        and isinstance(column.type, Integer)
+        and not column.foreign_keys
+    )
+
+
+def create_tables(con) -> None:
+    """
+    Creates the tables of sql_modeling.Base without keys; see create_keys_and_indexes(). Serial
+    ids draw from a '<table>_id_seq' sequence, as in PostgreSQL.
+    """
+    for table in sm.Base.metadata.sorted_tables:
+        definitions = []
+        for column in table.columns:
+            definition = f"{column.name} {duckdb_type(column)}"
+            if _is_serial(column):
+                con.execute(f"CREATE SEQUENCE {table.name}_id_seq")
+                definition += f" DEFAULT nextval('{table.name}_id_seq')"
+            if not column.nullable:
+                definition += " NOT NULL"
+            definitions.append(definition)
+        con.execute(f"CREATE TABLE {table.name} ({', '.join(definitions)})")
+
+
+def create_keys_and_indexes(con) -> None:
+    """
+    Adds the primary keys, unique constraints (as unique indexes) and indexes of sql_modeling.Base
+    to the filled tables; building them once is several times faster than checking every insert.
+    Foreign keys are not declared: DuckDB cannot add them to existing tables and checks them row
+    by row, and the loaders only insert rows whose parent exists. Indexes with a PostgreSQL
+    method (the GIN indexes of caregiver_search) are skipped; DuckDB cannot index lists.
+    """
+    for table in sm.Base.metadata.sorted_tables:
+        con.execute(
+            f"ALTER TABLE {table.name} "
+            f"ADD PRIMARY KEY ({', '.join(c.name for c in table.primary_key.columns)})"
+        )
+        for constraint in table.constraints:  # Column(unique=True) included
+            if not isinstance(constraint, UniqueConstraint):
+                continue
+            columns = [c.name for c in constraint.columns]
+            con.execute(
+                f"CREATE UNIQUE INDEX uq_{table.name}_{'_'.join(columns)} "
+                f"ON {table.name} ({', '.join(columns)})"
+            )
+        for index in table.indexes:
+            if index.dialect_options["postgresql"]["using"]:
+                continue
+            columns = [c.name for c in index.columns]
+            name = index.name if isinstance(index.name, str) else f"ix_{table.name}_{'_'.join(columns)}"
+            con.execute(
+                f"CREATE {'UNIQUE ' if index.unique else ''}INDEX {name} "
+                f"ON {table.name} ({', '.join(columns)})"
+            )
+
+
+# --- Sources ---
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _parquet_file_groups(dataset_dir: Path) -> List[tuple]:
+    """
+    [(files, nested column names)] of a partitioned Parquet dataset, one group per file schema
+    (appended streaming parts can type a column differently, e.g. an all-null list).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    groups = {}
+    part_files = sorted(dataset_dir.glob(f"{sm.PARQUET_PARTITION_COL}=*/*.parquet"))
+    for part_file in part_files:
+        schema = pq.read_schema(part_file)
+        nested = tuple(field.name for field in schema if pa.types.is_nested(field.type))
+        signature = tuple((field.name, str(field.type)) for field in schema)
+        groups.setdefault(signature, ([], nested))[0].append(part_file)
+    return list(groups.values())
+
+
+def stage_source(con, name: str, instrumentation: RunInstrumentation) -> Optional[Dict[str, str]]:
+    """
+    Stages preprocessed table 'name' (e.g. 'main_profiles') as temporary table 'src_<name>'
+    from its Parquet dataset (nested columns converted to JSON once, here), else from its CSV
+    (all text), numbered in file order by 'source_row'. Recorded as span 'read:<name>'.
+    Returns {column: DuckDB type}, or None if neither exists.
+    """
+    dataset_dir = sm.COUNTRY_PREPROCESSED_DIR / f"{name}_processed.parquet"
+    csv_file = sm.COUNTRY_PREPROCESSED_DIR / f"{name}_processed.csv"
+    with instrumentation.span(f"read:{name}") as span:
+        source_sql = None
+        if dataset_dir.is_dir():
+            try:
+                selects = []
+                for files, nested in _parquet_file_groups(dataset_dir):
+                    file_list = ", ".join(f"'{f.as_posix()}'" for f in files)
+                    casts = ", ".join(
+                        f"json_without_nulls(TRY_CAST({_quote(c)} AS JSON)) AS {_quote(c)}"
+                        for c in nested
+                    )
+                    selects.append(
+                        f"SELECT * {f'REPLACE ({casts})' if casts else ''} "
+                        f"FROM read_parquet([{file_list}], hive_partitioning = true, "
+                        f"hive_types_autocast = false, filename = true, file_row_number = true)"
+                    )
+                if selects:
+                    source_sql = (
+                        f"SELECT * EXCLUDE (filename, file_row_number), "
+                        f"row_number() OVER (ORDER BY filename, file_row_number) AS source_row "
+                        f"FROM ({' UNION ALL BY NAME '.join(selects)})"
+                    )
+                    span.bytes_read = path_size(dataset_dir)
+            except ImportError:
+                logger.warning(f"pyarrow not installed; falling back to CSV for {name}.")
+        if source_sql is None and csv_file.is_file():
+            source_sql = (
+                f"SELECT *, row_number() OVER () AS source_row "
+                f"FROM read_csv('{csv_file.as_posix()}', header = true, all_varchar = true)"
+            )
+            span.bytes_read = path_size(csv_file)
+        if source_sql is None:
+            return None
+        con.execute(f"CREATE OR REPLACE TEMP TABLE src_{name} AS {source_sql}")
+        span.rows_out = con.execute(f"SELECT count(*) FROM src_{name}").fetchone()[0]
+        columns = con.execute(f"DESCRIBE src_{name}").fetchall()
+    logger.info(f"Staged {span.rows_out} rows of {name}.")
+    return {column: column_type for column, column_type, *_ in columns}
+
+
+def first_rows(
+    con, name: str, key_column: str, condition: str = "true", parameters: list = None
+) -> None:
+    """
+    Replaces staged source 'src_<name>' by its first row (in source order) of every non-null
+    'key_column' that meets 'condition', like the drop_duplicates(keep="first") before the
+    Python loads.
+    """
+    con.execute(
+        f"CREATE OR REPLACE TEMP TABLE src_{name} AS SELECT * FROM src_{name} s "
+        f"WHERE s.{key_column} IS NOT NULL AND {condition} "
+        f"QUALIFY row_number() OVER (PARTITION BY s.{key_column} ORDER BY s.source_row) = 1",
+        parameters or [],
+    )
+
+
+class _SourceColumns:
+    """SQL expressions for the columns of a staged source; absent columns read as NULL."""
+
+    def __init__(self, alias: str, columns: Dict[str, str], sub_type: str = ""):
+        self.alias = alias
+        self.columns = columns
+        self.sub_type = sub_type
+
+    def column(self, name: str) -> str:
+        name = name.format(sub=self.sub_type)
+        return f"{self.alias}.{_quote(name)}" if name in self.columns else "NULL"
+
+    def json(self, name: str) -> str:
+        """The column as JSON; text that is not valid JSON reads as NULL (see parse_json_field)."""
+        column = self.column(name)
+        if column == "NULL":
+            return "CAST(NULL AS JSON)"
+        if self.columns[name.format(sub=self.sub_type)] == "JSON":  # Converted when staged
+            return column
+        return f"json_without_nulls(TRY_CAST({column} AS JSON))"
+
+
+def converted(column, expression: str) -> str:
+    """'expression' converted to the type of sql_modeling column 'column' (see CONVERTER_MACROS)."""
+    column_type = column.type
+    if isinstance(column_type, JSONB):
+        default = JSON_DEFAULTS.get(column.name)
+        return f"coalesce({expression}, '{default}'::JSON)" if default else expression
+    if isinstance(column_type, Boolean):
+        return f"safe_bool({expression})"
+    if isinstance(column_type, Integer):
+        return f"safe_int({expression})"
+    if isinstance(column_type, Numeric) and not isinstance(column_type, Float):
+        return f"safe_decimal({expression})"
+    if isinstance(column_type, Float):
+        return f"safe_float({expression})"
+    if isinstance(column_type, TIMESTAMP):
+        return f"safe_timestamp({expression})"
+    if isinstance(column_type, Time):
+        return f"safe_time({expression})"
+    return f"CAST({expression} AS VARCHAR)"
+
+
+def value_expressions(model, source_columns: Dict[str, object], src: _SourceColumns) -> Dict[str, str]:
+    """{column of 'model': converted SQL value} for the mapped columns 'model' has."""
+    table_columns = model.__table__.columns
+    expressions = {}
+    for name, spec in source_columns.items():
+        if name not in table_columns:
+            continue
+        column = table_columns[name]
+        if isinstance(spec, tuple):
+            json_column, path = spec
+            accessor = "->" if isinstance(column.type, JSONB) else "->>"
+            expression = f"({src.json(json_column)} {accessor} '{path}')"
+        elif isinstance(column.type, JSONB):
+            expression = src.json(spec)
+        else:
+            expression = src.column(spec)
+        expressions[name] = converted(column, expression)
+    return expressions
+
+
+# --- Loading ---
+def insert_child_rows(
+    con, model, parent_column: str, parent_sql: str, sources: List[tuple], src: _SourceColumns
+) -> int:
+    """
+    Fills the table of child model 'model' from the JSON lists 'sources' (see *_CHILD_SOURCES) of
+    the parent rows selected by 'parent_sql' (aliased 's', with the parent key as 'parent_key').
+    Rows repeating the key columns of the table are dropped, the first in source order kept.
+    """
+    table_columns = model.__table__.columns
+    selects = []
+    for position, (json_column, path, values, condition) in enumerate(sources):
+        json_column = json_column.format(sub=src.sub_type)
+        values = {name: expression.format(sub=src.sub_type) for name, expression in values.items()}
+        if src.column(json_column) == "NULL":
+            continue
+        if path.endswith("[*]"):
+            container, location = "ARRAY", path[: -len("[*]")]
+        else:
+            container, location = "OBJECT", path[: -len(".*")]
+        items = src.json(json_column)
+        if location != "$":
+            items = f"({items} -> '{location}')"
+        columns = ", ".join(
+            f"{converted(table_columns[name], expression)} AS {name}"
+            for name, expression in values.items()
+        )
+        selects.append(
+            f"SELECT s.parent_key AS {parent_column}, {columns}, "
+            f"s.source_row AS _row, {position} AS _source, e.id AS _item "
+            f"FROM ({parent_sql}) s, json_each({items}) e "
+            f"WHERE json_type({items}) = '{container}' AND {condition}"
+        )
+    if not selects:
+        return 0
+    columns = sm.content_columns(model)
+    keys = sm.key_columns(model)
+    not_null = " AND ".join(
+        f"{c.name} IS NOT NULL"
+        for c in model.__table__.columns
+        if not c.nullable and c.name != "id"
+    )
+    return con.execute(
+        f"INSERT INTO {model.__tablename__} ({', '.join(columns)}) "
+        f"SELECT {', '.join(columns)} FROM ({' UNION ALL '.join(selects)}) "
+        f"WHERE {not_null or 'true'} "
+        f"QUALIFY row_number() OVER (PARTITION BY {', '.join(keys)} ORDER BY _row, _source, _item) = 1"
+    ).fetchone()[0]
+
+
+def load_profiles_duckdb(con, columns: Dict[str, str]) -> Dict[str, int]:
+    """Fills 'profiles' and its child tables from src_main_profiles; returns rows per table."""
+    src = _SourceColumns("s", columns)
+    values = value_expressions(sm.Profile, PROFILE_SOURCE_COLUMNS, src)
+    first_rows(con, "main_profiles", "profile_id")
+    counts = {
+        "profiles": con.execute(
+            f"INSERT INTO profiles ({', '.join(values)}) "
+            f"SELECT {', '.join(values.values())} FROM src_main_profiles s ORDER BY s.source_row"
+        ).fetchone()[0]
+    }
+    parent_sql = "SELECT s.*, s.profile_id AS parent_key FROM src_main_profiles s"
+    for name, sources in PROFILE_CHILD_SOURCES.items():
+        ChildModel = sm.child_model(sm.Profile, name)
+        counts[ChildModel.__tablename__] = insert_child_rows(
+            con, ChildModel, "profile_id", parent_sql, sources, src
+        )
+    counts.update(load_availability_duckdb(con, parent_sql, src))
+    counts.update(load_education_degrees_duckdb(con, parent_sql, src))
+    return counts
+
+
+def load_availability_duckdb(con, parent_sql: str, src: _SourceColumns) -> Dict[str, int]:
+    """profile_availability: the blocks of every day of recurringAvailability_json.dayList."""
+    availability = src.json("recurringAvailability_json")
+    if availability == "CAST(NULL AS JSON)":
+        return {"profile_availability": 0}
+    day_list = f"({availability} -> '$.dayList')"
+    inserted = con.execute(
+        f"INSERT INTO profile_availability (profile_id, day_of_week, start_time, end_time) "
+        f"SELECT DISTINCT s.parent_key, day.key, safe_time(block.value ->> '$.start'), "
+        f"safe_time(block.value ->> '$.end') "
+        f"FROM ({parent_sql}) s, json_each({day_list}) day, json_each(day.value -> '$.blocks') block "
+        f"WHERE json_type({day_list}) = 'OBJECT' AND day.type = 'OBJECT' "
+        f"AND json_type(day.value -> '$.blocks') = 'ARRAY' AND block.type = 'OBJECT'"
+    ).fetchone()[0]
+    return {"profile_availability": inserted}
+
+
+def load_education_degrees_duckdb(con, parent_sql: str, src: _SourceColumns) -> Dict[str, int]:
+    """
+    profile_education_degrees and their detail texts. Degrees get their ids from the sequence in
+    a staging table first, so the detail texts can reference them.
+    """
+    degrees = src.json("educationDegrees_json")
+    if degrees == "CAST(NULL AS JSON)":
+        return {"profile_education_degrees": 0, "profile_education_detail_texts": 0}
+    con.execute(
+        f"""CREATE OR REPLACE TEMP TABLE degrees_staging AS
+        SELECT nextval('profile_education_degrees_id_seq') AS id, * FROM (
+            SELECT s.parent_key AS profile_id,
+                safe_bool(e.value ->> '$.currentlyAttending') AS currently_attending,
+                safe_int(e.value ->> '$.degreeYear') AS degree_year,
+                e.value ->> '$.educationLevel' AS education_level,
+                e.value ->> '$.schoolName' AS school_name,
+                CASE WHEN json_type(e.value -> '$.educationDetailsText') = 'ARRAY'
+                    THEN e.value -> '$.educationDetailsText' ELSE '[]'::JSON END AS details_texts,
+                s.source_row AS _row, e.id AS _item
+            FROM ({parent_sql}) s, json_each({degrees}) e
+            WHERE json_type({degrees}) = 'ARRAY' AND e.type = 'OBJECT'
+            QUALIFY row_number() OVER (
+                PARTITION BY profile_id, currently_attending, degree_year, education_level,
+                    school_name, CAST(details_texts AS VARCHAR)
+                ORDER BY _row, _item) = 1
+            ORDER BY _row, _item
+        )"""
+    )
+    counts = {
+        "profile_education_degrees": con.execute(
+            "INSERT INTO profile_education_degrees "
+            "(id, profile_id, currently_attending, degree_year, education_level, school_name) "
+            "SELECT id, profile_id, currently_attending, degree_year, education_level, school_name "
+            "FROM degrees_staging"
+        ).fetchone()[0],
+        "profile_education_detail_texts": con.execute(
+            "INSERT INTO profile_education_detail_texts (degree_id, detail_text) "
+            "SELECT d.id, t.value ->> '$' FROM degrees_staging d, json_each(d.details_texts) t "
+            "WHERE json_truthy(t.value) ORDER BY d.id, t.id"
+        ).fetchone()[0],
+    }
+    con.execute("DROP TABLE degrees_staging")
+    return counts
+
+
+def load_nested_profiles_duckdb(con, sub_type: str, columns: Dict[str, str]) -> Dict[str, int]:
+    """
+    Fills the nested profile table of 'sub_type' and its child tables from src_nested_<sub_type>.
+    Rows of another sub-profile type or without a loaded parent profile are left out.
+    """
+    NestedModel = sm.NESTED_MODEL_MAP[sub_type]["model"]
+    table = NestedModel.__tablename__
+    name = f"nested_{sub_type}"
+    src = _SourceColumns("s", columns, sub_type)
+    values = value_expressions(NestedModel, NESTED_SOURCE_COLUMNS, src)
+    first_rows(
+        con,
+        name,
+        "profile_id",
+        "s.sub_profile_type = ? AND s.profile_id IN (SELECT profile_id FROM profiles)"
+        if "sub_profile_type" in columns
+        else "false",
+        [sub_type] if "sub_profile_type" in columns else [],
+    )
+    counts = {
+        table: con.execute(
+            f"INSERT INTO {table} ({', '.join(values)}) "
+            f"SELECT {', '.join(values.values())} FROM src_{name} s ORDER BY s.source_row"
+        ).fetchone()[0]
+    }
+    parent_sql = f"SELECT s.*, n.id AS parent_key FROM src_{name} s JOIN {table} n USING (profile_id)"
+    for relationship in NestedModel.__mapper__.relationships.keys():
+        if relationship not in NESTED_CHILD_SOURCES:
+            continue
+        ChildModel = sm.child_model(NestedModel, relationship)
+        counts[ChildModel.__tablename__] = insert_child_rows(
+            con, ChildModel, "nested_profile_id", parent_sql, NESTED_CHILD_SOURCES[relationship], src
+        )
+    return counts
+
+
+def load_reviews_duckdb(con, columns: Dict[str, str]) -> Dict[str, int]:
+    """
+    Fills 'reviews', 'review_ratings' and 'review_attributes' from src_reviews. Reviews of
+    profiles that are not loaded keep a NULL profile_id, like load_reviews_bulk().
+    """
+    src = _SourceColumns("s", columns)
+    values = value_expressions(sm.Review, REVIEW_SOURCE_COLUMNS, src)
+    values["profile_id"] = "p.profile_id"
+    first_rows(con, "reviews", "review_id")
+    counts = {
+        "reviews": con.execute(
+            f"INSERT INTO reviews ({', '.join(values)}) "
+            f"SELECT {', '.join(values.values())} FROM src_reviews s "
+            f"LEFT JOIN profiles p ON p.profile_id = CAST({src.column('profile_id')} AS VARCHAR) "
+            f"ORDER BY s.source_row"
+        ).fetchone()[0]
+    }
+    parent_sql = "SELECT s.*, s.review_id AS parent_key FROM src_reviews s"
+    for relationship, sources in REVIEW_CHILD_SOURCES.items():
+        ChildModel = sm.child_model(sm.Review, relationship)
+        counts[ChildModel.__tablename__] = insert_child_rows(
+            con, ChildModel, "review_id", parent_sql, sources, src
+        )
+    return counts
+
+
+def _add_rows(counts: Dict[str, int], table_counts: Dict[str, int]) -> None:
+    for table, rows in table_counts.items():
+        counts[table] = counts.get(table, 0) + rows
+
+
+def build_duckdb_database(
+    database_file: Path = None, instrumentation: RunInstrumentation = None
+) -> Dict[str, int]:
+    """
+    Builds the normalized Care-com database in DuckDB file 'database_file' (default
+    COUNTRY_PREPROCESSED_DIR / DUCKDB_FILE_NAME) from the preprocessed outputs, replacing the
+    previous file once the new one is complete. Returns the rows inserted per table.
+    """
+    sm.configure_logging()
+    database_file = Path(database_file or sm.COUNTRY_PREPROCESSED_DIR / DUCKDB_FILE_NAME)
+    instrumentation = instrumentation or RunInstrumentation(f"duckdb_load_{sm.COUNTRY}")
+    building_file = database_file.with_name(database_file.name + ".building")
+    for path in (building_file, Path(f"{building_file}.wal")):
+        if path.exists():
+            path.unlink()
+    database_file.parent.mkdir(parents=True, exist_ok=True)
+    counts = {}
+    started = time.perf_counter()
+    con = duckdb.connect(str(building_file))
+    try:
+        con.execute("SET TimeZone = 'UTC'")
+        for macro in CONVERTER_MACROS:
+            con.execute(macro)
+        create_tables(con)
+        profile_columns = stage_source(con, "main_profiles", instrumentation)
+        if profile_columns is None:
+            raise FileNotFoundError(
+                f"Main profiles not found (Parquet or CSV) in {sm.COUNTRY_PREPROCESSED_DIR}."
+            )
+        with instrumentation.span("load_table:profiles") as span:
+            _add_rows(counts, load_profiles_duckdb(con, profile_columns))
+            span.rows_out = counts["profiles"]
+        con.execute("DROP TABLE src_main_profiles")
+        for sub_type in sm.list_nested_profile_types():
+            if sub_type not in sm.NESTED_MODEL_MAP:
+                logger.error(f"No model mapping for {sub_type}.")
+                continue
+            name = f"nested_{sub_type}"
+            nested_columns = stage_source(con, name, instrumentation)
+            with instrumentation.span(f"load_table:{name}") as span:
+                nested_counts = load_nested_profiles_duckdb(con, sub_type, nested_columns)
+                span.rows_out = nested_counts[sm.NESTED_MODEL_MAP[sub_type]["model"].__tablename__]
+            _add_rows(counts, nested_counts)
+            con.execute(f"DROP TABLE src_{name}")
+        review_columns = stage_source(con, "reviews", instrumentation)
+        if review_columns is None:
+            logger.warning(f"Reviews not found (Parquet or CSV) in {sm.COUNTRY_PREPROCESSED_DIR}.")
+        else:
+            with instrumentation.span("load_table:reviews") as span:
+                _add_rows(counts, load_reviews_duckdb(con, review_columns))
+                span.rows_out = counts["reviews"]
+            con.execute("DROP TABLE src_reviews")
+        with instrumentation.span("refresh_aggregates") as span:
+            for table, statement in sm.aggregate_refresh_statements():
+                if statement.startswith("INSERT"):
+                    _add_rows(counts, {table: con.execute(statement).fetchone()[0]})
+            span.rows_out = sum(counts.get(table, 0) for table in sm.AGGREGATE_SOURCES)
+        with instrumentation.span("create_keys_and_indexes"):
+            create_keys_and_indexes(con)
+        con.execute("CHECKPOINT")
+    finally:
+        con.close()
+    os.replace(building_file, database_file)
+    for table, rows in counts.items():
+        instrumentation.count(f"{table}_rows", rows)
+    logger.info(
+        f"DuckDB database built in {time.perf_counter() - started:.1f}s: {database_file} "
+        f"({path_size(database_file) / 1e6:.1f} MB). Rows: {counts}"
+    )
+    return counts
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    sm.configure_logging()
+    instrumentation = RunInstrumentation(f"duckdb_load_{sm.COUNTRY}")
+    try:
+        build_duckdb_database(sys.argv[1] if len(sys.argv) > 1 else None, instrumentation)
+    except Exception as e:
+        logger.error(f"DuckDB build failed: {e}\n{traceback.format_exc()}")
+        sys.exit(1)
+    finally:
+        instrumentation.write_report(sm.COUNTRY_PREPROCESSED_DIR)
@@ -0,0 +1,176 @@
+"""
+File: instrumentation.py
+
+Description:
+-------------
+Lightweight stage instrumentation for the Care-com ETL scripts (data_quality_check.py and
+sql_modeling.py). A RunInstrumentation collects:
+  - spans: `with run.span("flatten_profiles", rows_in=n) as span: ...; span.rows_out = m`
+    records wall time, CPU time (this process and finished worker processes), rows in/out,
+    bytes read/written and the peak RSS of the process at the end of the step. Spans with the
+    same name (e.g. one per streaming chunk) are aggregated, with 'calls' counting them.
+  - counters: `run.count("duplicate_profiles", 3)`.
+write_report() saves everything as run_report_<name>.json next to the quality reports.
+Spans and counters may be recorded from several threads; the CPU time of spans that run
+concurrently overlaps, as it is measured for the whole process.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process (or of its largest finished child) in MB, or None."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KB elsewhere
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return round(peak / unit, 1)
+
+
+def cpu_seconds() -> float:
+    """User + system CPU time of this process and of its finished child processes."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+class StageSpan:
+    """Measurements of one named step; see RunInstrumentation.span()."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.rows_in = None
+        self.rows_out = None
+        self.bytes_read = None
+        self.bytes_written = None
+        self.peak_rss_mb = None
+
+    def add_rows_in(self, rows: int) -> None:
+        self.rows_in = (self.rows_in or 0) + int(rows)
+
+    def add_rows_out(self, rows: int) -> None:
+        self.rows_out = (self.rows_out or 0) + int(rows)
+
+    def add_bytes_read(self, size: int) -> None:
+        self.bytes_read = (self.bytes_read or 0) + int(size)
+
+    def add_bytes_written(self, size: int) -> None:
+        self.bytes_written = (self.bytes_written or 0) + int(size)
+
+    def to_dict(self) -> dict:
+        record = {
+            "calls": self.calls,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "peak_rss_mb": self.peak_rss_mb,
+        }
+        if self.wall_seconds > 0 and self.rows_out:
+            record["rows_out_per_second"] = round(self.rows_out / self.wall_seconds, 1)
+        return record
+
+
+class _SpanHandle:
+    """What span() yields: row/byte counters of the current call, added to the StageSpan on exit."""
+
+    def __init__(self):
+        self.rows_in = None
+        self.rows_out = None
+        self.bytes_read = None
+        self.bytes_written = None
+
+
+class RunInstrumentation:
+    """Spans and counters of one ETL run (see module docstring)."""
+
+    def __init__(self, run_name: str, **attributes):
+        self.run_name = run_name
+        self.attributes = attributes
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self.spans = {}  # name -> StageSpan, in order of first use
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, rows_in: int = None):
+        handle = _SpanHandle()
+        handle.rows_in = rows_in
+        wall_start = time.perf_counter()
+        cpu_start = cpu_seconds()
+        try:
+            yield handle
+        finally:
+            with self._lock:
+                stage = self.spans.setdefault(name, StageSpan(name))
+                stage.calls += 1
+                stage.wall_seconds += time.perf_counter() - wall_start
+                stage.cpu_seconds += cpu_seconds() - cpu_start
+                for attr in ("rows_in", "rows_out", "bytes_read", "bytes_written"):
+                    value = getattr(handle, attr)
+                    if value is not None:
+                        getattr(stage, f"add_{attr}")(value)
+                stage.peak_rss_mb = peak_rss_mb()
+            logger.info(
+                f"Stage '{name}' took {time.perf_counter() - wall_start:.2f}s "
+                f"(rows in: {handle.rows_in}, rows out: {handle.rows_out})."
+            )
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + int(value)
+
+    def stage_seconds(self) -> dict:
+        """{span name: wall seconds}, the figures the scripts used to log as stage timings."""
+        return {name: round(stage.wall_seconds, 3) for name, stage in self.spans.items()}
+
+    def to_dict(self) -> dict:
+        return {
+            "run_name": self.run_name,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "wall_seconds": round(time.perf_counter() - self._started, 3),
+            "peak_rss_mb": peak_rss_mb(),
+            "attributes": self.attributes,
+            "spans": {name: stage.to_dict() for name, stage in list(self.spans.items())},
+            "counters": dict(self.counters),
+        }
+
+    def write_report(self, output_dir: Path) -> Path:
+        """Writes <output_dir>/run_report_<run_name>.json and returns its path."""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        report_file = output_dir / f"run_report_{self.run_name}.json"
+        with open(report_file, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+        logger.info(f"Run report saved to: {report_file}")
+        return report_file
+
+
+def path_size(path: Path) -> int:
+    """Size in bytes of a file, or of all files below a directory (0 if missing)."""
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_size
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return 0
@@ -0,0 +1,456 @@
+"""
+File: synthetic_corpus.py
+
+Description:
+-------------
+Generates a synthetic Care.com raw-data corpus with the same layout and JSON shapes the scrapers
+write, so the ETL can be benchmarked without the real (private) raw_data:
+
+    <root>/USA/<zip>/all_profiles/<caregiver_id>.json
+        {"data": {"getCaregiver": {...}}}  (AllProfiles.GET_CAREGIVER_QUERY selection)
+    <root>/USA/<zip>/reviews/<careType>/<caregiver_id>_<careType>_<page>.json   (review_layout="pages")
+        {"data": {"reviewsByReviewee": {"nextPageToken", "reviews": [...]}}}
+    <root>/USA/<zip>/reviews/caregivers/<caregiver_id>.json                      (review_layout="caregivers")
+        per-caregiver "caregiver_reviews" document (AllReviews DOCUMENT FORMAT)
+
+The corpus is fully determined by (caregivers, zips, seed): the same call always writes the same
+bytes. A fraction of caregivers is also listed under a second zip (as happens when searches of
+neighbouring zips overlap), so the deduplication steps have real work to do.
+
+Usage:
+------
+    python -m etl.synthetic_corpus 10k bench_data/raw_data
+or call generate_corpus(Path("bench_data/raw_data"), SCALES["10k"]).
+"""
+
+import json
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}  # Caregivers per corpus
+DEFAULT_ZIPS = ["10002", "30306", "07030", "60614", "94110", "98103", "02139", "78704"]
+REVIEW_PAGE_SIZE = 10  # Same as ReviewScraper.fetch_reviews_page
+CARE_TYPES = ["CHILD_CARE", "SENIOR_CARE", "HOUSEKEEPING"]
+DUPLICATE_FRACTION = 0.05  # Caregivers also written under a second zip
+
+FIRST_NAMES = ["Maria", "Ashley", "Jessica", "Emily", "Sarah", "Olivia", "Grace", "Jasmine",
+               "Daniel", "Michael", "Keisha", "Ana", "Lucia", "Hannah", "Chloe", "Aaliyah"]
+LAST_NAMES = ["Smith", "Johnson", "Garcia", "Brown", "Williams", "Lee", "Martinez", "Davis",
+              "Lopez", "Wilson", "Nguyen", "Clark", "Lewis", "Young", "Hall", "Allen"]
+CITY_STATES = [("New York", "NY"), ("Atlanta", "GA"), ("Hoboken", "NJ"), ("Chicago", "IL"),
+               ("San Francisco", "CA"), ("Seattle", "WA"), ("Cambridge", "MA"), ("Austin", "TX")]
+LANGUAGES = ["English", "Spanish", "French", "Portuguese", "Mandarin", "Tagalog", "Russian"]
+PRIMARY_SERVICES = ["CHILD_CARE", "SENIOR_CARE", "HOUSEKEEPING", "PET_CARE", "TUTORING"]
+BADGES = ["TOP_RATED", "REPEAT_FAMILIES", "QUICK_RESPONDER", "CARE_CHECK", "VERIFIED_PHONE"]
+BIO_WORDS = ["reliable", "patient", "caring", "experienced", "certified", "flexible", "punctual",
+             "energetic", "friendly", "organized", "creative", "trustworthy", "kids", "seniors",
+             "homework", "meals", "cleaning", "errands", "weekends", "evenings"]
+
+CHILD_CARE_QUALITIES = ["afterSchoolCare", "babysitter", "certifiedNursingAssistant", "certifiedTeacher",
+                        "comfortableWithPets", "cprTrained", "doesNotSmoke", "firstAidTraining",
+                        "nanny", "nightNanny", "ownTransportation", "specialNeedsCare"]
+CHILD_CARE_SERVICES = ["carpooling", "craftAssistance", "errands", "groceryShopping",
+                       "laundryAssistance", "lightHousekeeping", "mealPreparation", "travel"]
+SENIOR_CARE_QUALITIES = ["alzheimersOrDementiaExperience", "certifiedNursingAssistant", "cprTrained",
+                         "doesNotSmoke", "firstAidTraining", "hospiceExperience", "ownTransportation"]
+SENIOR_CARE_SERVICES = ["bathing", "companionship", "dementia", "errands", "feeding",
+                        "lightHousekeeping", "mealPreparation", "mobilityAssistance", "transportation"]
+HOUSEKEEPING_QUALITIES = ["comfortableWithPets", "doesNotSmoke", "ownTransportation",
+                          "providesEquipment", "providesSupplies"]
+HOUSEKEEPING_SERVICES = ["bathroomCleaning", "cabinetCleaning", "dishes", "laundry",
+                         "moveOutCleaning", "ovenCleaning", "windowWashing"]
+PET_SERVICES = ["doesDailyFeeding", "doesHouseSitting", "doesPetSitting", "doesPetWalking",
+                "groomsAnimals", "trainsDogs", "watersPlants"]
+RATING_TYPES = ["OVERALL", "DEPENDABILITY", "COMMUNICATION", "PUNCTUALITY", "PROFESSIONALISM"]
+REVIEW_ATTRIBUTES = ["WOULD_RECOMMEND", "WOULD_HIRE_AGAIN", "KIDS_LOVED", "ON_TIME"]
+
+
+def _id(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _timestamp(rng: random.Random, start_year: int = 2012) -> str:
+    start = datetime(start_year, 1, 1)
+    seconds = rng.randrange(int((datetime(2025, 4, 1) - start).total_seconds()))
+    return (start + timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(BIO_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _money(amount: float) -> dict:
+    return {"amount": f"{amount:.2f}", "currencyCode": "USD", "__typename": "Money"}
+
+
+def _pay_range(rng: random.Random) -> dict:
+    low = rng.randrange(15, 30)
+    return {
+        "hourlyRateFrom": _money(low),
+        "hourlyRateTo": _money(low + rng.randrange(2, 15)),
+        "__typename": "PayRange",
+    }
+
+
+def _flags(rng: random.Random, names: list, typename: str) -> dict:
+    flags = {name: rng.random() < 0.4 for name in names}
+    flags["__typename"] = typename
+    return flags
+
+
+def _bio(rng: random.Random) -> dict:
+    return {
+        "experienceSummary": _text(rng, rng.randrange(20, 80)),
+        "title": _text(rng, 4),
+        "__typename": "Bio",
+    }
+
+
+def _child_care_profile(rng: random.Random) -> dict:
+    min_age = rng.choice([0, 12, 24, 36])
+    return {
+        "approvalStatus": rng.choice(["APPROVED", "APPROVED", "APPROVED", "PENDING"]),
+        "ageGroups": rng.sample(["NEWBORN", "EARLY_SCHOOL", "TODDLER", "ELEMENTARY_SCHOOL", "TEEN"], rng.randrange(1, 4)),
+        "availabilityFrequency": rng.choice(["FULL_TIME", "PART_TIME", "OCCASIONAL"]),
+        "bio": _bio(rng),
+        "childStaffRatio": None,
+        "id": _id(rng),
+        "maxAgeMonths": min_age + rng.choice([60, 120, 180]),
+        "minAgeMonths": min_age,
+        "numberOfChildren": rng.randrange(1, 5),
+        "otherQualities": rng.sample(["Homework help", "Swimming", "Cooking", "Music"], rng.randrange(0, 3)),
+        "payRange": _pay_range(rng),
+        "qualities": _flags(rng, CHILD_CARE_QUALITIES, "ChildCareCaregiverQualities"),
+        "recurringRate": _pay_range(rng),
+        "rates": [
+            {
+                "hourlyRate": _money(rng.randrange(15, 35)),
+                "numberOfChildren": children,
+                "isDefaulted": children == 1,
+                "__typename": "ChildCareRate",
+            }
+            for children in range(1, rng.randrange(2, 4))
+        ],
+        "supportedServices": _flags(rng, CHILD_CARE_SERVICES, "ChildCareServices"),
+        "yearsOfExperience": rng.randrange(0, 25),
+        "__typename": "ChildCareCaregiverProfile",
+    }
+
+
+def _common_profile(rng: random.Random) -> dict:
+    return {
+        "id": _id(rng),
+        "repeatClientsCount": rng.choice([0, 0, 1, 2, 3, 5, 8]),
+        "merchandizedJobInterests": _flags(
+            rng, ["companionCare", "dateNight", "lightCleaning", "mealPrepLaundry", "petHelp", "shopping"],
+            "MerchandizedJobInterests",
+        ),
+        "__typename": "CommonCaregiverProfile",
+    }
+
+
+def _senior_care_profile(rng: random.Random) -> dict:
+    return {
+        "approvalStatus": rng.choice(["APPROVED", "APPROVED", "PENDING"]),
+        "availabilityFrequency": rng.choice(["FULL_TIME", "PART_TIME", "OCCASIONAL"]),
+        "bio": _bio(rng),
+        "id": _id(rng),
+        "otherQualities": [],
+        "payRange": _pay_range(rng),
+        "qualities": _flags(rng, SENIOR_CARE_QUALITIES, "SeniorCareCaregiverQualities"),
+        "recurringRate": _pay_range(rng),
+        "supportedServices": _flags(rng, SENIOR_CARE_SERVICES, "SeniorCareServices"),
+        "yearsOfExperience": rng.randrange(0, 30),
+        "__typename": "SeniorCareCaregiverProfile",
+    }
+
+
+def _housekeeping_profile(rng: random.Random) -> dict:
+    return {
+        "approvalStatus": rng.choice(["APPROVED", "APPROVED", "PENDING"]),
+        "availabilityFrequency": rng.choice(["FULL_TIME", "PART_TIME", "OCCASIONAL"]),
+        "bio": _bio(rng),
+        "distanceWillingToTravel": {"unit": "MILES", "value": rng.choice([5, 10, 20]), "__typename": "Distance"},
+        "id": _id(rng),
+        "otherQualities": [],
+        "payRange": _pay_range(rng),
+        "qualities": _flags(rng, HOUSEKEEPING_QUALITIES, "HouseKeepingCaregiverQualities"),
+        "recurringRate": _pay_range(rng),
+        "schedule": [
+            {
+                "endTime": "17:00",
+                "id": _id(rng),
+                "ruleName": rng.choice(["WEEKDAYS", "WEEKENDS"]),
+                "rules": ["FREQ=WEEKLY"],
+                "startTime": "09:00",
+                "__typename": "Schedule",
+            }
+        ] if rng.random() < 0.3 else [],
+        "supportedServices": _flags(rng, HOUSEKEEPING_SERVICES, "HouseKeepingServices"),
+        "yearsOfExperience": rng.randrange(0, 20),
+        "__typename": "HouseKeepingCaregiverProfile",
+    }
+
+
+def _pet_care_profile(rng: random.Random) -> dict:
+    return {
+        "approvalStatus": rng.choice(["APPROVED", "PENDING"]),
+        "bio": _bio(rng),
+        "id": _id(rng),
+        "numberOfPetsComfortableWith": rng.randrange(1, 4),
+        "otherQualities": [],
+        "payRange": _pay_range(rng),
+        "qualities": _flags(rng, ["doesNotSmoke", "ownsTransportation", "isBondedAndInsured"], "PetCareQualities"),
+        "supportedServices": _flags(rng, PET_SERVICES, "PetCareServices"),
+        "yearsOfExperience": rng.randrange(0, 15),
+        "__typename": "PetCareCaregiverProfile",
+    }
+
+
+def _tutoring_profile(rng: random.Random) -> dict:
+    return {
+        "approvalStatus": "APPROVED",
+        "availabilityFrequency": rng.choice(["PART_TIME", "OCCASIONAL"]),
+        "bio": _bio(rng),
+        "id": _id(rng),
+        "otherGeneralSubjects": [],
+        "otherQualities": [],
+        "payRange": _pay_range(rng),
+        "supportedServices": _flags(
+            rng, ["tutorsInCenter", "tutorsInStudentsHome", "tutorsInTeachersHome", "tutorsOnline"], "TutoringServices"
+        ),
+        "specificSubjects": rng.sample(["MATH", "ENGLISH", "SCIENCE", "HISTORY", "SPANISH"], 2),
+        "otherSpecificSubject": None,
+        "yearsOfExperience": rng.randrange(0, 15),
+        "__typename": "TutoringCaregiverProfile",
+    }
+
+
+SUB_PROFILE_BUILDERS = {  # sub_profile_type -> (probability, builder)
+    "childCareCaregiverProfile": (0.7, _child_care_profile),
+    "petCareCaregiverProfile": (0.15, _pet_care_profile),
+    "seniorCareCaregiverProfile": (0.35, _senior_care_profile),
+    "tutoringCaregiverProfile": (0.1, _tutoring_profile),
+    "houseKeepingCaregiverProfile": (0.3, _housekeeping_profile),
+}
+
+
+def make_profile(rng: random.Random, caregiver_id: str, zip_code: str) -> dict:
+    """One getCaregiver API response, shaped like the files AllProfiles.py writes."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    city, state = CITY_STATES[int(zip_code) % len(CITY_STATES)] if zip_code.isdigit() else CITY_STATES[0]
+    profiles = {"serviceIds": [], "commonCaregiverProfile": _common_profile(rng), "__typename": "CaregiverProfiles"}
+    for sub_type, (probability, builder) in SUB_PROFILE_BUILDERS.items():
+        profiles[sub_type] = builder(rng) if rng.random() < probability else None
+    profiles["serviceIds"] = [
+        service for service, sub_type in (
+            ("CHILD_CARE", "childCareCaregiverProfile"),
+            ("PET_CARE", "petCareCaregiverProfile"),
+            ("SENIOR_CARE", "seniorCareCaregiverProfile"),
+            ("TUTORING", "tutoringCaregiverProfile"),
+            ("HOUSEKEEPING", "houseKeepingCaregiverProfile"),
+        ) if profiles[sub_type] is not None
+    ]
+    caregiver = {
+        "continuousBackgroundCheck": {
+            "seeker": {"hasLimitReached": False, "subscriptionStatus": "BASIC", "__typename": "Seeker"},
+            "hasActiveHit": False,
+            "__typename": "ContinuousBackgroundCheck",
+        },
+        "backgroundChecks": [
+            {"backgroundCheckName": "CareCheck", "whenCompleted": _timestamp(rng, 2018), "__typename": "BackgroundCheck"}
+        ] if rng.random() < 0.6 else [],
+        "badges": rng.sample(BADGES, rng.randrange(0, 3)),
+        "distanceFromSeekerInMiles": round(rng.uniform(0.1, 25), 1),
+        "educationDegrees": [
+            {
+                "currentlyAttending": False,
+                "degreeYear": rng.randrange(1990, 2024),
+                "educationLevel": rng.choice(["HIGH_SCHOOL", "SOME_COLLEGE", "BACHELORS", "MASTERS"]),
+                "schoolName": f"{city} College",
+                "educationDetailsText": None,
+                "__typename": "EducationDegree",
+            }
+        ] if rng.random() < 0.5 else [],
+        "hasCareCheck": rng.random() < 0.6,
+        "hasGrantedCriminalBGCAccess": rng.random() < 0.5,
+        "hasGrantedMvrBGCAccess": rng.random() < 0.3,
+        "hasGrantedPremierBGCAccess": rng.random() < 0.2,
+        "hiredByCounts": {"locality": {"hiredCount": rng.randrange(0, 12), "__typename": "Locality"}, "__typename": "HiredByCounts"},
+        "hiredTimes": rng.randrange(0, 40),
+        "isFavorite": False,
+        "isMVREligible": rng.random() < 0.4,
+        "isVaccinated": rng.choice([True, False, None]),
+        "member": {
+            "id": caregiver_id,
+            "lastName": last[0] + ".",
+            "firstName": first,
+            "gender": rng.choice(["F", "F", "F", "M"]),
+            "hiResImageURL": f"https://photos.care.com/{caregiver_id}/hires.jpg",
+            "displayName": f"{first} {last[0]}.",
+            "email": None,
+            "primaryService": rng.choice(PRIMARY_SERVICES),
+            "imageURL": f"https://photos.care.com/{caregiver_id}/thumb.jpg",
+            "address": {"city": city, "state": state, "zip": zip_code, "__typename": "Address"},
+            "languages": rng.sample(LANGUAGES, rng.randrange(1, 3)),
+            "legacyId": str(rng.randrange(10_000_000, 99_999_999)),
+            "isPremium": rng.random() < 0.3,
+            "__typename": "Member",
+        },
+        "placeInfo": None,
+        "profiles": profiles,
+        "providerStatus": rng.choice(["ACTIVE", "ACTIVE", "ACTIVE", "INACTIVE"]),
+        "responseRate": rng.randrange(0, 101),
+        "responseTime": rng.randrange(0, 48 * 60),
+        "signUpDate": _timestamp(rng),
+        "yearsOfExperience": rng.randrange(0, 30),
+        "nonPrimaryImages": [],
+        "recurringAvailability": {"dayList": {}, "__typename": "RecurringAvailability"},
+        "__typename": "Caregiver",
+    }
+    return {"data": {"getCaregiver": caregiver}}
+
+
+def make_review(rng: random.Random, caregiver_id: str, care_type: str) -> dict:
+    """One review object as returned by reviewsByReviewee (REVIEWS_SELECTION)."""
+    created = _timestamp(rng, 2016)
+    text = _text(rng, rng.randrange(10, 60))
+    return {
+        "attributes": [
+            {"truthy": rng.random() < 0.8, "type": attribute, "__typename": "ReviewAttribute"}
+            for attribute in rng.sample(REVIEW_ATTRIBUTES, rng.randrange(0, 3))
+        ],
+        "careType": care_type,
+        "createTime": created,
+        "deleteTime": None,
+        "description": {"displayText": text, "originalText": text, "__typename": "ReviewText"},
+        "id": _id(rng),
+        "languageCode": rng.choice(["en", "en", "en", "es"]),
+        "originalSource": rng.choice(["CARE_COM", "CARE_COM", "IMPORTED"]),
+        "ratings": [
+            {"type": rating, "value": rng.choice([3, 4, 5, 5, 5]), "__typename": "ReviewRating"}
+            for rating in RATING_TYPES[: rng.randrange(1, len(RATING_TYPES) + 1)]
+        ],
+        "retort": None if rng.random() < 0.9 else {
+            "displayText": _text(rng, 8), "originalText": _text(rng, 8), "__typename": "ReviewText"
+        },
+        "reviewee": {"id": caregiver_id, "providerType": "INDIVIDUAL", "type": "PROVIDER", "__typename": "ReviewInfoEntity"},
+        "reviewer": {
+            "imageURL": None,
+            "publicMemberInfo": {"firstName": rng.choice(FIRST_NAMES), "lastInitial": rng.choice(LAST_NAMES)[0], "__typename": "PublicMemberInfo"},
+            "source": "CARE_COM",
+            "type": "SEEKER",
+            "__typename": "ReviewInfoEntity",
+        },
+        "status": rng.choice(["PUBLISHED", "PUBLISHED", "PUBLISHED", "PENDING"]),
+        "updateSource": "WEB",
+        "updateTime": created,
+        "verifiedByCare": rng.random() < 0.5,
+        "__typename": "Review",
+    }
+
+
+def make_reviews(rng: random.Random, caregiver_id: str) -> dict:
+    """{careType: [reviews, newest first]}; most caregivers have few or no reviews."""
+    reviews_by_type = {}
+    for care_type in CARE_TYPES:
+        count = min(int(rng.expovariate(0.25)), 60) if rng.random() < 0.5 else 0
+        if count:
+            reviews = [make_review(rng, caregiver_id, care_type) for _ in range(count)]
+            reviews.sort(key=lambda review: review["createTime"], reverse=True)
+            reviews_by_type[care_type] = reviews
+    return reviews_by_type
+
+
+def _write_json(path: Path, data: dict) -> int:
+    payload = json.dumps(data, ensure_ascii=False, indent=2)  # Scraper files are pretty-printed
+    path.write_text(payload, encoding="utf-8")
+    return len(payload)
+
+
+def write_review_files(reviews_dir: Path, caregiver_id: str, zip_code: str, reviews_by_type: dict, review_layout: str) -> int:
+    """Writes one caregiver's reviews in 'review_layout' ("pages" or "caregivers"); returns the file count."""
+    if review_layout == "caregivers":
+        type_dir = reviews_dir / "caregivers"
+        type_dir.mkdir(parents=True, exist_ok=True)
+        document = {
+            "format": "caregiver_reviews",
+            "version": 1,
+            "caregiver_id": caregiver_id,
+            "postal_code": zip_code,
+            "updated_at": "2025-04-14T00:00:00Z",
+            "reviews": [review for reviews in reviews_by_type.values() for review in reviews],
+            "provenance": {},
+            "fetch_status": {},
+        }
+        _write_json(type_dir / f"{caregiver_id}.json", document)
+        return 1
+    files = 0
+    for care_type, reviews in reviews_by_type.items():
+        type_dir = reviews_dir / care_type
+        type_dir.mkdir(parents=True, exist_ok=True)
+        pages = [reviews[i : i + REVIEW_PAGE_SIZE] for i in range(0, len(reviews), REVIEW_PAGE_SIZE)]
+        for page_number, page in enumerate(pages, start=1):
+            payload = {
+                "__typename": "ReviewsByRevieweePayload",
+                "nextPageToken": f"token-{page_number}" if page_number < len(pages) else None,
+                "reviews": page,
+            }
+            _write_json(
+                type_dir / f"{caregiver_id}_{care_type}_{page_number}.json",
+                {"data": {"reviewsByReviewee": payload}},
+            )
+            files += 1
+    return files
+
+
+def generate_corpus(
+    root: Path,
+    caregivers: int,
+    zips: list = None,
+    seed: int = 0,
+    review_layout: str = "pages",
+    country: str = "USA",
+) -> dict:
+    """
+    Writes 'caregivers' synthetic caregivers (profiles and reviews) under <root>/<country>/<zip>/.
+    Returns a summary {"caregivers", "profile_files", "review_files", "reviews", "duplicates"}.
+    """
+    if review_layout not in ("pages", "caregivers"):
+        raise ValueError(f"Unknown review_layout '{review_layout}' (expected 'pages' or 'caregivers').")
+    zips = zips or DEFAULT_ZIPS
+    rng = random.Random(seed)
+    summary = {"caregivers": caregivers, "profile_files": 0, "review_files": 0, "reviews": 0, "duplicates": 0}
+    country_dir = Path(root) / country
+    for zip_code in zips:
+        (country_dir / zip_code / "all_profiles").mkdir(parents=True, exist_ok=True)
+        (country_dir / zip_code / "reviews").mkdir(parents=True, exist_ok=True)
+    for index in range(caregivers):
+        caregiver_id = _id(rng)
+        zip_code = zips[index % len(zips)]
+        profile = make_profile(rng, caregiver_id, zip_code)
+        reviews_by_type = make_reviews(rng, caregiver_id)
+        listed_under = [zip_code]
+        if len(zips) > 1 and rng.random() < DUPLICATE_FRACTION:
+            listed_under.append(rng.choice([z for z in zips if z != zip_code]))
+            summary["duplicates"] += 1
+        for listed_zip in listed_under:
+            zip_dir = country_dir / listed_zip
+            _write_json(zip_dir / "all_profiles" / f"{caregiver_id}.json", profile)
+            summary["profile_files"] += 1
+            summary["review_files"] += write_review_files(
+                zip_dir / "reviews", caregiver_id, listed_zip, reviews_by_type, review_layout
+            )
+        summary["reviews"] += sum(len(reviews) for reviews in reviews_by_type.values())
+    return summary
+
+
+if __name__ == "__main__":
+    scale = sys.argv[1] if len(sys.argv) > 1 else "1k"
+    target = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("bench_data") / scale / "raw_data"
+    count = SCALES[scale] if scale in SCALES else int(scale)
+    print(f"Generating {count} synthetic caregivers under {target} ...")
+    print(json.dumps(generate_corpus(target, count)))
@@ -13,6 +13,10 @@ For example:
     data/raw_data/France/75001/Profiles_of_childCare__babysitter
     data/raw_data/France/75001/Profiles_of_seniorCare
 
+Profiles scraped with a lake root are read from the sharded raw-data lake instead:
+    data/raw_data/_lake/care_fr/<postal_code>/<profile_folder>/run=<run_id>/part-*.jsonl.gz
+(newest record per profile id; see common/raw_lake.py).
+
 For each profile file (excluding files whose names start with "metada_"), the script:
   - Adds a "postal_code" column (extracted from the parent folder name).
   - Enriches the data with the corresponding city name using pgeocode.
@@ -31,6 +35,7 @@ This preprocessed output is designed to be used in subsequent ETL steps and SQL-
 """
 
 import os
+import sys
 import json
 from pathlib import Path
 import pandas as pd
@@ -40,6 +45,9 @@ import pgeocode
 import pandera as pa
 from pandera import Column, DataFrameSchema, Check
 
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("DataQualityCheck")
@@ -104,12 +112,48 @@ def load_profiles_from_directory(directory: str, postal_code: str, city: str) ->
         logger.warning(f"No profiles found in {directory} for postal code {postal_code}.")
     return df
 
+def load_profiles_from_lake(lake_root: str, city_cache: dict) -> list:
+    """
+    Streams profile records from the sharded raw-data lake (site "care_fr") and returns one
+    DataFrame per (postal_code, source_folder), enriched like load_profiles_from_directory().
+    
+    Args:
+        lake_root (str): Lake root directory, e.g., "data/raw_data/_lake".
+        city_cache (dict): Postal code to city cache shared with the directory loader.
+    
+    Returns:
+        list: DataFrames of profile data (empty if there is no lake).
+    """
+    if not os.path.isdir(os.path.join(lake_root, "care_fr")):
+        return []
+    from common.raw_lake import iter_records
+
+    grouped = {}
+    for record in iter_records(lake_root, "care_fr"):
+        if not record["entity"].startswith("Profiles_of_"):
+            continue
+        profile = record["data"] or {}
+        if not isinstance(profile, dict) or not profile:
+            continue
+        postal_code = record["partition"]
+        profile["postal_code"] = postal_code
+        profile["city"] = get_city_from_postal_code(postal_code, city_cache)
+        profile["source_folder"] = record["entity"]
+        grouped.setdefault((postal_code, record["entity"]), []).append(profile)
+
+    dfs = []
+    for (postal_code, source_folder), profiles in grouped.items():
+        logger.info(f"Loaded {len(profiles)} profiles from lake {source_folder} for postal code {postal_code}.")
+        dfs.append(pd.DataFrame(profiles))
+    return dfs
+
 def aggregate_profiles_with_city_info(base_dir: str) -> pd.DataFrame:
     """
     Aggregates profiles from multiple postal code folders under the base directory.
     Each sub-folder in base_dir is expected to be a postal code folder.
     For each postal code, profiles are loaded from sub-folders starting with "Profiles_of_",
     and the DataFrame is enriched with "postal_code", "city", and "source_folder" columns.
+    Profiles stored in the sibling "_lake" directory are added the same way.
     
     Args:
         base_dir (str): Base directory for raw data, e.g., "data/raw_data/France".
@@ -129,6 +173,7 @@ def aggregate_profiles_with_city_info(base_dir: str) -> pd.DataFrame:
                     df = load_profiles_from_directory(str(subfolder), postal_code, city)
                     if not df.empty:
                         profile_dfs.append(df)
+    profile_dfs.extend(load_profiles_from_lake(str(base_path.parent / "_lake"), city_cache))
     if profile_dfs:
         combined_df = pd.concat(profile_dfs, ignore_index=True)
         logger.info(f"Aggregated {len(combined_df)} profiles from all postal codes.")
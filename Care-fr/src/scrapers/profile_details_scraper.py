@@ -18,6 +18,10 @@ Additionally, a metadata file for each profile is created:
     data/raw_data/France/<postal_code>/Profiles_of_<care_type>/metada_<profileID>.json
 The metadata includes the scrape timestamp, HTTP status code, URL, and any error messages.
 
+When a lake root is given (e.g. "../data/raw_data/_lake"), profiles and their metadata are instead
+appended to compressed shards of the raw-data lake (see common/raw_lake.py):
+    <lake_root>/care_fr/<postal_code>/Profiles_of_<care_type>/run=<run_id>/part-*.jsonl.gz
+
 Usage:
 ------
 Run the module as a script:
@@ -43,8 +47,12 @@ from typing import Tuple  # Import Tuple for type annotations
 sys.path.append('..')
 from utils.logger import get_logger
 
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+from common.raw_lake import LakeWriter
+
 class ProfileDetailsScraper:
-    def __init__(self, input_file: str, auth_token: str = None):
+    def __init__(self, input_file: str, auth_token: str = None, lake_root: str = None):
         """
         Initialize the ProfileDetailsScraper with the input JSON file containing profile IDs.
         
@@ -52,6 +60,8 @@ class ProfileDetailsScraper:
             input_file (str): Path to the input JSON file (e.g., 
                               "data/raw_data/France/75001/search_of_childCare/profileIDs.json").
             auth_token (str): Optional authentication token or cookie string.
+            lake_root (str): Optional raw-data lake root; when set, profiles are appended to
+                             compressed shards instead of one JSON file (+ metadata file) each.
         """
         self.input_file = input_file
         self.auth_token = auth_token
@@ -82,6 +92,13 @@ class ProfileDetailsScraper:
         # data/raw_data/France/<postal_code>/Profiles_of_<care_type>
         self.output_folder = os.path.join(".." ,"data", "raw_data", "France", self.postal_code, f"Profiles_of_{self.care_type}")
         os.makedirs(self.output_folder, exist_ok=True)
+
+        # Optional sharded lake writer, partitioned like the folders: <postal_code>/Profiles_of_<care_type>
+        self.lake = (
+            LakeWriter(lake_root, "care_fr", self.postal_code, f"Profiles_of_{self.care_type}")
+            if lake_root
+            else None
+        )
         
         # Initialize a requests session; update headers if auth token is provided.
         self.session = requests.Session()
@@ -146,6 +163,10 @@ class ProfileDetailsScraper:
             profile_data (dict): The detailed profile JSON data.
             metadata (dict): Metadata associated with this profile scrape.
         """
+        if self.lake:
+            self.lake.write(profile_id, profile_data, meta=metadata)
+            self.logger.info(f"Appended profile data and metadata for ID {profile_id} to {self.lake.run_dir}")
+            return
         profile_file = os.path.join(self.output_folder, f"{profile_id}.json")
         metadata_file = os.path.join(self.output_folder, f"metada_{profile_id}.json")
         with open(profile_file, "w", encoding="utf-8") as pf:
@@ -168,7 +189,10 @@ class ProfileDetailsScraper:
                 time.sleep(round(random.uniform(0.8, 1.2), 4))
             except Exception as e:
                 break
-                
+
+        if self.lake:
+            self.lake.close()
+            self.logger.info(f"Lake: {self.lake.summary()}")
         self.logger.info("Completed scraping all profile details.")
 
 if __name__ == "__main__":
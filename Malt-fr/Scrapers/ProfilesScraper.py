@@ -21,6 +21,13 @@ OUTPUT DIRECTORY STRUCTURE (Example - Created by this script):
           ...
         scrape_html_profiles_<query_slug>_<location_slug>.log # Log file moved here
 
+LAKE MODE (optional, `lake_root`):
+  Search pages are also read from, and HTML pages are appended to, the raw-data lake
+  (see common/raw_lake.py), partitioned by "<query_slug>__<location_slug>":
+    <lake_root>/malt_fr/<query_slug>__<location_slug>/search_pages/...   (written by MaltScraper)
+    <lake_root>/malt_fr/<query_slug>__<location_slug>/profile_html/run=<run_id>/part-*.jsonl.gz
+  Each profile_html record is {"html": <page text>} under the profile id.
+
 Author: @AyoubFrihaoui
 Version: 1.1.0
 """
@@ -40,6 +47,10 @@ import threading
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed, Future
 
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from common.raw_lake import LakeWriter, LakeIndex, iter_records
+
 # --- Configuration Import ---
 try:
     from config import (
@@ -90,6 +101,7 @@ class MaltProfileHtmlScraper:
         num_workers: int = 2,  # Defaulted to 2 as per your observation
         cookie: str = MALT_COOKIE,
         # xsrf_token: str = MALT_XSRF_TOKEN, # XSRF token usually not needed for GET requests
+        lake_root: Optional[str] = None,  # Optional raw-data lake for search pages and HTML output
     ):
         self.base_input_dir = base_input_dir
         if not os.path.isdir(self.base_input_dir):
@@ -116,6 +128,8 @@ class MaltProfileHtmlScraper:
         self.num_workers = num_workers
         self.run_id = str(uuid.uuid4())
         self.logger = None  # Logger will be configured per context
+        self.lake_root = lake_root
+        self.lake = None  # LakeWriter for the current query/location context (lake mode only)
 
         # Session for making requests (can help with cookies, connection pooling)
         self.session = requests.Session()
@@ -259,6 +273,22 @@ class MaltProfileHtmlScraper:
         )
         return unique_ids
 
+    def discover_profile_ids_from_lake(self, partition: str) -> Set[str]:
+        """Streams the lake's search_pages records of one partition to find unique profile IDs."""
+        unique_ids = set()
+        if not self.lake_root:
+            return unique_ids
+        pages_read = 0
+        for record in iter_records(self.lake_root, "malt_fr", partition, "search_pages"):
+            pages_read += 1
+            for profile in (record["data"] or {}).get("profiles", []):
+                if profile_id := profile.get("id"):
+                    unique_ids.add(profile_id)
+        self.logger.info(
+            f"ID Discovery (lake): {len(unique_ids)} unique IDs from {pages_read} pages in partition {partition}."
+        )
+        return unique_ids
+
     def _fetch_single_profile_html_worker(
         self, profile_id: str, html_output_dir: str
     ) -> tuple[str, bool, Optional[str]]:
@@ -302,8 +332,11 @@ class MaltProfileHtmlScraper:
             response.raise_for_status()  # Will raise an HTTPError for bad responses (4XX or 5XX)
 
             # Save as binary content to avoid encoding issues during write
-            with open(html_file_path, "w", encoding="utf-8") as f:
-                f.write(response.text)
+            if self.lake:
+                self.lake.write(profile_id, {"html": response.text}, meta={"url": profile_url})
+            else:
+                with open(html_file_path, "w", encoding="utf-8") as f:
+                    f.write(response.text)
 
 
             if self.logger:
@@ -340,6 +373,7 @@ class MaltProfileHtmlScraper:
         current_location_input_path = os.path.join(
             self.base_input_dir, query_slug, location_slug
         )
+        lake_partition = f"{query_slug}__{location_slug}"
         if not os.path.isdir(current_location_input_path):
             print(f"Skipping: Input JSON path not found {current_location_input_path}")
             return
@@ -384,6 +418,7 @@ class MaltProfileHtmlScraper:
         )
 
         all_known_profile_ids = self.discover_profile_ids(current_location_input_path)
+        all_known_profile_ids |= self.discover_profile_ids_from_lake(lake_partition)
         if not all_known_profile_ids:
             self.logger.info("No profile IDs found from JSONs. Nothing to fetch.")
             summary_data.update(
@@ -403,6 +438,10 @@ class MaltProfileHtmlScraper:
         already_fetched_ids = self._load_already_fetched_ids(
             html_output_dir_for_context
         )
+        if self.lake_root:
+            already_fetched_ids |= set(
+                LakeIndex(self.lake_root, "malt_fr", lake_partition, "profile_html").ids()
+            )
         ids_to_attempt_this_run = list(
             all_known_profile_ids - already_fetched_ids
         )  # Use list for ordered processing if desired
@@ -451,6 +490,11 @@ class MaltProfileHtmlScraper:
 
         total_to_process_this_run = len(ids_to_attempt_this_run)
 
+        if self.lake_root:
+            self.lake = LakeWriter(
+                self.lake_root, "malt_fr", lake_partition, "profile_html", run_id=self.run_id
+            )
+
         with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
             futures_map = {
                 executor.submit(
@@ -503,6 +547,11 @@ class MaltProfileHtmlScraper:
                         f"Est. Total Failures: {estimated_total_failures})"
                     )
 
+        if self.lake:
+            self.lake.close()
+            self.logger.info(f"Lake: {self.lake.summary()}")
+            self.lake = None
+
         run_end_time = time.time()
         duration_this_run = round(run_end_time - run_start_time, 2)
         final_status = (
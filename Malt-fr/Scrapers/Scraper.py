@@ -35,6 +35,12 @@ DIRECTORY STRUCTURE:
             ...
             metadata_range_<price_min>_<price_max_or_inf>.json # Detailed metadata for this specific price range scrape
 
+LAKE MODE (optional, `lake_root`):
+  - Instead of one pretty-printed page_<n>.json per page, pages are appended to compressed
+    JSON Lines shards of the raw-data lake (see common/raw_lake.py):
+      <lake_root>/malt_fr/<query_term_slug>__<location_cleaned>/search_pages/run=<run_id>/part-*.jsonl.gz
+    Each record id is "range_<min>_<max>/page_<n>"; directory metadata files are still written.
+
 LOGGING:
   - A single log file named `scrape_malt_<query_term_slug>.log` is created within the
     innermost `<location_cleaned>` directory for each run.
@@ -113,6 +119,11 @@ from concurrent.futures import (
     CancelledError,  # Exception raised when a future is cancelled
 )
 
+# --- Local Imports ---
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from common.raw_lake import LakeWriter  # Sharded, compressed raw-data lake (optional output)
+
 # --- Configuration Import ---
 # Attempt to import sensitive credentials (Cookie, XSRF Token) from a separate 'config.py' file.
 # This file should be kept private and not committed to version control (add to .gitignore).
@@ -173,6 +184,7 @@ class MaltScraper:
         num_workers: int = 4,
         cookie: str = MALT_COOKIE,
         xsrf_token: str = MALT_XSRF_TOKEN,
+        lake_root: Optional[str] = None,
     ):
         """
         Initializes the MaltScraper instance with scraping parameters and sets up state.
@@ -187,6 +199,7 @@ class MaltScraper:
         :param num_workers: The number of concurrent threads to use for fetching pages within each price range. Higher numbers increase speed but also server load and risk of rate limiting.
         :param cookie: The complete Malt.fr 'Cookie' header string obtained from a logged-in browser session. Essential for authentication.
         :param xsrf_token: The Malt.fr 'X-XSRF-TOKEN' header value, also from a browser session. Required for POST requests and often checked even for GETs.
+        :param lake_root: Optional raw-data lake root (e.g. "raw_data/_lake"). When set, pages are appended to compressed shards instead of page_<n>.json files.
         """
         # Store configuration parameters
         self.query_term = query_term
@@ -229,6 +242,20 @@ class MaltScraper:
         # Create the directory structure if it doesn't exist. 'exist_ok=True' prevents errors if directories already exist.
         os.makedirs(self.base_dir, exist_ok=True)
 
+        # Optional lake writer, shared by all worker threads (LakeWriter is thread-safe).
+        self.lake_root = lake_root
+        self.lake = (
+            LakeWriter(
+                lake_root,
+                "malt_fr",
+                f"{self.query_term_slug}__{self.location_cleaned_slug}",
+                "search_pages",
+                run_id=self.run_id,
+            )
+            if lake_root
+            else None
+        )
+
         # --- Initialize Infrastructure ---
         self._setup_logging()  # Configure the logger for file and console output.
         self._initialize_directories_and_metadata()  # Create base directories and write initial metadata stubs.
@@ -574,12 +601,20 @@ class MaltScraper:
             data = response.json()
 
             # --- Save Data ---
-            # Write the successfully parsed JSON data to its designated file.
-            with open(page_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    data, f, ensure_ascii=False, indent=2
-                )  # Save pretty-printed JSON
-            self.logger.debug(f"  - Saved page {page_num} data to {page_file}")
+            # Append to the lake if configured, otherwise write the page to its designated file.
+            if self.lake:
+                self.lake.write(
+                    f"{os.path.basename(range_dir)}/page_{page_num}",
+                    data,
+                    meta={"price_min": price_min, "price_max": price_max, "page": page_num},
+                )
+                self.logger.debug(f"  - Appended page {page_num} data to {self.lake.run_dir}")
+            else:
+                with open(page_file, "w", encoding="utf-8") as f:
+                    json.dump(
+                        data, f, ensure_ascii=False, indent=2
+                    )  # Save pretty-printed JSON
+                self.logger.debug(f"  - Saved page {page_num} data to {page_file}")
 
             # --- Polite Sleep ---
             # Introduce a short, random delay after successfully processing a page.
@@ -971,6 +1006,7 @@ class MaltScraper:
                 "query_term_slug",
                 "location_cleaned_slug",
                 "remote_allowed_str",
+                "lake",
             ]  # Exclude internal/sensitive/redundant
         }
         run_params_to_log["query_term"] = (
@@ -1055,6 +1091,11 @@ class MaltScraper:
             )
             # Depending on how the script is used, you might want to re-raise the exception:
             # raise
+        finally:
+            # Flush buffered pages and mark the lake run as finished.
+            if self.lake:
+                self.lake.close()
+                self.logger.info(f"Lake: {self.lake.summary()}")
 
 
 # ------------------------------------------------------------------------------
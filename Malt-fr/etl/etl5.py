@@ -16,6 +16,11 @@ PURPOSE:
 
 VERSION: 3.1.0 (Added custom_profile.csv generation for statistical analysis)
 
+RAW-DATA LAKE:
+  - When `Config.LAKE_ROOT` exists, search pages and profile HTML written by the scrapers in lake
+    mode are streamed from its compressed shards (see common/raw_lake.py) in addition to the
+    page_*.json / <id>.html files. HTML is fetched by profile id through the shard indexes.
+
 PREREQUISITES:
   - `pip install pandas lxml tqdm`
 
@@ -29,6 +34,7 @@ Version: 3.1.0
 """
 
 import os
+import sys
 import re
 import json
 import logging
@@ -39,12 +45,17 @@ from tqdm import tqdm
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timezone
 
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
 
 # --- Configuration ---
 class Config:
     RAW_DATA_ROOT = r"D:\Data Extraction FSP\Malt-fr\raw_data"
     HTML_ROOT = r"H:\Data Extraction FSP\Malt-fr\raw_data\malt_fr\developpeur\en_télétravail\profiles\developpeur\en_télétravail\profiles"
     PROCESSED_DATA_ROOT = r"D:\Data Extraction FSP\Malt-fr\processed_data"
+    LAKE_ROOT = r"D:\Data Extraction FSP\Malt-fr\raw_data\_lake"
+    LAKE_SITE = "malt_fr"
     TABLE_NAMES = [
         "profiles",
         "profile_skills",
@@ -107,6 +118,48 @@ def extract_profiles_from_json(json_files: List[str]) -> Dict[str, Dict]:
     return profiles
 
 
+def extract_profiles_from_lake(profiles: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Adds profiles found in the lake's search_pages records (first occurrence wins, like files)."""
+    if not os.path.isdir(os.path.join(Config.LAKE_ROOT, Config.LAKE_SITE)):
+        return profiles
+    from common.raw_lake import iter_records
+
+    before = len(profiles)
+    pages = 0
+    for record in tqdm(
+        iter_records(Config.LAKE_ROOT, Config.LAKE_SITE, entity="search_pages"),
+        desc="Streaming lake pages",
+    ):
+        pages += 1
+        for profile_data in (record["data"] or {}).get("profiles", []):
+            profile_id = profile_data.get("id")
+            if profile_id and profile_id not in profiles:
+                profiles[profile_id] = profile_data
+    logger.info(
+        f"Streamed {pages} lake pages: {len(profiles) - before} additional unique profiles."
+    )
+    return profiles
+
+
+def load_lake_html_indexes() -> List[Any]:
+    """One LakeIndex per partition holding profile_html records (empty if there is no lake)."""
+    site_dir = os.path.join(Config.LAKE_ROOT, Config.LAKE_SITE)
+    if not os.path.isdir(site_dir):
+        return []
+    from common.raw_lake import LakeIndex
+
+    indexes = []
+    for partition in sorted(os.listdir(site_dir)):
+        if os.path.isdir(os.path.join(site_dir, partition, "profile_html")):
+            index = LakeIndex(Config.LAKE_ROOT, Config.LAKE_SITE, partition, "profile_html")
+            if len(index):
+                indexes.append(index)
+    logger.info(
+        f"Loaded {len(indexes)} lake HTML index(es) covering {sum(len(i) for i in indexes)} profiles."
+    )
+    return indexes
+
+
 # --- HTML Parsing Functions ---
 def parse_ld_json(html_content: str) -> Optional[Dict]:
     """Parses HTML to find and load the second 'application/ld+json' script."""
@@ -176,6 +229,14 @@ class MaltDataProcessor:
         self.output_path = output_run_path
         self.processed_count = 0
         self.error_count = 0
+        self.lake_html_indexes = load_lake_html_indexes()
+
+    def read_lake_html(self, profile_id: str) -> Optional[str]:
+        for index in self.lake_html_indexes:
+            if profile_id in index:
+                record = index.get(profile_id)
+                return (record.get("data") or {}).get("html")
+        return None
 
     def process_profile(self, profile_id: str, json_data: Dict):
         """Processes a single profile, combining data from JSON and its corresponding HTML file."""
@@ -183,10 +244,16 @@ class MaltDataProcessor:
         html_content = None
         ld_json_data = {}
         tree = None
-        if os.path.exists(html_file_path):
+        lake_html = None
+        if not os.path.exists(html_file_path) and self.lake_html_indexes:
+            lake_html = self.read_lake_html(profile_id)
+        if os.path.exists(html_file_path) or lake_html is not None:
             try:
-                with open(html_file_path, "r", encoding="utf-8") as f:
-                    html_content = f.read()
+                if lake_html is not None:
+                    html_content = lake_html
+                else:
+                    with open(html_file_path, "r", encoding="utf-8") as f:
+                        html_content = f.read()
                 tree = html.fromstring(html_content)
                 parsed_ld = parse_ld_json(html_content)
                 if parsed_ld:
@@ -697,10 +764,11 @@ def process_malt_data(
     start_time = time.time()
     logger.info("====== Starting Malt Data ETL Process (XPath Parser v3.1.0) ======")
     json_files = find_and_load_json_files(Config.RAW_DATA_ROOT)
-    if not json_files:
-        logger.error("No raw JSON files found. Aborting.")
-        return
     all_profiles = extract_profiles_from_json(json_files)
+    all_profiles = extract_profiles_from_lake(all_profiles)
+    if not all_profiles:
+        logger.error("No raw JSON files or lake pages found. Aborting.")
+        return
     total_unique_profiles = len(all_profiles)
     profiles_to_process = {}
     run_type_info = {"type": "full_run", "details": "Processing all found profiles."}
@@ -12,6 +12,10 @@ import requests
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from common.raw_lake import LakeWriter  # Sharded, compressed raw-data lake (optional output)
+
 # Append parent directory if needed to import config or utils
 # sys.path.append('..') 
 
@@ -57,6 +61,11 @@ class YoopiesScraper:
               ...
               # No individual metadata per page, aggregate metadata is in metadata_<sub_type>.json
 
+    Lake mode (optional, lake_root="data/raw/_lake"):
+      Pages are appended to compressed shards of the raw-data lake (see common/raw_lake.py) instead of
+      page_<n>.json files; directory metadata files are still written:
+        data/raw/_lake/yoopies_fr/<postal_code>/<care_type>__<sub_type>/run=<run_id>/part-*.jsonl.gz
+
     Logging:
       - A log file (e.g., scrape_babysitting.log) is placed in the <sub_type> directory.
     """
@@ -280,7 +289,8 @@ class YoopiesScraper:
         search_page_size: int = 100,    # Yoopies seems to return up to 100
         search_radius_km: int = 50,     # Default distance filter
         locale: str = "fr_FR",          # Locale for the query
-        cookie: str = YOOPIES_COOKIE
+        cookie: str = YOOPIES_COOKIE,
+        lake_root: Optional[str] = None
     ):
         """
         Initializes the YoopiesScraper.
@@ -297,6 +307,8 @@ class YoopiesScraper:
         :param search_radius_km: Search radius in kilometers.
         :param locale: Locale string for the GraphQL query.
         :param cookie: The authentication cookie string for yoopies.fr.
+        :param lake_root: Optional raw-data lake root (e.g. "data/raw/_lake"). When set, pages are
+                          appended to compressed shards instead of page_<n>.json files.
         """
         if not cookie or "YOUR_YOOPIES_COOKIE_STRING" in cookie:
             raise ValueError("Yoopies Cookie is not set or is using the placeholder value.")
@@ -323,6 +335,19 @@ class YoopiesScraper:
         )
         os.makedirs(self.base_dir, exist_ok=True)
 
+        # Optional lake writer: partition = postal code, entity = "<care_type>__<sub_type>"
+        self.lake = (
+            LakeWriter(
+                lake_root,
+                "yoopies_fr",
+                self.postal_code,
+                f"{self.care_type}__{self.sub_type}",
+                run_id=self.run_id,
+            )
+            if lake_root
+            else None
+        )
+
         # --- Session Setup ---
         self.session = requests.Session()
         self.session.headers.update(self.BASE_HEADERS)
@@ -617,9 +642,13 @@ class YoopiesScraper:
                 # --- Save Page Data ---
                 page_file_path = os.path.join(self.base_dir, f"page_{page_count}.json")
                 try:
-                    with open(page_file_path, "w", encoding="utf-8") as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
-                    self.logger.info(f"Saved page {page_count} ({current_page_profiles} profiles) to {page_file_path}")
+                    if self.lake:
+                        self.lake.write(f"page_{page_count}", data, meta={"page": page_count})
+                        self.logger.info(f"Appended page {page_count} ({current_page_profiles} profiles) to {self.lake.run_dir}")
+                    else:
+                        with open(page_file_path, "w", encoding="utf-8") as f:
+                            json.dump(data, f, ensure_ascii=False, indent=2)
+                        self.logger.info(f"Saved page {page_count} ({current_page_profiles} profiles) to {page_file_path}")
                 except Exception as e:
                     error_msg = f"Failed to save page {page_count} data to {page_file_path}: {e}"
                     self.logger.error(error_msg)
@@ -756,6 +785,10 @@ class YoopiesScraper:
                 error_stage="main_run_method"
             )
             self.logger.info(f"--- Yoopies Scrape Run Failed Critically ---")
+        finally:
+            if self.lake:
+                self.lake.close()
+                self.logger.info(f"Lake: {self.lake.summary()}")
             
         
     def scrape():
@@ -12,9 +12,14 @@ import pandas as pd
 import pandera as pa
 from pandera import Column, DataFrameSchema, Check
 
+# Repository root, for the raw-data lake module shared by all sites (common/raw_lake.py)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
 # --- Configuration ---
 BASE_RAW_DIR = Path("data/raw/yoopies")
 BASE_PREPROCESSED_DIR = Path("preprocessed_data/yoopies")
+LAKE_DIR = BASE_RAW_DIR.parent / "_lake"  # Sharded raw-data lake written in lake mode (common/raw_lake.py)
+LAKE_SITE = "yoopies_fr"
 
 # --- Logging Setup ---
 LOG_FILE = (
@@ -120,6 +125,29 @@ def load_all_page_files(base_directory: Path) -> List[Dict[str, Any]]:
     logger.info(
         f"Scanned {total_files_found} potential page files. Loaded {loaded_count} files."
     )
+    json_items.extend(load_lake_page_items(LAKE_DIR))
+    return json_items
+
+
+def load_lake_page_items(lake_dir: Path) -> List[Dict[str, Any]]:
+    """Streams page records from the raw-data lake as items shaped like load_all_page_files()."""
+    json_items = []
+    if not (lake_dir / LAKE_SITE).is_dir():
+        return json_items
+    from common.raw_lake import iter_records
+
+    for record in iter_records(str(lake_dir), LAKE_SITE):
+        care_type, _, sub_type = record["entity"].partition("__")
+        json_items.append(
+            {
+                "filename": f"_lake/{LAKE_SITE}/{record['partition']}/{record['entity']}/run={record['run_id']}#{record['id']}",
+                "postal_code": record["partition"],
+                "care_type": care_type,
+                "sub_type": sub_type or "unknown",
+                "page_data": record["data"],
+            }
+        )
+    logger.info(f"Loaded {len(json_items)} page records from lake {lake_dir}.")
     return json_items
 
 
@@ -0,0 +1,480 @@
+"""
+RawLake: compressed, sharded raw-data lake (JSON Lines + gzip) with an ID index.
+
+PURPOSE:
+  The raw layer used to be one small pretty-printed JSON/HTML file per response. That is slow to
+  write, slow to os.walk()/rglob() and large on disk. The lake instead APPENDS records to a few
+  large compressed shards per (site, partition, entity, run):
+    1) Each record is one compact JSON line: {"id", "ts", "meta", "data"}.
+    2) Lines are buffered and written as gzip "blocks" (one gzip member per block). Concatenated
+       members are a valid .gz file, so a shard streams with a plain gzip.open().
+    3) A shard is rolled (part-00000, part-00001, ...) once it reaches 'max_shard_bytes'.
+    4) index.jsonl maps every record id to (shard, block byte offset, line in block), which gives
+       random access by ID: seek to the block, decompress one block, read one line.
+
+DIRECTORY STRUCTURE:
+  <root>/                                  e.g. raw_data/_lake
+    <site>/                                e.g. care_com, care_fr, malt_fr, yoopies_fr
+      <partition>/                         zip / postal code (or location slug for Malt)
+        <entity>/                          e.g. profiles, search_pages, profile_html
+          run=<run_id>/
+            _run.json                      run status, start/end time, record and shard counts
+            part-00000.jsonl.gz
+            part-00001.jsonl.gz
+            index.jsonl                    {"id", "shard", "offset", "line"} per record
+
+READING:
+  - iter_records(...) streams records shard by shard (optionally only the newest version of each id).
+  - read_record(...) fetches one record by id through the indexes, newest run first.
+
+NOTE:
+  This module is self-contained (stdlib only) and shared by every site. The scrapers and ETLs
+  that use it put the repository root on sys.path (relative to their own file, so it works from
+  any working directory) and import it as 'common.raw_lake'.
+"""
+
+import os
+import json
+import gzip
+import time
+import uuid
+import threading
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+
+LAKE_DIRNAME = "_lake"
+RUN_FILENAME = "_run.json"
+INDEX_FILENAME = "index.jsonl"
+SHARD_PATTERN = "part-{:05d}.jsonl.gz"
+
+DEFAULT_MAX_SHARD_BYTES = 128 * 1024 * 1024  # Roll to a new shard past this (compressed) size
+DEFAULT_BLOCK_RECORDS = 200  # Records per gzip block (random-access granularity)
+DEFAULT_BLOCK_BYTES = 4 * 1024 * 1024  # ...or this many uncompressed bytes, whichever comes first
+DEFAULT_FLUSH_SECONDS = 60.0  # Slow scrapers: never keep a block buffered longer than this
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def build_run_dir(root: str, site: str, partition: str, entity: str, run_id: str) -> str:
+    """
+    e.g. raw_data/_lake/care_fr/75001/profiles/run=<run_id>
+    """
+    return os.path.join(root, site, str(partition), entity, f"run={run_id}")
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ------------------------------------------
+# WRITER
+# ------------------------------------------
+
+class LakeWriter:
+    """
+    Appends records for one (site, partition, entity, run) to rolled gzip JSONL shards.
+    Thread-safe: scrapers using a ThreadPoolExecutor can share one writer.
+
+    Usage:
+        with LakeWriter("raw_data/_lake", "care_fr", "75001", "profiles", run_id) as lake:
+            lake.write(profile_id, profile_data, meta={"status_code": 200})
+    """
+
+    def __init__(
+        self,
+        root: str,
+        site: str,
+        partition: str,
+        entity: str,
+        run_id: Optional[str] = None,
+        max_shard_bytes: int = DEFAULT_MAX_SHARD_BYTES,
+        block_records: int = DEFAULT_BLOCK_RECORDS,
+        block_bytes: int = DEFAULT_BLOCK_BYTES,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+    ):
+        """
+        :param root: Lake root directory (e.g. 'raw_data/_lake').
+        :param site: Site name (e.g. 'care_com').
+        :param partition: Zip / postal code or other top-level partition.
+        :param entity: Kind of record (e.g. 'profiles', 'search_pages').
+        :param run_id: Scraper run id. A new UUID if omitted.
+        :param max_shard_bytes: Compressed size after which a new shard is started.
+        :param block_records: Records per gzip block.
+        :param block_bytes: Uncompressed bytes per gzip block.
+        :param flush_seconds: Maximum age of a buffered block before it is written.
+        """
+        self.root = root
+        self.site = site
+        self.partition = str(partition)
+        self.entity = entity
+        self.run_id = run_id or str(uuid.uuid4())
+        self.max_shard_bytes = max_shard_bytes
+        self.block_records = block_records
+        self.block_bytes = block_bytes
+        self.flush_seconds = flush_seconds
+
+        self.run_dir = build_run_dir(root, site, self.partition, entity, self.run_id)
+        os.makedirs(self.run_dir, exist_ok=True)
+        self.index_path = os.path.join(self.run_dir, INDEX_FILENAME)
+        self.run_path = os.path.join(self.run_dir, RUN_FILENAME)
+
+        self._lock = threading.Lock()
+        self._block_ids: List[str] = []
+        self._block_lines: List[bytes] = []
+        self._block_size = 0
+        self._block_started = time.monotonic()
+        self._closed = False
+
+        # Resume an interrupted run with the same run_id: continue after the last shard
+        existing = sorted(name for name in os.listdir(self.run_dir) if name.startswith("part-"))
+        self.shard_number = len(existing) - 1 if existing else 0
+        self.shard_path = os.path.join(self.run_dir, SHARD_PATTERN.format(self.shard_number))
+
+        self.records_written = 0
+        self.bytes_raw = 0
+        self.started_at = utc_now()
+        self._write_run_file("open")
+
+    # --- Public API ---
+    def write(self, record_id: str, data: Any, meta: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Buffer one record. 'data' is any JSON-serializable value (a parsed response, or {"html": ...}).
+        """
+        line = json.dumps(
+            {"id": str(record_id), "ts": utc_now(), "meta": meta, "data": data},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8") + b"\n"
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"LakeWriter for {self.run_dir} is closed")
+            if not self._block_lines:
+                self._block_started = time.monotonic()
+            self._block_ids.append(str(record_id))
+            self._block_lines.append(line)
+            self._block_size += len(line)
+            self.records_written += 1
+            self.bytes_raw += len(line)
+            if (
+                len(self._block_lines) >= self.block_records
+                or self._block_size >= self.block_bytes
+                or time.monotonic() - self._block_started >= self.flush_seconds
+            ):
+                self._flush_block()
+
+    def flush(self) -> None:
+        """
+        Write the buffered block (if any) to the current shard and index.
+        """
+        with self._lock:
+            self._flush_block()
+
+    def close(self, status: str = "complete") -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_block()
+            self._closed = True
+            self._write_run_file(status)
+
+    def __enter__(self) -> "LakeWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close("complete" if exc_type is None else "error")
+
+    def summary(self) -> str:
+        return (
+            f"{self.records_written} record(s), {self.bytes_raw} raw byte(s) -> "
+            f"{self.shard_number + 1} shard(s) in {self.run_dir}"
+        )
+
+    # --- Internals (caller holds the lock) ---
+    def _flush_block(self) -> None:
+        if not self._block_lines:
+            return
+        if os.path.exists(self.shard_path) and os.path.getsize(self.shard_path) >= self.max_shard_bytes:
+            self.shard_number += 1
+            self.shard_path = os.path.join(self.run_dir, SHARD_PATTERN.format(self.shard_number))
+
+        compressed = gzip.compress(b"".join(self._block_lines), compresslevel=6)
+        with open(self.shard_path, "ab") as f:
+            offset = f.tell()
+            f.write(compressed)
+
+        shard_name = os.path.basename(self.shard_path)
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            for line_number, record_id in enumerate(self._block_ids):
+                f.write(
+                    json.dumps(
+                        {"id": record_id, "shard": shard_name, "offset": offset, "line": line_number},
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                )
+
+        self._block_ids = []
+        self._block_lines = []
+        self._block_size = 0
+
+    def _write_run_file(self, status: str) -> None:
+        _write_json_atomic(
+            self.run_path,
+            {
+                "site": self.site,
+                "partition": self.partition,
+                "entity": self.entity,
+                "run_id": self.run_id,
+                "status": status,
+                "started_at": self.started_at,
+                "updated_at": utc_now(),
+                "records_written": self.records_written,
+                "bytes_raw": self.bytes_raw,
+                "shards": self.shard_number + 1,
+            },
+        )
+
+
+class LakeWriterPool:
+    """
+    Lazily opens one LakeWriter per (partition, entity) for a scraper run, so a scraper that
+    spans several zips or entities only needs one object. Close it (or use it as a context manager)
+    at the end of the run.
+    """
+
+    def __init__(self, root: str, site: str, run_id: Optional[str] = None, **writer_kwargs):
+        self.root = root
+        self.site = site
+        self.run_id = run_id or str(uuid.uuid4())
+        self.writer_kwargs = writer_kwargs
+        self._writers: Dict[Tuple[str, str], LakeWriter] = {}
+        self._lock = threading.Lock()
+
+    def writer(self, partition: str, entity: str) -> LakeWriter:
+        key = (str(partition), entity)
+        with self._lock:
+            if key not in self._writers:
+                self._writers[key] = LakeWriter(
+                    self.root, self.site, key[0], entity, run_id=self.run_id, **self.writer_kwargs
+                )
+            return self._writers[key]
+
+    def write(self, partition: str, entity: str, record_id: str, data: Any, meta: Optional[Dict[str, Any]] = None) -> None:
+        self.writer(partition, entity).write(record_id, data, meta=meta)
+
+    def close(self, status: str = "complete") -> None:
+        with self._lock:
+            writers = list(self._writers.values())
+        for writer in writers:
+            writer.close(status)
+
+    def __enter__(self) -> "LakeWriterPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close("complete" if exc_type is None else "error")
+
+    def summary(self) -> str:
+        with self._lock:
+            writers = list(self._writers.values())
+        records = sum(w.records_written for w in writers)
+        return f"{records} record(s) in {len(writers)} lake partition(s) for run {self.run_id}"
+
+
+# ------------------------------------------
+# READER
+# ------------------------------------------
+
+def _list_dirs(path: str) -> List[str]:
+    if not os.path.isdir(path):
+        return []
+    return sorted(name for name in os.listdir(path) if os.path.isdir(os.path.join(path, name)))
+
+
+def _load_run_file(run_dir: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(run_dir, RUN_FILENAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def iter_runs(
+    root: str,
+    site: str,
+    partition: Optional[str] = None,
+    entity: Optional[str] = None,
+    newest_first: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield run descriptors {"run_dir", "partition", "entity", "run_id", "status", "started_at", ...}
+    for one site, optionally restricted to one partition and/or entity.
+    Within a (partition, entity), runs are ordered by their start time.
+    """
+    site_dir = os.path.join(root, site)
+    partitions = [str(partition)] if partition is not None else _list_dirs(site_dir)
+    for part in partitions:
+        part_dir = os.path.join(site_dir, part)
+        entities = [entity] if entity is not None else _list_dirs(part_dir)
+        for ent in entities:
+            ent_dir = os.path.join(part_dir, ent)
+            runs = []
+            for name in _list_dirs(ent_dir):
+                if not name.startswith("run="):
+                    continue
+                run_dir = os.path.join(ent_dir, name)
+                info = _load_run_file(run_dir)
+                runs.append(
+                    {
+                        **info,
+                        "run_dir": run_dir,
+                        "partition": part,
+                        "entity": ent,
+                        "run_id": name[len("run="):],
+                    }
+                )
+            runs.sort(key=lambda r: r.get("started_at") or "", reverse=newest_first)
+            for run in runs:
+                yield run
+
+
+def iter_run_records(run: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of one run, shard by shard, in write order.
+    """
+    run_dir = run["run_dir"]
+    shards = sorted(name for name in os.listdir(run_dir) if name.startswith("part-") and name.endswith(".jsonl.gz"))
+    for shard in shards:
+        with gzip.open(os.path.join(run_dir, shard), "rb") as f:
+            for raw_line in f:
+                if not raw_line.strip():
+                    continue
+                record = json.loads(raw_line)
+                record["partition"] = run["partition"]
+                record["entity"] = run["entity"]
+                record["run_id"] = run["run_id"]
+                yield record
+
+
+def iter_records(
+    root: str,
+    site: str,
+    partition: Optional[str] = None,
+    entity: Optional[str] = None,
+    latest_only: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records {"id", "ts", "meta", "data", "partition", "entity", "run_id"} of a site.
+
+    :param latest_only: Yield only the newest version of each (partition, entity, id), reading runs
+                        newest first and, within a run, the last copy of an id (as load_index()).
+                        Only the ids are kept in memory, never the records.
+    """
+    if not latest_only:
+        for run in iter_runs(root, site, partition, entity):
+            yield from iter_run_records(run)
+        return
+
+    seen = set()
+    for run in iter_runs(root, site, partition, entity, newest_first=True):
+        remaining = _index_id_counts(run["run_dir"])  # Copies of each id still ahead in this run
+        for record in iter_run_records(run):
+            record_id = record["id"]
+            remaining[record_id] = remaining.get(record_id, 1) - 1
+            if remaining[record_id] > 0:
+                continue
+            key = (run["partition"], run["entity"], record_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield record
+
+
+def _index_id_counts(run_dir: str) -> Dict[str, int]:
+    """
+    Number of index entries of every id of a run, i.e. how many copies of it the run wrote.
+    """
+    counts: Dict[str, int] = {}
+    index_path = os.path.join(run_dir, INDEX_FILENAME)
+    if not os.path.isfile(index_path):
+        return counts
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record_id = json.loads(line)["id"]
+                counts[record_id] = counts.get(record_id, 0) + 1
+    return counts
+
+
+def load_index(run_dir: str) -> Dict[str, Tuple[str, int, int]]:
+    """
+    Load a run's index: {id: (shard, offset, line)}. The last entry wins for repeated ids.
+    """
+    index: Dict[str, Tuple[str, int, int]] = {}
+    index_path = os.path.join(run_dir, INDEX_FILENAME)
+    if not os.path.isfile(index_path):
+        return index
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                index[entry["id"]] = (entry["shard"], entry["offset"], entry["line"])
+    return index
+
+
+def read_indexed_record(run_dir: str, shard: str, offset: int, line_number: int) -> Dict[str, Any]:
+    """
+    Random access: decompress the single block at 'offset' and return its 'line_number'-th record.
+    """
+    with open(os.path.join(run_dir, shard), "rb") as raw:
+        raw.seek(offset)
+        with gzip.GzipFile(fileobj=raw, mode="rb") as f:
+            for current, raw_line in enumerate(f):
+                if current == line_number:
+                    return json.loads(raw_line)
+    raise KeyError(f"Line {line_number} not found at {shard}@{offset} in {run_dir}")
+
+
+class LakeIndex:
+    """
+    Random access by id over all runs of one (site, partition, entity); newest run wins.
+    Index files are loaded once, records are read on demand.
+    """
+
+    def __init__(self, root: str, site: str, partition: str, entity: str):
+        self._entries: Dict[str, Tuple[str, str, int, int]] = {}
+        for run in iter_runs(root, site, partition, entity):  # oldest first, newer overwrite
+            for record_id, (shard, offset, line) in load_index(run["run_dir"]).items():
+                self._entries[record_id] = (run["run_dir"], shard, offset, line)
+
+    def __contains__(self, record_id: str) -> bool:
+        return str(record_id) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ids(self) -> List[str]:
+        return list(self._entries)
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(str(record_id))
+        if entry is None:
+            return None
+        run_dir, shard, offset, line = entry
+        return read_indexed_record(run_dir, shard, offset, line)
+
+
+def read_record(root: str, site: str, partition: str, entity: str, record_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the newest version of one record by id (None if absent). For many lookups use LakeIndex.
+    """
+    for run in iter_runs(root, site, partition, entity, newest_first=True):
+        entry = load_index(run["run_dir"]).get(str(record_id))
+        if entry is not None:
+            return read_indexed_record(run["run_dir"], *entry)
+    return None